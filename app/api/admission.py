@@ -0,0 +1,284 @@
+import os
+import math
+import time
+import asyncio
+import itertools
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import JSONResponse
+from app.services import metrics
+
+ADMISSION_ENABLED = os.getenv("ADMISSION_ENABLED", "true").lower() == "true"
+ADMISSION_MAX_CONCURRENCY = int(os.getenv("ADMISSION_MAX_CONCURRENCY", "32"))
+DEADLINE_HEADER = "x-request-deadline-ms"
+
+QUEUE_DEPTH = metrics.register(
+    metrics.Gauge("admission_queue_depth", "Requests waiting for admission")
+)
+IN_FLIGHT = metrics.register(
+    metrics.Gauge("admission_in_flight", "Admitted requests currently running")
+)
+SHED = metrics.register(
+    metrics.Counter("admission_shed_total", "Requests rejected by admission control")
+)
+WAIT_DURATION = metrics.register(
+    metrics.Histogram("admission_wait_seconds", "Time spent waiting for admission")
+)
+
+
+class Lane:
+    def __init__(
+        self,
+        name: str,
+        priority: int,
+        max_concurrency: int,
+        max_queue: int,
+        timeout_seconds: float,
+    ):
+        self.name = name
+        self.priority = priority
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.timeout_seconds = timeout_seconds
+        self.active = 0
+        self.service_seconds = 1.0
+
+    @classmethod
+    def from_env(cls, name: str, priority: int, defaults: tuple) -> "Lane":
+        prefix = f"ADMISSION_{name.upper()}"
+        return cls(
+            name,
+            priority,
+            int(os.getenv(f"{prefix}_CONCURRENCY", defaults[0])),
+            int(os.getenv(f"{prefix}_QUEUE_SIZE", defaults[1])),
+            float(os.getenv(f"{prefix}_TIMEOUT_SECONDS", defaults[2])),
+        )
+
+    def record_service_time(self, seconds: float):
+        self.service_seconds += 0.2 * (seconds - self.service_seconds)
+
+
+class Rejected(Exception):
+    def __init__(self, status_code: int, reason: str, retry_after: float):
+        super().__init__(reason)
+        self.status_code = status_code
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class Waiter:
+    def __init__(self, lane: Lane, endpoint: str, sequence: int):
+        self.lane = lane
+        self.endpoint = endpoint
+        self.sequence = sequence
+        self.future = asyncio.get_running_loop().create_future()
+
+    def sort_key(self) -> tuple:
+        return (self.lane.priority, self.sequence)
+
+
+class AdmissionController:
+    def __init__(self, lanes: dict, routes: dict, max_concurrency: int):
+        self.lanes = lanes
+        self.routes = routes
+        self.max_concurrency = max_concurrency
+        self.active = 0
+        self.waiters = []
+        self.queue_depth = {}
+        self.shed = {}
+        self._sequence = itertools.count()
+
+    def lane_for(self, path: str) -> Lane | None:
+        name = self.routes.get(path)
+        return self.lanes[name] if name else None
+
+    def _has_capacity(self, lane: Lane) -> bool:
+        return self.active < self.max_concurrency and lane.active < lane.max_concurrency
+
+    def _estimated_wait(self, lane: Lane) -> float:
+        ahead = sum(
+            1 for waiter in self.waiters if waiter.lane.priority <= lane.priority
+        )
+        slots = max(1, min(lane.max_concurrency, self.max_concurrency))
+        return (ahead // slots + 1) * lane.service_seconds
+
+    def _reject(self, endpoint: str, status_code: int, reason: str, retry_after):
+        key = (endpoint, reason)
+        self.shed[key] = self.shed.get(key, 0) + 1
+        SHED.inc(endpoint=endpoint, reason=reason)
+        raise Rejected(status_code, reason, retry_after)
+
+    def _set_depth(self, endpoint: str, delta: int):
+        depth = self.queue_depth.get(endpoint, 0) + delta
+        self.queue_depth[endpoint] = depth
+        QUEUE_DEPTH.set(depth, endpoint=endpoint)
+
+    def _start(self, lane: Lane):
+        self.active += 1
+        lane.active += 1
+        IN_FLIGHT.set(lane.active, lane=lane.name)
+
+    async def acquire(self, endpoint: str, lane: Lane, budget_seconds: float):
+        waiting_ahead = any(
+            waiter.lane.priority <= lane.priority and self._has_capacity(waiter.lane)
+            for waiter in self.waiters
+        )
+        if self._has_capacity(lane) and not waiting_ahead:
+            self._start(lane)
+            WAIT_DURATION.observe(0.0, lane=lane.name)
+            return
+
+        estimated_wait = self._estimated_wait(lane)
+        if self.queue_depth.get(endpoint, 0) >= lane.max_queue:
+            self._reject(endpoint, 429, "queue_full", estimated_wait)
+        if estimated_wait > budget_seconds:
+            self._reject(endpoint, 503, "deadline", estimated_wait)
+
+        waiter = Waiter(lane, endpoint, next(self._sequence))
+        self.waiters.append(waiter)
+        self.waiters.sort(key=Waiter.sort_key)
+        self._set_depth(endpoint, 1)
+        start = time.perf_counter()
+
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), budget_seconds)
+        except asyncio.TimeoutError:
+            if not waiter.future.done():
+                self.waiters.remove(waiter)
+                self._set_depth(endpoint, -1)
+                waiter.future.cancel()
+                self._reject(endpoint, 503, "deadline", self._estimated_wait(lane))
+        except asyncio.CancelledError:
+            if waiter.future.done():
+                self.release(lane, 0.0)
+            else:
+                self.waiters.remove(waiter)
+                self._set_depth(endpoint, -1)
+                waiter.future.cancel()
+            raise
+
+        WAIT_DURATION.observe(time.perf_counter() - start, lane=lane.name)
+
+    def release(self, lane: Lane, service_seconds: float):
+        self.active -= 1
+        lane.active -= 1
+        IN_FLIGHT.set(lane.active, lane=lane.name)
+        if service_seconds:
+            lane.record_service_time(service_seconds)
+        self._dispatch()
+
+    def _dispatch(self):
+        for waiter in list(self.waiters):
+            if self.active >= self.max_concurrency:
+                return
+            if not self._has_capacity(waiter.lane):
+                continue
+            self.waiters.remove(waiter)
+            self._set_depth(waiter.endpoint, -1)
+            self._start(waiter.lane)
+            waiter.future.set_result(None)
+
+    def status(self) -> dict:
+        return {
+            "enabled": ADMISSION_ENABLED,
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.active,
+            "lanes": {
+                lane.name: {
+                    "priority": lane.priority,
+                    "in_flight": lane.active,
+                    "max_concurrency": lane.max_concurrency,
+                    "max_queue_per_endpoint": lane.max_queue,
+                    "timeout_seconds": lane.timeout_seconds,
+                    "avg_service_seconds": round(lane.service_seconds, 3),
+                }
+                for lane in self.lanes.values()
+            },
+            "queue_depth": dict(self.queue_depth),
+            "shed": [
+                {"endpoint": endpoint, "reason": reason, "count": count}
+                for (endpoint, reason), count in sorted(self.shed.items())
+            ],
+        }
+
+
+LANES = {
+    "interactive": Lane.from_env("interactive", 0, (24, 64, 10)),
+    "bulk": Lane.from_env("bulk", 1, (4, 8, 120)),
+}
+ROUTES = {
+    "/qa": "interactive",
+    "/query": "interactive",
+    "/qa/batch": "bulk",
+    "/summarize": "bulk",
+    "/extract": "bulk",
+}
+
+controller = AdmissionController(LANES, ROUTES, ADMISSION_MAX_CONCURRENCY)
+router = APIRouter(prefix="/admission", tags=["admission"])
+
+
+def request_budget(request: Request, lane: Lane) -> float:
+    deadline_ms = request.headers.get(DEADLINE_HEADER)
+    if deadline_ms and deadline_ms.isdigit():
+        return min(int(deadline_ms) / 1000, lane.timeout_seconds)
+    return lane.timeout_seconds
+
+
+def retry_after_header(rejected: Rejected) -> dict:
+    return {"Retry-After": str(max(1, math.ceil(rejected.retry_after)))}
+
+
+async def transfer(request: Request, lane_name: str):
+    current = getattr(request.state, "admission_lane", None)
+    lane = controller.lanes[lane_name]
+    if current is None or current is lane:
+        return
+
+    request.state.admission_lane = None
+    controller.release(current, 0.0)
+    try:
+        await controller.acquire(request.url.path, lane, request_budget(request, lane))
+    except Rejected as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=f"Request shed by admission control ({e.reason})",
+            headers=retry_after_header(e),
+        )
+    request.state.admission_lane = lane
+    request.state.admission_start = time.perf_counter()
+
+
+async def admission_middleware(request: Request, call_next):
+    lane = controller.lane_for(request.url.path)
+    if not ADMISSION_ENABLED or lane is None or request.method != "POST":
+        return await call_next(request)
+
+    endpoint = request.url.path
+    try:
+        await controller.acquire(endpoint, lane, request_budget(request, lane))
+    except Rejected as e:
+        return JSONResponse(
+            status_code=e.status_code,
+            headers=retry_after_header(e),
+            content={
+                "detail": f"Request shed by admission control ({e.reason})",
+                "lane": lane.name,
+                "reason": e.reason,
+            },
+        )
+
+    request.state.admission_lane = lane
+    request.state.admission_start = time.perf_counter()
+    try:
+        return await call_next(request)
+    finally:
+        lane = request.state.admission_lane
+        if lane is not None:
+            controller.release(
+                lane, time.perf_counter() - request.state.admission_start
+            )
+
+
+@router.get("/status")
+def admission_status():
+    return controller.status()
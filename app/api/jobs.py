@@ -0,0 +1,209 @@
+import os
+import time
+import asyncio
+import threading
+from fastapi import APIRouter, Header, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
+from app.database.job_repository import get_job_repository
+from app.workflows.summarization_workflow import SummarizationWorkflow
+from app.workflows.extraction_workflow import ExtractionWorkflow
+from app.services import metrics
+from app.services.usage import usage_scope
+
+JOBS_ENABLED = os.getenv("JOBS_ENABLED", "true").lower() == "true"
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_POLL_SECONDS = float(os.getenv("JOB_POLL_SECONDS", "1"))
+JOB_LEASE_SECONDS = float(os.getenv("JOB_LEASE_SECONDS", "60"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+JOB_RECOVERY_SECONDS = float(os.getenv("JOB_RECOVERY_SECONDS", "30"))
+JOB_LONG_POLL_MAX_SECONDS = float(os.getenv("JOB_LONG_POLL_MAX_SECONDS", "30"))
+TERMINAL_STATUSES = ("succeeded", "failed")
+
+JOBS = metrics.register(metrics.Counter("jobs_total", "Background jobs by outcome"))
+JOBS_RUNNING = metrics.register(
+    metrics.Gauge("jobs_running", "Background jobs running in this process")
+)
+
+
+JOB_HANDLERS = {
+    "summarize": lambda params: SummarizationWorkflow().run(),
+    "extract": lambda params: ExtractionWorkflow().run(),
+}
+
+
+class JobRunner:
+    def __init__(
+        self,
+        handlers: dict,
+        workers: int = None,
+        poll_seconds: float = None,
+        lease_seconds: float = None,
+        max_attempts: int = None,
+        repo=None,
+    ):
+        self.handlers = handlers
+        self.workers = workers or JOB_WORKERS
+        self.poll_seconds = poll_seconds or JOB_POLL_SECONDS
+        self.lease_seconds = lease_seconds or JOB_LEASE_SECONDS
+        self.max_attempts = max_attempts or JOB_MAX_ATTEMPTS
+        self.running = 0
+        self._repo = repo
+        self._threads = []
+        self._heartbeat = None
+        self._claimed = {}
+        self._stop = threading.Event()
+        self._stop_heartbeat = threading.Event()
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._last_recovery = float("-inf")
+
+    @property
+    def repo(self):
+        if self._repo is None:
+            self._repo = get_job_repository()
+        return self._repo
+
+    def start(self):
+        self._stop.clear()
+        self._stop_heartbeat.clear()
+        self._threads = [
+            threading.Thread(target=self._run, name=f"job-worker-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        self._heartbeat = threading.Thread(
+            target=self._renew_leases, name="job-heartbeat", daemon=True
+        )
+        for thread in self._threads + [self._heartbeat]:
+            thread.start()
+
+    def stop(self, timeout: float = 30.0):
+        self._stop.set()
+        self._wake.set()
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        self._threads = []
+
+        self._stop_heartbeat.set()
+        if self._heartbeat is not None:
+            self._heartbeat.join()
+            self._heartbeat = None
+
+        with self._lock:
+            abandoned = list(self._claimed.items())
+        for job_id, attempts in abandoned:
+            try:
+                self.repo.requeue_job(job_id, attempts)
+            except Exception as e:
+                print(f"Failed to requeue background job {job_id}: {str(e)}")
+        if abandoned:
+            print(f"Requeued {len(abandoned)} unfinished background jobs")
+
+    def notify(self):
+        self._wake.set()
+
+    def recover(self):
+        self._last_recovery = time.monotonic()
+        recovered = self.repo.recover_expired_jobs(self.max_attempts)
+        if recovered:
+            print(f"Recovered {recovered} background jobs with expired leases")
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                if time.monotonic() - self._last_recovery > JOB_RECOVERY_SECONDS:
+                    self.recover()
+                job = self.repo.claim_next_job(self.lease_seconds)
+            except Exception as e:
+                print(f"Failed to claim background job: {str(e)}")
+                job = None
+
+            if job is None:
+                self._wake.wait(self.poll_seconds)
+                self._wake.clear()
+                continue
+
+            try:
+                self.run_job(job)
+            except Exception as e:
+                print(f"Failed to record background job {job['id']}: {str(e)}")
+
+    def _renew_leases(self):
+        while not self._stop_heartbeat.wait(self.lease_seconds / 3):
+            with self._lock:
+                claimed = list(self._claimed.items())
+            for job_id, attempts in claimed:
+                try:
+                    self.repo.renew_lease(job_id, attempts, self.lease_seconds)
+                except Exception as e:
+                    print(f"Failed to renew background job lease: {str(e)}")
+
+    def run_job(self, job: dict):
+        with self._lock:
+            self._claimed[job["id"]] = job["attempts"]
+            self.running += 1
+            JOBS_RUNNING.set(self.running)
+
+        try:
+            handler = self.handlers[job["kind"]]
+            with usage_scope(endpoint=f"job {job['kind']}"):
+                result = handler(job["params"] or {})
+        except Exception as e:
+            retry = job["attempts"] < self.max_attempts
+            self.repo.fail_job(job["id"], job["attempts"], str(e), retry=retry)
+            JOBS.inc(kind=job["kind"], outcome="retried" if retry else "failed")
+        else:
+            self.repo.complete_job(job["id"], job["attempts"], result)
+            JOBS.inc(kind=job["kind"], outcome="succeeded")
+        finally:
+            with self._lock:
+                self._claimed.pop(job["id"], None)
+                self.running -= 1
+                JOBS_RUNNING.set(self.running)
+
+
+job_runner = JobRunner(JOB_HANDLERS)
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+def submit_job(kind: str, idempotency_key: str | None, response: Response) -> dict:
+    job, created = job_runner.repo.create_job(kind, {}, idempotency_key)
+    if job["kind"] != kind:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Idempotency key already used for a {job['kind']} job",
+        )
+
+    if created:
+        job_runner.notify()
+    response.status_code = 202 if created else 200
+    response.headers["Location"] = f"{router.prefix}/{job['id']}"
+    return job
+
+
+@router.post("/summarize", status_code=202)
+def submit_summarization(
+    response: Response, idempotency_key: str | None = Header(default=None)
+):
+    return submit_job("summarize", idempotency_key, response)
+
+
+@router.post("/extract", status_code=202)
+def submit_extraction(
+    response: Response, idempotency_key: str | None = Header(default=None)
+):
+    return submit_job("extract", idempotency_key, response)
+
+
+@router.get("/{job_id}")
+async def get_job(
+    job_id: str, wait: float = Query(default=0, ge=0, le=JOB_LONG_POLL_MAX_SECONDS)
+):
+    deadline = time.monotonic() + wait
+    while True:
+        job = await run_in_threadpool(job_runner.repo.get_job, job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        if job["status"] in TERMINAL_STATUSES or time.monotonic() >= deadline:
+            return job
+        await asyncio.sleep(min(0.5, max(0.0, deadline - time.monotonic())))
@@ -1,20 +1,102 @@
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+import os
+import time
+import threading
+from contextlib import asynccontextmanager
+from typing import List, Literal
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel, Field
 from app.workflows.qa_workflow import QAWorkflow
 from app.workflows.summarization_workflow import SummarizationWorkflow
 from app.workflows.extraction_workflow import ExtractionWorkflow
 from app.services.router import QueryRouter
+from app.services.prompt_manager import PromptManager
+from app.services.llm_cache import cache_bypass
+from app.services import metrics
+from app.api import profiling, admission, jobs
+from app.services.usage import usage_scope, usage_recorder
+from app.services.openai_client import get_openai_client
+
+
+def warm_up():
+    get_openai_client()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    PromptManager.load_all()
+    if os.getenv("STARTUP_WARMUP", "true").lower() == "true":
+        threading.Thread(target=warm_up, daemon=True).start()
+    if jobs.JOBS_ENABLED:
+        jobs.job_runner.start()
+    yield
+    if jobs.JOBS_ENABLED:
+        jobs.job_runner.stop()
+    usage_recorder.close()
+
 
 app = FastAPI(
     title="AI Market Analyst API",
     description="Multi-functional AI agent for market research analysis",
     version="1.0.0",
+    lifespan=lifespan,
 )
+app.router.route_class = profiling.ProfiledRoute
+
+app.middleware("http")(profiling.profiling_middleware)
+app.include_router(profiling.router)
+app.middleware("http")(admission.admission_middleware)
+app.include_router(admission.router)
+app.include_router(jobs.router)
+
+
+@app.middleware("http")
+async def metrics_middleware(request: Request, call_next):
+    if not metrics.METRICS_ENABLED:
+        return await call_next(request)
+
+    start = time.perf_counter()
+    with metrics.track_request() as timings:
+        response = await call_next(request)
+    elapsed = time.perf_counter() - start
+
+    route = request.scope.get("route")
+    metrics.REQUEST_DURATION.observe(
+        elapsed,
+        endpoint=route.path if route else "unmatched",
+        method=request.method,
+        status=response.status_code,
+    )
+    response.headers["Server-Timing"] = metrics.server_timing_header(timings, elapsed)
+    return response
+
+
+@app.middleware("http")
+async def usage_middleware(request: Request, call_next):
+    with usage_scope(endpoint=f"{request.method} {request.url.path}"):
+        return await call_next(request)
+
+
+@app.middleware("http")
+async def llm_cache_bypass_middleware(request: Request, call_next):
+    bypass = request.headers.get("x-llm-cache-bypass", "").lower() in ("1", "true")
+    with cache_bypass(bypass):
+        return await call_next(request)
 
 
 class QueryRequest(BaseModel):
     query: str
     top_k: int = 3
+    search_mode: Literal["vector", "hybrid"] = "vector"
+    diversify: bool = False
+    mmr_lambda: float | None = Field(default=None, ge=0.0, le=1.0)
+
+
+class BatchQueryRequest(BaseModel):
+    queries: List[str] = Field(min_length=1, max_length=500)
+    top_k: int = 3
+    max_concurrency: int | None = Field(default=None, ge=1, le=64)
 
 
 class QueryResponse(BaseModel):
@@ -28,10 +110,16 @@ def root():
         "message": "AI Market Analyst API",
         "endpoints": {
             "/health": "Health check endpoint",
+            "/metrics": "Prometheus metrics",
+            "/admission/status": "Admission control queues and shed counts",
             "/query": "Auto-route query to appropriate workflow",
             "/qa": "Question answering workflow",
+            "/qa/batch": "Batched question answering workflow",
             "/summarize": "Summarization workflow",
             "/extract": "Data extraction workflow",
+            "/jobs/summarize": "Submit a background summarization job",
+            "/jobs/extract": "Submit a background extraction job",
+            "/jobs/{job_id}": "Job status and result (long-poll with ?wait=)",
         },
     }
 
@@ -41,33 +129,72 @@ def health():
     return {"status": "healthy"}
 
 
-@app.post("/query", response_model=QueryResponse)
-def query(request: QueryRequest):
-    router = QueryRouter()
-    workflow_type = router.route(request.query)
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics_endpoint():
+    return PlainTextResponse(
+        metrics.render_metrics(), media_type="text/plain; version=0.0.4"
+    )
+
+
+def route_query(query: str) -> str:
+    return QueryRouter().route(query)
+
 
+def run_workflow(workflow_type: str, request: QueryRequest) -> dict:
     if workflow_type == "qa":
         qa = QAWorkflow()
-        result = qa.run(request.query, top_k=request.top_k)
+        return qa.run(
+            request.query,
+            top_k=request.top_k,
+            search_mode=request.search_mode,
+            diversify=request.diversify,
+            mmr_lambda=request.mmr_lambda,
+        )
     elif workflow_type == "summarization":
         summarization = SummarizationWorkflow()
-        result = summarization.run()
+        return summarization.run()
     elif workflow_type == "extraction":
         extraction = ExtractionWorkflow()
-        result = extraction.run()
+        return extraction.run()
     else:
         raise HTTPException(status_code=400, detail="Invalid workflow type")
 
+
+@app.post("/query", response_model=QueryResponse)
+async def query(request: QueryRequest, http_request: Request):
+    workflow_type = await run_in_threadpool(route_query, request.query)
+    if workflow_type in ("summarization", "extraction"):
+        await admission.transfer(http_request, "bulk")
+
+    result = await run_in_threadpool(run_workflow, workflow_type, request)
     return {"workflow": workflow_type, "result": result}
 
 
 @app.post("/qa")
 def qa_endpoint(request: QueryRequest):
     qa = QAWorkflow()
-    result = qa.run(request.query, top_k=request.top_k)
+    result = qa.run(
+        request.query,
+        top_k=request.top_k,
+        search_mode=request.search_mode,
+        diversify=request.diversify,
+        mmr_lambda=request.mmr_lambda,
+    )
     return {"workflow": "qa", "result": result}
 
 
+@app.post("/qa/batch")
+def qa_batch_endpoint(request: BatchQueryRequest):
+    qa = QAWorkflow()
+    with usage_scope(workflow="qa") as ledger:
+        results = qa.run_batch(
+            request.queries,
+            top_k=request.top_k,
+            max_concurrency=request.max_concurrency,
+        )
+    return {"workflow": "qa", "results": results, "usage": ledger.totals()}
+
+
 @app.post("/summarize")
 def summarize_endpoint():
     summarization = SummarizationWorkflow()
@@ -0,0 +1,199 @@
+import os
+import re
+import sys
+import time
+import uuid
+import random
+import inspect
+import functools
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+from fastapi.routing import APIRoute
+
+APP_ROOT = str(Path(__file__).parent.parent)
+
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0.01"))
+PROFILING_INTERVAL_MS = float(os.getenv("PROFILING_INTERVAL_MS", "5"))
+PROFILING_DIR = Path(os.getenv("PROFILING_DIR", "profiles"))
+PROFILE_HEADER = "x-profile"
+
+_current_profile = ContextVar("current_profile", default=None)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    if filename.startswith(APP_ROOT):
+        filename = "app" + filename[len(APP_ROOT) :]
+    else:
+        filename = os.path.basename(filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self._targets = {}
+        self._active = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @contextmanager
+    def track(self, stacks: Counter):
+        thread_id = threading.get_ident()
+        with self._lock:
+            self._targets.setdefault(thread_id, []).append(stacks)
+            self._active.set()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="profiler", daemon=True
+                )
+                self._thread.start()
+        try:
+            yield stacks
+        finally:
+            with self._lock:
+                remaining = [s for s in self._targets[thread_id] if s is not stacks]
+                if remaining:
+                    self._targets[thread_id] = remaining
+                else:
+                    del self._targets[thread_id]
+                if not self._targets:
+                    self._active.clear()
+
+    def _run(self):
+        while True:
+            self._active.wait()
+            time.sleep(self.interval_seconds)
+            frames = sys._current_frames()
+            with self._lock:
+                for thread_id, targets in self._targets.items():
+                    frame = frames.get(thread_id)
+                    stack = []
+                    in_app = False
+                    while frame is not None:
+                        if frame.f_code.co_filename.startswith(APP_ROOT):
+                            in_app = True
+                        stack.append(_frame_label(frame))
+                        frame = frame.f_back
+
+                    if in_app:
+                        collapsed = ";".join(reversed(stack))
+                        for stacks in targets:
+                            stacks[collapsed] += 1
+
+
+class ProfiledRoute(APIRoute):
+    def __init__(self, path: str, endpoint, **kwargs):
+        if not inspect.iscoroutinefunction(endpoint):
+            endpoint = _track_endpoint_thread(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+
+def _track_endpoint_thread(endpoint):
+    @functools.wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        stacks = _current_profile.get()
+        if stacks is None:
+            return endpoint(*args, **kwargs)
+        with sampler.track(stacks):
+            return endpoint(*args, **kwargs)
+
+    return wrapper
+
+
+class ProfileStore:
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._aggregates = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _write(path: Path, stacks: Counter):
+        lines = [f"{stack} {count}" for stack, count in stacks.most_common()]
+        path.write_text("\n".join(lines) + "\n")
+
+    def save(self, endpoint: str, stacks: Counter) -> str:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        slug = re.sub(r"[^a-zA-Z0-9]+", "_", endpoint).strip("_") or "root"
+        name = f"{time.strftime('%Y%m%dT%H%M%S')}_{slug}_{uuid.uuid4().hex[:8]}.folded"
+        self._write(self.directory / name, stacks)
+
+        with self._lock:
+            aggregate = self._aggregates.setdefault(slug, Counter())
+            aggregate.update(stacks)
+            self._write(self.directory / f"aggregate_{slug}.folded", aggregate)
+
+        return name
+
+    def list(self) -> list[dict]:
+        if not self.directory.exists():
+            return []
+        return [
+            {
+                "name": path.name,
+                "size_bytes": path.stat().st_size,
+                "modified": path.stat().st_mtime,
+            }
+            for path in sorted(self.directory.glob("*.folded"), reverse=True)
+        ]
+
+    def path_for(self, name: str) -> Path:
+        path = self.directory / name
+        if not re.fullmatch(r"[\w.-]+\.folded", name) or not path.exists():
+            raise HTTPException(status_code=404, detail="Profile not found")
+        return path
+
+
+sampler = SamplingProfiler(PROFILING_INTERVAL_MS / 1000)
+profile_store = ProfileStore(PROFILING_DIR)
+router = APIRouter(prefix="/debug/profiles", tags=["debug"])
+
+
+def should_profile(request: Request) -> bool:
+    if not PROFILING_ENABLED:
+        return False
+    if request.headers.get(PROFILE_HEADER, "").lower() in ("1", "true"):
+        return True
+    return random.random() < PROFILING_SAMPLE_RATE
+
+
+async def profiling_middleware(request: Request, call_next):
+    if not should_profile(request) or request.url.path.startswith(router.prefix):
+        return await call_next(request)
+
+    stacks = Counter()
+    token = _current_profile.set(stacks)
+    try:
+        with sampler.track(stacks):
+            response = await call_next(request)
+    finally:
+        _current_profile.reset(token)
+
+    route = request.scope.get("route")
+    endpoint = f"{request.method} {route.path if route else request.url.path}"
+    response.headers["X-Profile-Name"] = await run_in_threadpool(
+        profile_store.save, endpoint, stacks
+    )
+    return response
+
+
+@router.get("")
+def list_profiles():
+    if not PROFILING_ENABLED:
+        raise HTTPException(status_code=404, detail="Profiling is disabled")
+    return {"profiles": profile_store.list()}
+
+
+@router.get("/{name}")
+def download_profile(name: str):
+    if not PROFILING_ENABLED:
+        raise HTTPException(status_code=404, detail="Profiling is disabled")
+    return FileResponse(profile_store.path_for(name), media_type="text/plain")
@@ -0,0 +1,49 @@
+import argparse
+from dotenv import load_dotenv
+from app.services.embedding import EmbeddingService
+from app.database.config import DatabaseConfig
+from app.database.connection import get_connection, ensure_embedding_column
+from app.database.repository import get_document_repository
+
+load_dotenv()
+
+
+def backfill_embeddings(model: str = None, dimensions: int = None, batch_size: int = 100):
+    embedder = EmbeddingService(model=model, dimensions=dimensions)
+    print(
+        f"Backfilling {embedder.column} using {embedder.model} "
+        f"({embedder.dimensions} dimensions)..."
+    )
+
+    if DatabaseConfig.VECTOR_BACKEND == "postgres":
+        conn = get_connection()
+        cur = conn.cursor()
+        ensure_embedding_column(cur, embedder.config)
+        conn.commit()
+        cur.close()
+        conn.close()
+
+    repo = get_document_repository()
+    chunks = repo.get_all_chunks()
+
+    for start in range(0, len(chunks), batch_size):
+        batch = chunks[start : start + batch_size]
+        embeddings = embedder.generate_embeddings_batch(
+            [chunk["content"] for chunk in batch]
+        )
+        repo.update_embeddings(
+            [chunk["id"] for chunk in batch], embeddings, embedder.column
+        )
+
+    print(f"Successfully embedded {len(chunks)} chunks into {embedder.column}!")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Embed stored chunks with another model without re-ingesting text"
+    )
+    parser.add_argument("--model", default=None)
+    parser.add_argument("--dimensions", type=int, default=None)
+    args = parser.parse_args()
+
+    backfill_embeddings(model=args.model, dimensions=args.dimensions)
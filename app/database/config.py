@@ -1,4 +1,5 @@
 import os
+import re
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -11,8 +12,54 @@ class DatabaseConfig:
     USER = os.getenv("DATABASE_USER", "postgres")
     PASSWORD = os.getenv("DATABASE_PASSWORD", "postgres")
 
+    VECTOR_BACKEND = os.getenv("VECTOR_BACKEND", "postgres")
+    VECTOR_STORAGE = os.getenv("VECTOR_STORAGE", "full")
+    RERANK_OVERSAMPLE = int(os.getenv("RERANK_OVERSAMPLE", "4"))
+    HYBRID_CANDIDATES = int(os.getenv("HYBRID_CANDIDATES", "20"))
+    HYBRID_RRF_K = int(os.getenv("HYBRID_RRF_K", "60"))
+    IVFFLAT_LISTS = int(os.getenv("IVFFLAT_LISTS", "100"))
+    IVFFLAT_PROBES = int(os.getenv("IVFFLAT_PROBES", "1"))
+    HNSW_EF_SEARCH = int(os.getenv("HNSW_EF_SEARCH", "40"))
+    EXACT_SEARCH_MAX_ROWS = int(os.getenv("EXACT_SEARCH_MAX_ROWS", "20000"))
+
     @classmethod
     def get_connection_string(cls):
         return (
             f"postgresql://{cls.USER}:{cls.PASSWORD}@{cls.HOST}:{cls.PORT}/{cls.NAME}"
         )
+
+
+class EmbeddingConfig:
+    DEFAULT_MODEL = "text-embedding-3-small"
+    DEFAULT_COLUMN = "embedding"
+    MODEL_DIMENSIONS = {
+        "text-embedding-3-small": 1536,
+        "text-embedding-3-large": 3072,
+        "text-embedding-ada-002": 1536,
+    }
+    MAX_INDEXED_VECTOR_DIMENSIONS = 2000
+
+    def __init__(self, model: str = None, dimensions: int = None):
+        self.model = model or os.getenv("EMBEDDING_MODEL", self.DEFAULT_MODEL)
+        env_dimensions = os.getenv("EMBEDDING_DIMENSIONS")
+        if dimensions is None and env_dimensions and model is None:
+            dimensions = int(env_dimensions)
+        self.requested_dimensions = dimensions
+        self.dimensions = dimensions or self.MODEL_DIMENSIONS.get(self.model, 1536)
+
+    @property
+    def column(self) -> str:
+        if (
+            self.model == self.DEFAULT_MODEL
+            and self.dimensions == self.MODEL_DIMENSIONS[self.DEFAULT_MODEL]
+        ):
+            return self.DEFAULT_COLUMN
+
+        slug = re.sub(r"[^a-z0-9]+", "_", self.model.lower()).strip("_")
+        return f"{self.DEFAULT_COLUMN}_{slug}_{self.dimensions}"
+
+
+def validate_embedding_column(column: str) -> str:
+    if not re.fullmatch(r"embedding(_[a-z0-9_]+)?", column):
+        raise ValueError(f"Invalid embedding column: {column}")
+    return column
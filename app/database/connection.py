@@ -1,10 +1,14 @@
-import psycopg2
-from psycopg2.extras import RealDictCursor
-from pgvector.psycopg2 import register_vector
-from .config import DatabaseConfig
+from .config import DatabaseConfig, EmbeddingConfig, validate_embedding_column
+from app.services.metrics import stage, DB_CONNECTIONS
 
+VECTOR_STORAGE_MODES = ("full", "halfvec", "binary")
+
+
+def _connect():
+    import psycopg2
+    from psycopg2.extras import RealDictCursor
+    from pgvector.psycopg2 import register_vector
 
-def get_connection():
     conn = psycopg2.connect(
         DatabaseConfig.get_connection_string(), cursor_factory=RealDictCursor
     )
@@ -12,7 +16,78 @@ def get_connection():
     return conn
 
 
-def init_database():
+def get_connection():
+    with stage("db_connect"):
+        conn = _connect()
+    DB_CONNECTIONS.inc()
+    return conn
+
+
+def use_exact_search(cur) -> bool:
+    cur.execute(
+        "SELECT reltuples FROM pg_class WHERE oid = 'document_chunks'::regclass;"
+    )
+    row = cur.fetchone()
+    return row is None or row["reltuples"] < DatabaseConfig.EXACT_SEARCH_MAX_ROWS
+
+
+def apply_search_settings(cur, probes: int = None, ef_search: int = None):
+    cur.execute(
+        """
+        SELECT set_config('ivfflat.probes', %(probes)s, true),
+               set_config('hnsw.ef_search', %(ef_search)s, true);
+    """,
+        {
+            "probes": str(probes or DatabaseConfig.IVFFLAT_PROBES),
+            "ef_search": str(ef_search or DatabaseConfig.HNSW_EF_SEARCH),
+        },
+    )
+
+
+def create_vector_indexes(
+    cur, storage: str = "full", column: str = "embedding", dimensions: int = 1536
+):
+    if storage not in VECTOR_STORAGE_MODES:
+        raise ValueError(f"Unknown vector storage mode: {storage}")
+    column = validate_embedding_column(column)
+
+    if dimensions <= EmbeddingConfig.MAX_INDEXED_VECTOR_DIMENSIONS:
+        cur.execute(f"""
+            CREATE INDEX IF NOT EXISTS {column}_idx 
+            ON document_chunks 
+            USING ivfflat ({column} vector_cosine_ops)
+            WITH (lists = {DatabaseConfig.IVFFLAT_LISTS});
+        """)
+
+    if storage == "halfvec":
+        cur.execute(f"""
+            CREATE INDEX IF NOT EXISTS {column}_halfvec_idx
+            ON document_chunks
+            USING hnsw (({column}::halfvec({dimensions})) halfvec_cosine_ops);
+        """)
+    elif storage == "binary":
+        cur.execute(f"""
+            CREATE INDEX IF NOT EXISTS {column}_binary_idx
+            ON document_chunks
+            USING hnsw ((binary_quantize({column})::bit({dimensions})) bit_hamming_ops);
+        """)
+
+
+def ensure_embedding_column(cur, config: EmbeddingConfig, storage: str = None):
+    column = validate_embedding_column(config.column)
+    cur.execute(
+        f"ALTER TABLE document_chunks ADD COLUMN IF NOT EXISTS {column} vector({config.dimensions});"
+    )
+    create_vector_indexes(
+        cur, storage or DatabaseConfig.VECTOR_STORAGE, column, config.dimensions
+    )
+
+
+def init_database(storage: str = None):
+    import psycopg2
+    from psycopg2.extras import RealDictCursor
+    from pgvector.psycopg2 import register_vector
+
     conn = psycopg2.connect(
         DatabaseConfig.get_connection_string(), cursor_factory=RealDictCursor
     )
@@ -35,12 +110,65 @@ def init_database():
     """)
 
     cur.execute("""
-        CREATE INDEX IF NOT EXISTS embedding_idx 
-        ON document_chunks 
-        USING ivfflat (embedding vector_cosine_ops)
-        WITH (lists = 100);
+        ALTER TABLE document_chunks
+        ADD COLUMN IF NOT EXISTS start_char INTEGER,
+        ADD COLUMN IF NOT EXISTS end_char INTEGER;
+    """)
+
+    cur.execute("""
+        ALTER TABLE document_chunks
+        ADD COLUMN IF NOT EXISTS content_tsv tsvector
+        GENERATED ALWAYS AS (to_tsvector('english', content)) STORED;
     """)
 
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS content_tsv_idx
+        ON document_chunks
+        USING gin (content_tsv);
+    """)
+
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS token_usage (
+            id BIGSERIAL PRIMARY KEY,
+            request_id TEXT NOT NULL,
+            endpoint TEXT,
+            workflow TEXT,
+            model TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            tokens INTEGER NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+    """)
+
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS jobs (
+            id TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'queued',
+            idempotency_key TEXT UNIQUE,
+            params JSONB,
+            result JSONB,
+            error TEXT,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            lease_expires_at TIMESTAMPTZ,
+            created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+            started_at TIMESTAMPTZ,
+            finished_at TIMESTAMPTZ
+        );
+    """)
+
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS jobs_status_created_idx
+        ON jobs (status, created_at);
+    """)
+
+    storage = storage or DatabaseConfig.VECTOR_STORAGE
+    create_vector_indexes(cur, storage)
+
+    config = EmbeddingConfig()
+    if config.column != EmbeddingConfig.DEFAULT_COLUMN:
+        ensure_embedding_column(cur, config, storage)
+
     conn.commit()
     cur.close()
     conn.close()
@@ -0,0 +1,198 @@
+import uuid
+from typing import Dict, Tuple
+from .config import DatabaseConfig
+from .connection import get_connection
+
+JOB_COLUMNS = """
+    id, kind, status, idempotency_key, params, result, error, attempts,
+    created_at, started_at, finished_at
+"""
+
+
+class JobRepository:
+    def create_job(
+        self, kind: str, params: Dict = None, idempotency_key: str = None
+    ) -> Tuple[Dict, bool]:
+        from psycopg2.extras import Json
+
+        conn = get_connection()
+        cur = conn.cursor()
+
+        cur.execute(
+            f"""
+            INSERT INTO jobs (id, kind, idempotency_key, params)
+            VALUES (%s, %s, %s, %s)
+            ON CONFLICT (idempotency_key) DO NOTHING
+            RETURNING {JOB_COLUMNS};
+        """,
+            (uuid.uuid4().hex, kind, idempotency_key, Json(params or {})),
+        )
+        job = cur.fetchone()
+        created = job is not None
+
+        if not created:
+            cur.execute(
+                f"SELECT {JOB_COLUMNS} FROM jobs WHERE idempotency_key = %s;",
+                (idempotency_key,),
+            )
+            job = cur.fetchone()
+
+        conn.commit()
+        cur.close()
+        conn.close()
+
+        return job, created
+
+    def get_job(self, job_id: str) -> Dict | None:
+        conn = get_connection()
+        cur = conn.cursor()
+
+        cur.execute(f"SELECT {JOB_COLUMNS} FROM jobs WHERE id = %s;", (job_id,))
+        job = cur.fetchone()
+
+        cur.close()
+        conn.close()
+
+        return job
+
+    def claim_next_job(self, lease_seconds: float) -> Dict | None:
+        conn = get_connection()
+        cur = conn.cursor()
+
+        cur.execute(
+            f"""
+            UPDATE jobs
+            SET status = 'running',
+                attempts = attempts + 1,
+                started_at = now(),
+                lease_expires_at = now() + make_interval(secs => %s)
+            WHERE id = (
+                SELECT id FROM jobs
+                WHERE status = 'queued'
+                ORDER BY created_at
+                FOR UPDATE SKIP LOCKED
+                LIMIT 1
+            )
+            RETURNING {JOB_COLUMNS};
+        """,
+            (lease_seconds,),
+        )
+        job = cur.fetchone()
+
+        conn.commit()
+        cur.close()
+        conn.close()
+
+        return job
+
+    def complete_job(self, job_id: str, attempts: int, result: Dict):
+        from psycopg2.extras import Json
+
+        conn = get_connection()
+        cur = conn.cursor()
+
+        cur.execute(
+            """
+            UPDATE jobs
+            SET status = 'succeeded', result = %s, error = NULL,
+                finished_at = now(), lease_expires_at = NULL
+            WHERE id = %s AND status = 'running' AND attempts = %s;
+        """,
+            (Json(result), job_id, attempts),
+        )
+
+        conn.commit()
+        cur.close()
+        conn.close()
+
+    def fail_job(self, job_id: str, attempts: int, error: str, retry: bool = False):
+        conn = get_connection()
+        cur = conn.cursor()
+
+        cur.execute(
+            """
+            UPDATE jobs
+            SET status = %s, error = %s, lease_expires_at = NULL,
+                finished_at = CASE WHEN %s THEN NULL ELSE now() END
+            WHERE id = %s AND status = 'running' AND attempts = %s;
+        """,
+            ("queued" if retry else "failed", error, retry, job_id, attempts),
+        )
+
+        conn.commit()
+        cur.close()
+        conn.close()
+
+    def renew_lease(self, job_id: str, attempts: int, lease_seconds: float) -> bool:
+        conn = get_connection()
+        cur = conn.cursor()
+
+        cur.execute(
+            """
+            UPDATE jobs
+            SET lease_expires_at = now() + make_interval(secs => %s)
+            WHERE id = %s AND status = 'running' AND attempts = %s;
+        """,
+            (lease_seconds, job_id, attempts),
+        )
+        renewed = cur.rowcount == 1
+
+        conn.commit()
+        cur.close()
+        conn.close()
+
+        return renewed
+
+    def requeue_job(self, job_id: str, attempts: int) -> bool:
+        conn = get_connection()
+        cur = conn.cursor()
+
+        cur.execute(
+            """
+            UPDATE jobs
+            SET status = 'queued', lease_expires_at = NULL,
+                error = 'Worker stopped before completion'
+            WHERE id = %s AND status = 'running' AND attempts = %s;
+        """,
+            (job_id, attempts),
+        )
+        requeued = cur.rowcount == 1
+
+        conn.commit()
+        cur.close()
+        conn.close()
+
+        return requeued
+
+    def recover_expired_jobs(self, max_attempts: int) -> int:
+        conn = get_connection()
+        cur = conn.cursor()
+
+        cur.execute(
+            """
+            UPDATE jobs
+            SET status = CASE WHEN attempts >= %(max_attempts)s
+                              THEN 'failed' ELSE 'queued' END,
+                finished_at = CASE WHEN attempts >= %(max_attempts)s
+                                   THEN now() ELSE NULL END,
+                error = 'Job lease expired before completion',
+                lease_expires_at = NULL
+            WHERE status = 'running' AND lease_expires_at < now();
+        """,
+            {"max_attempts": max_attempts},
+        )
+        recovered = cur.rowcount
+
+        conn.commit()
+        cur.close()
+        conn.close()
+
+        return recovered
+
+
+def get_job_repository():
+    if DatabaseConfig.VECTOR_BACKEND == "numpy":
+        from .sqlite_job_repository import SQLiteJobRepository
+
+        return SQLiteJobRepository()
+    return JobRepository()
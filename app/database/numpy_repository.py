@@ -0,0 +1,385 @@
+import os
+import re
+import json
+import uuid
+import shutil
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Tuple
+import numpy as np
+from .config import DatabaseConfig, validate_embedding_column
+
+MIN_CAPACITY = 1024
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _atomic_write(path: Path, write):
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def _create_array(path: Path, shape: tuple, dtype, current=None) -> np.ndarray:
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    array = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=dtype, shape=shape)
+    if current is not None:
+        array[: len(current)] = current
+    array.flush()
+    del array
+    os.replace(tmp_path, path)
+    return np.load(path, mmap_mode="r+")
+
+
+class NumpyDocumentRepository:
+    _cache = {}
+    _lock = threading.Lock()
+    _cache_lock = threading.Lock()
+
+    def __init__(self, path: str = None):
+        self.path = Path(path or os.getenv("VECTOR_STORE_PATH", "data/vector_store"))
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.current_path = self.path / "CURRENT"
+        with self._lock:
+            if not self.current_path.exists():
+                self._start_generation()
+
+    def _start_generation(self) -> str:
+        generation = uuid.uuid4().hex
+        (self.path / generation).mkdir()
+        _atomic_write(self.current_path, lambda f: f.write(generation.encode()))
+        return generation
+
+    def _directory(self) -> Path:
+        return self.path / self.current_path.read_text().strip()
+
+    def _state(self) -> Dict[str, Any]:
+        directory = self._directory()
+        state = self._cache.get(self.path)
+        if state is None or state["directory"] != directory:
+            state = {
+                "directory": directory,
+                "offset": 0,
+                "chunks": [],
+                "terms": {},
+                "columns": {},
+            }
+            self._cache[self.path] = state
+        return state
+
+    def _refresh(self) -> Dict[str, Any]:
+        with self._cache_lock:
+            state = self._state()
+            chunks_path = state["directory"] / "chunks.jsonl"
+            if chunks_path.exists() and chunks_path.stat().st_size > state["offset"]:
+                with open(chunks_path, "rb") as f:
+                    f.seek(state["offset"])
+                    data = f.read()
+                end = data.rfind(b"\n") + 1
+                for line in data[:end].splitlines():
+                    chunk = json.loads(line)
+                    for term in set(re.findall(r"\w+", chunk["content"].lower())):
+                        state["terms"].setdefault(term, []).append(len(state["chunks"]))
+                    state["chunks"].append(chunk)
+                state["offset"] += end
+            return state
+
+    def _load_chunks(self) -> List[Dict[str, Any]]:
+        return self._refresh()["chunks"]
+
+    def _matrix_paths(self, embedding_column: str) -> Tuple[Path, Path]:
+        name = validate_embedding_column(embedding_column)
+        directory = self._directory()
+        return directory / f"{name}.npy", directory / f"{name}.mask.npy"
+
+    def _load_matrix(
+        self, embedding_column: str, rows: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        matrix_path, mask_path = self._matrix_paths(embedding_column)
+        with self._cache_lock:
+            state = self._state()
+            try:
+                version = (matrix_path.stat().st_ino, mask_path.stat().st_ino)
+            except FileNotFoundError:
+                return None, None
+
+            column = state["columns"].get(matrix_path.name)
+            if column is None or column["version"] != version:
+                column = {
+                    "version": version,
+                    "matrix": np.load(matrix_path, mmap_mode="r"),
+                    "mask": np.load(mask_path, mmap_mode="r"),
+                }
+                state["columns"][matrix_path.name] = column
+
+        rows = min(rows, len(column["matrix"]), len(column["mask"]))
+        return column["matrix"][:rows], np.array(column["mask"][:rows])
+
+    def _write_embeddings(
+        self, embedding_column: str, ids: np.ndarray, vectors: np.ndarray
+    ):
+        matrix_path, mask_path = self._matrix_paths(embedding_column)
+        rows = int(ids.max())
+        if matrix_path.exists() and mask_path.exists():
+            matrix = np.load(matrix_path, mmap_mode="r+")
+            mask = np.load(mask_path, mmap_mode="r+")
+            if rows > len(matrix):
+                capacity = max(rows, 2 * len(matrix))
+                matrix = _create_array(
+                    matrix_path, (capacity, matrix.shape[1]), np.float32, matrix
+                )
+                mask = _create_array(mask_path, (capacity,), bool, mask)
+        else:
+            capacity = max(rows, MIN_CAPACITY)
+            matrix = _create_array(
+                matrix_path, (capacity, vectors.shape[1]), np.float32
+            )
+            mask = _create_array(mask_path, (capacity,), bool)
+
+        matrix[ids - 1] = vectors
+        matrix.flush()
+        mask[ids - 1] = True
+        mask.flush()
+
+    def preload(self) -> int:
+        chunks = self._load_chunks()
+        mapped = 0
+        for matrix_path in self._directory().glob("*.npy"):
+            if matrix_path.name.endswith(".mask.npy"):
+                continue
+            matrix, _ = self._load_matrix(matrix_path.stem, len(chunks))
+            if matrix is not None:
+                matrix.sum(dtype=np.float64)
+                mapped += matrix.nbytes
+        return mapped
+
+    def insert_chunk(
+        self,
+        content: str,
+        embedding: List[float],
+        chunk_index: int,
+        metadata: Dict = None,
+        embedding_column: str = "embedding",
+        start_char: int = None,
+        end_char: int = None,
+    ):
+        return self.insert_chunks_batch(
+            [
+                {
+                    "content": content,
+                    "embedding": embedding,
+                    "chunk_index": chunk_index,
+                    "metadata": metadata,
+                    "start_char": start_char,
+                    "end_char": end_char,
+                }
+            ],
+            embedding_column=embedding_column,
+        )[0]
+
+    def insert_chunks_batch(
+        self,
+        chunks: List[Dict[str, Any]],
+        embedding_column: str = "embedding",
+    ) -> List[int]:
+        if not chunks:
+            return []
+
+        with self._lock:
+            stored = self._load_chunks()
+            first_id = stored[-1]["id"] + 1 if stored else 1
+            chunk_ids = list(range(first_id, first_id + len(chunks)))
+            records = [
+                {
+                    "id": chunk_id,
+                    "content": chunk["content"],
+                    "chunk_index": chunk["chunk_index"],
+                    "metadata": chunk.get("metadata"),
+                    "start_char": chunk.get("start_char"),
+                    "end_char": chunk.get("end_char"),
+                }
+                for chunk_id, chunk in zip(chunk_ids, chunks)
+            ]
+            with open(self._directory() / "chunks.jsonl", "ab") as f:
+                f.write("".join(json.dumps(r) + "\n" for r in records).encode())
+
+            embedded = [
+                (chunk_id, chunk["embedding"])
+                for chunk_id, chunk in zip(chunk_ids, chunks)
+                if chunk.get("embedding") is not None
+            ]
+            if embedded:
+                ids, embeddings = zip(*embedded)
+                self._write_embeddings(
+                    embedding_column,
+                    np.asarray(ids, dtype=np.int64),
+                    _normalize(np.asarray(embeddings, dtype=np.float32)),
+                )
+
+        return chunk_ids
+
+    def update_embeddings(
+        self,
+        chunk_ids: List[int],
+        embeddings: List[List[float]],
+        embedding_column: str = "embedding",
+    ):
+        if not chunk_ids:
+            return
+
+        with self._lock:
+            ids = np.asarray(chunk_ids, dtype=np.int64)
+            stored = self._load_chunks()
+            if ids.min() < 1 or ids.max() > len(stored):
+                raise KeyError(f"Unknown chunk ids in {chunk_ids}")
+            self._write_embeddings(
+                embedding_column,
+                ids,
+                _normalize(np.asarray(embeddings, dtype=np.float32)),
+            )
+
+    @staticmethod
+    def _check_storage(storage: str):
+        if storage not in (None, "full"):
+            raise ValueError(
+                f"The numpy backend only stores full-precision vectors, not {storage}"
+            )
+
+    def search_similar_chunks(
+        self,
+        query_embedding: List[float],
+        limit: int = 5,
+        storage: str = None,
+        embedding_column: str = "embedding",
+        include_embeddings: bool = False,
+        probes: int = None,
+        ef_search: int = None,
+        exact: bool = None,
+    ) -> List[Dict[str, Any]]:
+        return self.search_similar_chunks_batch(
+            [query_embedding],
+            limit=limit,
+            storage=storage,
+            embedding_column=embedding_column,
+            include_embeddings=include_embeddings,
+        )[0]
+
+    def search_similar_chunks_batch(
+        self,
+        query_embeddings: List[List[float]],
+        limit: int = 5,
+        storage: str = None,
+        embedding_column: str = "embedding",
+        include_embeddings: bool = False,
+        probes: int = None,
+        ef_search: int = None,
+    ) -> List[List[Dict[str, Any]]]:
+        self._check_storage(storage)
+        chunks = self._load_chunks()
+        matrix, present = self._load_matrix(embedding_column, len(chunks))
+        if matrix is None or not present.any():
+            return [[] for _ in query_embeddings]
+
+        queries = _normalize(np.asarray(query_embeddings, dtype=np.float32))
+        scores = queries @ matrix.T
+        scores[:, ~present] = -np.inf
+
+        limit = min(limit, int(present.sum()))
+        top = np.argpartition(-scores, limit - 1, axis=1)[:, :limit]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        results = [
+            [
+                {**chunks[i], "similarity": float(score)}
+                for i, score in zip(row, row_scores)
+            ]
+            for row, row_scores in zip(top, top_scores)
+        ]
+        if include_embeddings:
+            for row, row_results in zip(top, results):
+                for i, chunk in zip(row, row_results):
+                    chunk["embedding"] = matrix[i]
+        return results
+
+    def search_hybrid_chunks(
+        self,
+        query_text: str,
+        query_embedding: List[float],
+        limit: int = 5,
+        embedding_column: str = "embedding",
+        include_embeddings: bool = False,
+        probes: int = None,
+        ef_search: int = None,
+        exact: bool = None,
+    ) -> List[Dict[str, Any]]:
+        state = self._refresh()
+        chunks = state["chunks"][:]
+        matrix, present = self._load_matrix(embedding_column, len(chunks))
+        if matrix is None or not present.any():
+            return []
+        present = np.pad(present, (0, len(chunks) - len(present)))
+
+        candidates = max(limit, DatabaseConfig.HYBRID_CANDIDATES)
+        query = _normalize(np.asarray(query_embedding, dtype=np.float32))
+        similarities = np.full(len(chunks), -np.inf)
+        similarities[: len(matrix)] = matrix @ query
+        similarities[~present] = -np.inf
+        vector_ranked = np.argsort(-similarities)[: min(candidates, present.sum())]
+
+        terms = set(re.findall(r"\w+", query_text.lower()))
+        lexical_scores = np.zeros(len(chunks), dtype=np.int64)
+        for term in terms:
+            postings = np.array(state["terms"].get(term, []), dtype=np.int64)
+            lexical_scores[postings[postings < len(chunks)]] += 1
+        lexical_scores[~present] = 0
+        lexical_ranked = np.argsort(-lexical_scores, kind="stable")[:candidates]
+        lexical_ranked = lexical_ranked[lexical_scores[lexical_ranked] > 0]
+
+        rrf_scores = np.zeros(len(chunks))
+        for ranked in (vector_ranked, lexical_ranked):
+            rrf_scores[ranked] += 1.0 / (
+                DatabaseConfig.HYBRID_RRF_K + np.arange(1, len(ranked) + 1)
+            )
+
+        top = np.argsort(-rrf_scores)[:limit]
+        results = []
+        for i in top[rrf_scores[top] > 0]:
+            chunk = {
+                **chunks[i],
+                "similarity": float(similarities[i]),
+                "rrf_score": float(rrf_scores[i]),
+            }
+            if include_embeddings:
+                chunk["embedding"] = matrix[i]
+            results.append(chunk)
+        return results
+
+    def get_all_chunks(self) -> List[Dict[str, Any]]:
+        chunks = self._load_chunks()
+        return sorted(
+            (
+                {
+                    "id": chunk["id"],
+                    "content": chunk["content"],
+                    "chunk_index": chunk["chunk_index"],
+                    "start_char": chunk.get("start_char"),
+                    "end_char": chunk.get("end_char"),
+                }
+                for chunk in chunks
+            ),
+            key=lambda chunk: chunk["chunk_index"],
+        )
+
+    def clear_all_chunks(self):
+        with self._lock:
+            previous = self.current_path.read_text().strip()
+            self._start_generation()
+            shutil.rmtree(self.path / previous, ignore_errors=True)
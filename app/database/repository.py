@@ -1,7 +1,12 @@
+import re
 from typing import List, Dict, Any
-from psycopg2.extras import Json
-import numpy as np
-from .connection import get_connection
+from .config import DatabaseConfig, validate_embedding_column
+from .connection import get_connection, apply_search_settings, use_exact_search
+
+COMPACT_DISTANCES = {
+    "halfvec": "{column}::halfvec({dimensions}) <=> {query}::halfvec({dimensions})",
+    "binary": "binary_quantize({column})::bit({dimensions}) <~> binary_quantize({query}::vector)",
+}
 
 
 class DocumentRepository:
@@ -11,17 +16,24 @@ class DocumentRepository:
         embedding: List[float],
         chunk_index: int,
         metadata: Dict = None,
+        embedding_column: str = "embedding",
+        start_char: int = None,
+        end_char: int = None,
     ):
+        from psycopg2.extras import Json
+
+        column = validate_embedding_column(embedding_column)
         conn = get_connection()
         cur = conn.cursor()
 
         cur.execute(
-            """
-            INSERT INTO document_chunks (content, embedding, chunk_index, metadata)
-            VALUES (%s, %s, %s, %s)
+            f"""
+            INSERT INTO document_chunks
+                (content, {column}, chunk_index, metadata, start_char, end_char)
+            VALUES (%s, %s, %s, %s, %s, %s)
             RETURNING id;
         """,
-            (content, embedding, chunk_index, Json(metadata)),
+            (content, embedding, chunk_index, Json(metadata), start_char, end_char),
         )
 
         chunk_id = cur.fetchone()["id"]
@@ -31,23 +43,308 @@ class DocumentRepository:
 
         return chunk_id
 
+    def insert_chunks_batch(
+        self,
+        chunks: List[Dict[str, Any]],
+        embedding_column: str = "embedding",
+        page_size: int = 500,
+    ) -> List[int]:
+        import numpy as np
+        from psycopg2.extras import Json, execute_values
+
+        if not chunks:
+            return []
+
+        column = validate_embedding_column(embedding_column)
+        conn = get_connection()
+        cur = conn.cursor()
+
+        rows = execute_values(
+            cur,
+            f"""
+            INSERT INTO document_chunks
+                (content, {column}, chunk_index, metadata, start_char, end_char)
+            VALUES %s
+            RETURNING id;
+        """,
+            [
+                (
+                    chunk["content"],
+                    np.asarray(chunk["embedding"], dtype=np.float32),
+                    chunk["chunk_index"],
+                    Json(chunk.get("metadata")),
+                    chunk.get("start_char"),
+                    chunk.get("end_char"),
+                )
+                for chunk in chunks
+            ],
+            page_size=page_size,
+            fetch=True,
+        )
+
+        conn.commit()
+        cur.close()
+        conn.close()
+
+        return [row["id"] for row in rows]
+
+    def update_embeddings(
+        self,
+        chunk_ids: List[int],
+        embeddings: List[List[float]],
+        embedding_column: str = "embedding",
+    ):
+        import numpy as np
+        from psycopg2.extras import execute_batch
+
+        column = validate_embedding_column(embedding_column)
+        conn = get_connection()
+        cur = conn.cursor()
+
+        execute_batch(
+            cur,
+            f"UPDATE document_chunks SET {column} = %s WHERE id = %s;",
+            [
+                (np.asarray(embedding, dtype=np.float32), chunk_id)
+                for chunk_id, embedding in zip(chunk_ids, embeddings)
+            ],
+        )
+
+        conn.commit()
+        cur.close()
+        conn.close()
+
     def search_similar_chunks(
-        self, query_embedding: List[float], limit: int = 5
+        self,
+        query_embedding: List[float],
+        limit: int = 5,
+        storage: str = None,
+        embedding_column: str = "embedding",
+        include_embeddings: bool = False,
+        probes: int = None,
+        ef_search: int = None,
+        exact: bool = None,
     ) -> List[Dict[str, Any]]:
+        import numpy as np
+
+        storage = storage or DatabaseConfig.VECTOR_STORAGE
+        column = validate_embedding_column(embedding_column)
+        extra_columns = (
+            f", {column}::real[] AS embedding" if include_embeddings else ""
+        )
+        candidates = limit * DatabaseConfig.RERANK_OVERSAMPLE
+        if storage != "full":
+            ef_search = max(ef_search or DatabaseConfig.HNSW_EF_SEARCH, candidates)
         conn = get_connection()
         cur = conn.cursor()
+        apply_search_settings(cur, probes, ef_search)
 
-        query_vec = np.array(query_embedding)
+        query_vec = np.asarray(query_embedding, dtype=np.float32)
 
-        cur.execute(
+        if storage == "full":
+            if exact is None:
+                exact = use_exact_search(cur)
+            order_by = "similarity DESC" if exact else f"{column} <=> %(query)s"
+            cur.execute(
+                f"""
+                SELECT id, content, chunk_index, metadata, start_char, end_char,
+                       1 - ({column} <=> %(query)s) as similarity{extra_columns}
+                FROM document_chunks
+                WHERE {column} IS NOT NULL
+                ORDER BY {order_by}
+                LIMIT %(limit)s;
+            """,
+                {"query": query_vec, "limit": limit},
+            )
+        else:
+            compact_distance = COMPACT_DISTANCES[storage].format(
+                column=column, dimensions=len(query_vec), query="%(query)s"
+            )
+            cur.execute(
+                f"""
+                SELECT id, content, chunk_index, metadata, start_char, end_char,
+                       1 - ({column} <=> %(query)s) as similarity{extra_columns}
+                FROM (
+                    SELECT id, content, chunk_index, metadata,
+                           start_char, end_char, {column}
+                    FROM document_chunks
+                    WHERE {column} IS NOT NULL
+                    ORDER BY {compact_distance}
+                    LIMIT %(candidates)s
+                ) candidates
+                ORDER BY {column} <=> %(query)s
+                LIMIT %(limit)s;
+            """,
+                {"query": query_vec, "limit": limit, "candidates": candidates},
+            )
+
+        results = cur.fetchall()
+        cur.close()
+        conn.close()
+
+        return results
+
+    def search_similar_chunks_batch(
+        self,
+        query_embeddings: List[List[float]],
+        limit: int = 5,
+        storage: str = None,
+        embedding_column: str = "embedding",
+        probes: int = None,
+        ef_search: int = None,
+    ) -> List[List[Dict[str, Any]]]:
+        import numpy as np
+
+        if not query_embeddings:
+            return []
+
+        storage = storage or DatabaseConfig.VECTOR_STORAGE
+        column = validate_embedding_column(embedding_column)
+        query_vecs = [
+            np.asarray(embedding, dtype=np.float32) for embedding in query_embeddings
+        ]
+        candidate_count = limit * DatabaseConfig.RERANK_OVERSAMPLE
+        if storage != "full":
+            ef_search = max(ef_search or DatabaseConfig.HNSW_EF_SEARCH, candidate_count)
+
+        conn = get_connection()
+        cur = conn.cursor()
+        apply_search_settings(cur, probes, ef_search)
+
+        if storage == "full":
+            order_by = (
+                f"1 - ({column} <=> q.query) DESC"
+                if use_exact_search(cur)
+                else f"{column} <=> q.query"
+            )
+            candidates = f"""
+                SELECT id, content, chunk_index, metadata, start_char, end_char,
+                       1 - ({column} <=> q.query) as similarity
+                FROM document_chunks
+                WHERE {column} IS NOT NULL
+                ORDER BY {order_by}
+                LIMIT %(limit)s
             """
-            SELECT id, content, chunk_index, metadata,
-                   1 - (embedding <=> %s) as similarity
-            FROM document_chunks
-            ORDER BY similarity DESC
-            LIMIT %s;
+        else:
+            compact_distance = COMPACT_DISTANCES[storage].format(
+                column=column, dimensions=len(query_vecs[0]), query="q.query"
+            )
+            candidates = f"""
+                SELECT id, content, chunk_index, metadata, start_char, end_char,
+                       1 - ({column} <=> q.query) as similarity
+                FROM (
+                    SELECT id, content, chunk_index, metadata,
+                           start_char, end_char, {column}
+                    FROM document_chunks
+                    WHERE {column} IS NOT NULL
+                    ORDER BY {compact_distance}
+                    LIMIT %(candidates)s
+                ) compact
+                ORDER BY {column} <=> q.query
+                LIMIT %(limit)s
+            """
+
+        cur.execute(
+            f"""
+            SELECT q.query_index, c.*
+            FROM unnest(%(queries)s::vector[]) WITH ORDINALITY AS q(query, query_index)
+            CROSS JOIN LATERAL ({candidates}) c
+            ORDER BY q.query_index, c.similarity DESC;
+        """,
+            {
+                "queries": query_vecs,
+                "limit": limit,
+                "candidates": candidate_count,
+            },
+        )
+
+        results = [[] for _ in query_vecs]
+        for row in cur.fetchall():
+            query_index = row.pop("query_index")
+            results[query_index - 1].append(row)
+
+        cur.close()
+        conn.close()
+
+        return results
+
+    def search_hybrid_chunks(
+        self,
+        query_text: str,
+        query_embedding: List[float],
+        limit: int = 5,
+        embedding_column: str = "embedding",
+        include_embeddings: bool = False,
+        probes: int = None,
+        ef_search: int = None,
+        exact: bool = None,
+    ) -> List[Dict[str, Any]]:
+        import numpy as np
+
+        column = validate_embedding_column(embedding_column)
+        extra_columns = (
+            f", d.{column}::real[] AS embedding" if include_embeddings else ""
+        )
+        candidates = max(limit, DatabaseConfig.HYBRID_CANDIDATES)
+        ef_search = max(ef_search or DatabaseConfig.HNSW_EF_SEARCH, candidates)
+        conn = get_connection()
+        cur = conn.cursor()
+        apply_search_settings(cur, probes, ef_search)
+        if exact is None:
+            exact = use_exact_search(cur)
+        nearest_order = (
+            f"1 - ({column} <=> %(query)s) DESC" if exact else f"{column} <=> %(query)s"
+        )
+
+        query_vec = np.asarray(query_embedding, dtype=np.float32)
+
+        cur.execute(
+            f"""
+            WITH vector_hits AS (
+                SELECT id, ROW_NUMBER() OVER (ORDER BY {column} <=> %(query)s) AS rank
+                FROM (
+                    SELECT id, {column}
+                    FROM document_chunks
+                    WHERE {column} IS NOT NULL
+                    ORDER BY {nearest_order}
+                    LIMIT %(candidates)s
+                ) nearest
+            ),
+            lexical_hits AS (
+                SELECT id,
+                       ROW_NUMBER() OVER (
+                           ORDER BY ts_rank_cd(content_tsv, terms) DESC
+                       ) AS rank
+                FROM document_chunks, to_tsquery('english', %(terms)s) terms
+                WHERE content_tsv @@ terms
+                ORDER BY ts_rank_cd(content_tsv, terms) DESC
+                LIMIT %(candidates)s
+            ),
+            fused AS (
+                SELECT id, SUM(1.0 / (%(rrf_k)s + rank)) AS rrf_score
+                FROM (
+                    SELECT id, rank FROM vector_hits
+                    UNION ALL
+                    SELECT id, rank FROM lexical_hits
+                ) hits
+                GROUP BY id
+            )
+            SELECT d.id, d.content, d.chunk_index, d.metadata,
+                   d.start_char, d.end_char,
+                   1 - (d.{column} <=> %(query)s) as similarity,
+                   f.rrf_score{extra_columns}
+            FROM fused f
+            JOIN document_chunks d ON d.id = f.id
+            ORDER BY f.rrf_score DESC
+            LIMIT %(limit)s;
         """,
-            (query_vec, limit),
+            {
+                "query": query_vec,
+                "terms": " | ".join(re.findall(r"[^\W_]+", query_text)),
+                "limit": limit,
+                "candidates": candidates,
+                "rrf_k": DatabaseConfig.HYBRID_RRF_K,
+            },
         )
 
         results = cur.fetchall()
@@ -61,7 +358,11 @@ class DocumentRepository:
         cur = conn.cursor()
 
         cur.execute(
-            "SELECT id, content, chunk_index FROM document_chunks ORDER BY chunk_index;"
+            """
+            SELECT id, content, chunk_index, start_char, end_char
+            FROM document_chunks
+            ORDER BY chunk_index;
+        """
         )
         results = cur.fetchall()
 
@@ -79,3 +380,11 @@ class DocumentRepository:
 
         cur.close()
         conn.close()
+
+
+def get_document_repository():
+    if DatabaseConfig.VECTOR_BACKEND == "numpy":
+        from .numpy_repository import NumpyDocumentRepository
+
+        return NumpyDocumentRepository()
+    return DocumentRepository()
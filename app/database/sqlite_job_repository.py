@@ -0,0 +1,207 @@
+import os
+import uuid
+import json
+import sqlite3
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Tuple
+
+JOB_COLUMNS = """
+    id, kind, status, idempotency_key, params, result, error, attempts,
+    created_at, started_at, finished_at
+"""
+
+
+def _now(offset_seconds: float = 0.0) -> str:
+    moment = datetime.now(timezone.utc) + timedelta(seconds=offset_seconds)
+    return moment.isoformat(timespec="microseconds")
+
+
+def _decode(row: sqlite3.Row | None) -> Dict | None:
+    if row is None:
+        return None
+    job = dict(row)
+    for key in ("params", "result"):
+        if job[key] is not None:
+            job[key] = json.loads(job[key])
+    return job
+
+
+class SQLiteJobRepository:
+    def __init__(self, path: str = None):
+        directory = Path(os.getenv("VECTOR_STORE_PATH", "data/vector_store"))
+        self.path = Path(path) if path else directory / "jobs.db"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL;")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'queued',
+                idempotency_key TEXT UNIQUE,
+                params TEXT,
+                result TEXT,
+                error TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lease_expires_at TEXT,
+                created_at TEXT NOT NULL,
+                started_at TEXT,
+                finished_at TEXT
+            );
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS jobs_status_created_idx
+            ON jobs (status, created_at);
+        """)
+        conn.commit()
+        conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def create_job(
+        self, kind: str, params: Dict = None, idempotency_key: str = None
+    ) -> Tuple[Dict, bool]:
+        conn = self._connect()
+        job_id = uuid.uuid4().hex
+        cursor = conn.execute(
+            """
+            INSERT INTO jobs (id, kind, idempotency_key, params, created_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (idempotency_key) DO NOTHING;
+        """,
+            (job_id, kind, idempotency_key, json.dumps(params or {}), _now()),
+        )
+        created = cursor.rowcount == 1
+
+        if created:
+            row = conn.execute(
+                f"SELECT {JOB_COLUMNS} FROM jobs WHERE id = ?;", (job_id,)
+            ).fetchone()
+        else:
+            row = conn.execute(
+                f"SELECT {JOB_COLUMNS} FROM jobs WHERE idempotency_key = ?;",
+                (idempotency_key,),
+            ).fetchone()
+        conn.close()
+
+        return _decode(row), created
+
+    def get_job(self, job_id: str) -> Dict | None:
+        conn = self._connect()
+        row = conn.execute(
+            f"SELECT {JOB_COLUMNS} FROM jobs WHERE id = ?;", (job_id,)
+        ).fetchone()
+        conn.close()
+        return _decode(row)
+
+    def claim_next_job(self, lease_seconds: float) -> Dict | None:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE;")
+        row = conn.execute("""
+            SELECT id FROM jobs
+            WHERE status = 'queued'
+            ORDER BY created_at
+            LIMIT 1;
+        """).fetchone()
+
+        job = None
+        if row is not None:
+            conn.execute(
+                """
+                UPDATE jobs
+                SET status = 'running', attempts = attempts + 1,
+                    started_at = ?, lease_expires_at = ?
+                WHERE id = ?;
+            """,
+                (_now(), _now(lease_seconds), row["id"]),
+            )
+            job = conn.execute(
+                f"SELECT {JOB_COLUMNS} FROM jobs WHERE id = ?;", (row["id"],)
+            ).fetchone()
+        conn.execute("COMMIT;")
+        conn.close()
+
+        return _decode(job)
+
+    def complete_job(self, job_id: str, attempts: int, result: Dict):
+        conn = self._connect()
+        conn.execute(
+            """
+            UPDATE jobs
+            SET status = 'succeeded', result = ?, error = NULL,
+                finished_at = ?, lease_expires_at = NULL
+            WHERE id = ? AND status = 'running' AND attempts = ?;
+        """,
+            (json.dumps(result), _now(), job_id, attempts),
+        )
+        conn.close()
+
+    def fail_job(self, job_id: str, attempts: int, error: str, retry: bool = False):
+        conn = self._connect()
+        conn.execute(
+            """
+            UPDATE jobs
+            SET status = ?, error = ?, lease_expires_at = NULL, finished_at = ?
+            WHERE id = ? AND status = 'running' AND attempts = ?;
+        """,
+            (
+                "queued" if retry else "failed",
+                error,
+                None if retry else _now(),
+                job_id,
+                attempts,
+            ),
+        )
+        conn.close()
+
+    def renew_lease(self, job_id: str, attempts: int, lease_seconds: float) -> bool:
+        conn = self._connect()
+        cursor = conn.execute(
+            """
+            UPDATE jobs
+            SET lease_expires_at = ?
+            WHERE id = ? AND status = 'running' AND attempts = ?;
+        """,
+            (_now(lease_seconds), job_id, attempts),
+        )
+        renewed = cursor.rowcount == 1
+        conn.close()
+        return renewed
+
+    def requeue_job(self, job_id: str, attempts: int) -> bool:
+        conn = self._connect()
+        cursor = conn.execute(
+            """
+            UPDATE jobs
+            SET status = 'queued', lease_expires_at = NULL,
+                error = 'Worker stopped before completion'
+            WHERE id = ? AND status = 'running' AND attempts = ?;
+        """,
+            (job_id, attempts),
+        )
+        requeued = cursor.rowcount == 1
+        conn.close()
+        return requeued
+
+    def recover_expired_jobs(self, max_attempts: int) -> int:
+        conn = self._connect()
+        now = _now()
+        cursor = conn.execute(
+            """
+            UPDATE jobs
+            SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'queued' END,
+                finished_at = CASE WHEN attempts >= ? THEN ? ELSE NULL END,
+                error = 'Job lease expired before completion',
+                lease_expires_at = NULL
+            WHERE status = 'running' AND lease_expires_at < ?;
+        """,
+            (max_attempts, max_attempts, now, now),
+        )
+        recovered = cursor.rowcount
+        conn.close()
+        return recovered
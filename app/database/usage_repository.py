@@ -0,0 +1,51 @@
+from typing import List, Dict
+from psycopg2.extras import execute_values
+from .connection import get_connection
+
+
+class UsageRepository:
+    def insert_usage_batch(self, entries: List[Dict]):
+        conn = get_connection()
+        cur = conn.cursor()
+
+        execute_values(
+            cur,
+            """
+            INSERT INTO token_usage
+                (request_id, endpoint, workflow, model, kind, tokens)
+            VALUES %s;
+        """,
+            [
+                (
+                    entry["request_id"],
+                    entry["endpoint"],
+                    entry["workflow"],
+                    entry["model"],
+                    entry["kind"],
+                    entry["tokens"],
+                )
+                for entry in entries
+            ],
+        )
+
+        conn.commit()
+        cur.close()
+        conn.close()
+
+    def get_usage_by_endpoint(self) -> List[Dict]:
+        conn = get_connection()
+        cur = conn.cursor()
+
+        cur.execute("""
+            SELECT endpoint, workflow, kind, SUM(tokens) AS tokens,
+                   COUNT(DISTINCT request_id) AS requests
+            FROM token_usage
+            GROUP BY endpoint, workflow, kind
+            ORDER BY endpoint, workflow, kind;
+        """)
+        results = cur.fetchall()
+
+        cur.close()
+        conn.close()
+
+        return results
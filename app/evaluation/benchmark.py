@@ -6,22 +6,46 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 import time
 import json
-from typing import List, Dict, Any
+import argparse
+import itertools
+import platform
+from typing import Dict, Any, List
 from dotenv import load_dotenv
-from openai import OpenAI
 
+from fastapi.testclient import TestClient
+
+from app.api.main import app
 from app.services.chunking import ChunkingService
 from app.services.embedding import EmbeddingService
-from app.database.repository import DocumentRepository
+from app.services.prompt_manager import PromptManager
+from app.database.repository import get_document_repository
+from app.evaluation.timing import measure
+from app.evaluation.openai_standin import start_standin_server
 
 load_dotenv()
 
+HOT_PATHS = ("chunking", "prompt_render", "search", "qa")
+
+
+class BenchmarkSuite:
+    def __init__(
+        self,
+        iterations: int = 50,
+        warmup: int = 5,
+        document_path: str = "data/market_research_report.txt",
+    ):
+        self.iterations = iterations
+        self.warmup = warmup
+        self.chunker = ChunkingService(
+            chunk_size=int(os.getenv("CHUNK_SIZE", 250)),
+            chunk_overlap=int(os.getenv("CHUNK_OVERLAP", 50)),
+        )
+        self.embedder = EmbeddingService()
+        self.repo = get_document_repository()
+
+        with open(document_path, "r") as f:
+            self.document_text = f.read()
 
-class EmbeddingBenchmark:
-    def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.repo = DocumentRepository()
-        self.embedding_service = EmbeddingService()
         self.test_queries = [
             "What is Innovate Inc's market share?",
             "Who are the main competitors?",
@@ -30,192 +54,202 @@ class EmbeddingBenchmark:
             "What is the projected market growth?",
         ]
 
-    def benchmark_embedding_model(
-        self, model_name: str, queries: List[str]
-    ) -> Dict[str, Any]:
-        print(f"\n📊 Benchmarking embedding model: {model_name}")
-        print("-" * 60)
-
-        total_time = 0
-        total_tokens = 0
-        embeddings = []
-
-        embedding_service = EmbeddingService(model=model_name)
-
-        for query in queries:
-            start_time = time.time()
-            embedding = embedding_service.generate_embedding(query)
-            end_time = time.time()
-
-            total_time += end_time - start_time
-            embeddings.append(embedding)
+    def ensure_corpus(self):
+        if self.repo.get_all_chunks():
+            return
 
-        avg_time = total_time / len(queries)
-        dimensions = len(embeddings[0]) if embeddings else 0
-
-        result = {
-            "model": model_name,
-            "queries_tested": len(queries),
-            "total_time_seconds": round(total_time, 3),
-            "avg_time_per_query_seconds": round(avg_time, 3),
-            "embedding_dimensions": dimensions,
-        }
-
-        print(f"  Queries tested: {result['queries_tested']}")
-        print(f"  Total time: {result['total_time_seconds']}s")
-        print(f"  Avg time per query: {result['avg_time_per_query_seconds']}s")
-        print(f"  Embedding dimensions: {result['embedding_dimensions']}")
-
-        return result
-
-    def benchmark_chunking_strategy(
-        self, chunk_size: int, chunk_overlap: int, document_path: str
-    ) -> Dict[str, Any]:
-        print(f"\n📊 Benchmarking chunking: size={chunk_size}, overlap={chunk_overlap}")
-        print("-" * 60)
-
-        with open(document_path, "r") as f:
-            text = f.read()
-
-        chunking_service = ChunkingService(
-            chunk_size=chunk_size, chunk_overlap=chunk_overlap
+        print("📥 Ingesting benchmark corpus")
+        spans = self.chunker.chunk_text_with_offsets(self.document_text)
+        embeddings = self.embedder.generate_embeddings_batch(
+            [span["content"] for span in spans]
         )
+        for i, (span, embedding) in enumerate(zip(spans, embeddings)):
+            self.repo.insert_chunk(
+                span["content"],
+                embedding,
+                i,
+                embedding_column=self.embedder.column,
+                start_char=span["start_char"],
+                end_char=span["end_char"],
+            )
 
-        start_time = time.time()
-        chunks = chunking_service.chunk_text(text)
-        end_time = time.time()
-
-        total_chars = sum(len(chunk) for chunk in chunks)
-        avg_chunk_size = total_chars / len(chunks) if chunks else 0
-
-        result = {
-            "chunk_size": chunk_size,
-            "chunk_overlap": chunk_overlap,
-            "num_chunks": len(chunks),
-            "total_characters": total_chars,
-            "avg_chunk_characters": round(avg_chunk_size, 2),
-            "processing_time_seconds": round(end_time - start_time, 3),
-        }
-
-        print(f"  Number of chunks: {result['num_chunks']}")
-        print(f"  Total characters: {result['total_characters']}")
-        print(f"  Avg chunk size: {result['avg_chunk_characters']} chars")
-        print(f"  Processing time: {result['processing_time_seconds']}s")
-
-        return result
-
-    def benchmark_retrieval_topk(
-        self, query: str, k_values: List[int]
-    ) -> Dict[str, Any]:
-        print(f"\n📊 Benchmarking retrieval with different top-k values")
+    def _run(self, name: str, fn) -> Dict[str, Any]:
+        print(f"\n📊 Benchmarking: {name}")
         print("-" * 60)
-        print(f"Query: {query}")
 
-        query_embedding = self.embedding_service.generate_embedding(query)
-        results = {}
+        latency = measure(fn, iterations=self.iterations, warmup=self.warmup)
 
-        for k in k_values:
-            start_time = time.time()
-            chunks = self.repo.search_similar_chunks(query_embedding, limit=k)
-            end_time = time.time()
+        print(f"  p50 latency: {latency['p50_ms']}ms")
+        print(f"  p95 latency: {latency['p95_ms']}ms")
+        print(f"  p99 latency: {latency['p99_ms']}ms")
+        print(f"  Throughput: {latency['throughput_per_second']}/s")
 
-            avg_similarity = (
-                sum(chunk["similarity"] for chunk in chunks) / len(chunks)
-                if chunks
-                else 0
-            )
+        return latency
 
-            results[f"top_{k}"] = {
-                "k": k,
-                "chunks_retrieved": len(chunks),
-                "avg_similarity": round(avg_similarity, 4),
-                "retrieval_time_seconds": round(end_time - start_time, 3),
-            }
+    def benchmark_chunking(self) -> Dict[str, Any]:
+        return self._run(
+            "chunking",
+            lambda: self.chunker.chunk_text_with_offsets(self.document_text),
+        )
 
-            print(f"\n  Top-{k}:")
-            print(f"    Chunks retrieved: {len(chunks)}")
-            print(f"    Avg similarity: {round(avg_similarity, 4)}")
-            print(f"    Retrieval time: {round(end_time - start_time, 3)}s")
+    def benchmark_prompt_render(self) -> Dict[str, Any]:
+        PromptManager.load_all()
+        context = self.document_text[:2000]
+        queries = itertools.cycle(self.test_queries)
 
-        return results
+        return self._run(
+            "prompt_render",
+            lambda: PromptManager.get_prompt(
+                "qa_user", question=next(queries), context=context
+            ),
+        )
 
+    def benchmark_search(self) -> Dict[str, Any]:
+        self.ensure_corpus()
+        embeddings = itertools.cycle(
+            self.embedder.generate_embeddings_batch(self.test_queries)
+        )
 
-def run_full_benchmark():
-    print("=" * 80)
-    print("🚀 AI MARKET ANALYST - COMPREHENSIVE BENCHMARK")
-    print("=" * 80)
+        return self._run(
+            "search",
+            lambda: self.repo.search_similar_chunks(
+                next(embeddings), limit=3, embedding_column=self.embedder.column
+            ),
+        )
 
-    benchmark = EmbeddingBenchmark()
-    results = {"timestamp": time.strftime("%Y-%m-%d %H:%M:%S"), "benchmarks": {}}
+    def benchmark_qa(self) -> Dict[str, Any]:
+        self.ensure_corpus()
+        queries = itertools.cycle(self.test_queries)
 
-    print("\n" + "=" * 80)
-    print("1️⃣  EMBEDDING MODEL COMPARISON")
-    print("=" * 80)
+        with TestClient(app) as client:
 
-    embedding_models = ["text-embedding-3-small", "text-embedding-3-large"]
-    embedding_results = []
+            def ask():
+                response = client.post(
+                    "/qa",
+                    json={"query": next(queries), "top_k": 3},
+                    headers={"x-llm-cache-bypass": "1"},
+                )
+                response.raise_for_status()
 
-    for model in embedding_models:
-        try:
-            result = benchmark.benchmark_embedding_model(model, benchmark.test_queries)
-            embedding_results.append(result)
-        except Exception as e:
-            print(f"  ❌ Error with {model}: {str(e)}")
+            return self._run("qa", ask)
 
-    results["benchmarks"]["embedding_models"] = embedding_results
+
+def compare_to_baseline(
+    results: Dict[str, Any], baseline: Dict[str, Any], metric: str, threshold: float
+) -> List[Dict[str, Any]]:
+    regressions = []
 
     print("\n" + "=" * 80)
-    print("2️⃣  CHUNKING STRATEGY COMPARISON")
+    print(f"📈 BASELINE COMPARISON ({metric}, threshold {threshold:.0%})")
     print("=" * 80)
 
-    chunking_strategies = [
-        {"chunk_size": 250, "chunk_overlap": 50},
-        {"chunk_size": 500, "chunk_overlap": 100},
-        {"chunk_size": 150, "chunk_overlap": 30},
-    ]
-
-    chunking_results = []
-    document_path = "data/market_research_report.txt"
+    for name, latency in results["hot_paths"].items():
+        previous = baseline.get("hot_paths", {}).get(name)
+        if not previous:
+            print(f"  {name}: no baseline")
+            continue
+
+        change = latency[metric] / previous[metric] - 1 if previous[metric] else 0.0
+        regressed = change > threshold
+        status = "❌ REGRESSION" if regressed else "✅"
+        print(
+            f"  {name}: {previous[metric]}ms -> {latency[metric]}ms "
+            f"({change:+.1%}) {status}"
+        )
 
-    for strategy in chunking_strategies:
-        try:
-            result = benchmark.benchmark_chunking_strategy(
-                strategy["chunk_size"], strategy["chunk_overlap"], document_path
+        if regressed:
+            regressions.append(
+                {
+                    "hot_path": name,
+                    "baseline_ms": previous[metric],
+                    "current_ms": latency[metric],
+                    "change": round(change, 4),
+                }
             )
-            chunking_results.append(result)
-        except Exception as e:
-            print(f"  ❌ Error: {str(e)}")
 
-    results["benchmarks"]["chunking_strategies"] = chunking_results
+    return regressions
 
-    print("\n" + "=" * 80)
-    print("3️⃣  RETRIEVAL TOP-K COMPARISON")
-    print("=" * 80)
 
-    k_values = [1, 3, 5, 10]
-    test_query = "What is Innovate Inc's market share?"
+def run_benchmark_suite(
+    hot_paths: List[str],
+    iterations: int,
+    warmup: int,
+    output_file: str = "benchmark_results.json",
+    baseline_file: str = None,
+    metric: str = "p50_ms",
+    threshold: float = 0.2,
+) -> int:
+    print("=" * 80)
+    print("🚀 AI MARKET ANALYST - BENCHMARK SUITE")
+    print("=" * 80)
 
-    try:
-        topk_results = benchmark.benchmark_retrieval_topk(test_query, k_values)
-        results["benchmarks"]["topk_retrieval"] = topk_results
-    except Exception as e:
-        print(f"  ❌ Error: {str(e)}")
+    if not os.getenv("OPENAI_BASE_URL"):
+        server = start_standin_server()
+        host, port = server.config.host, server.config.port
+        os.environ["OPENAI_BASE_URL"] = f"http://{host}:{port}/v1"
+        os.environ["OPENAI_API_KEY"] = "standin"
+        print(f"🧪 OpenAI stand-in listening on {os.environ['OPENAI_BASE_URL']}")
+
+    suite = BenchmarkSuite(iterations=iterations, warmup=warmup)
+    results = {
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "vector_backend": os.getenv("VECTOR_BACKEND", "postgres"),
+            "openai_base_url": os.getenv("OPENAI_BASE_URL"),
+        },
+        "iterations": iterations,
+        "warmup": warmup,
+        "hot_paths": {},
+    }
+
+    for name in hot_paths:
+        results["hot_paths"][name] = getattr(suite, f"benchmark_{name}")()
+
+    exit_code = 0
+    if baseline_file:
+        with open(baseline_file, "r") as f:
+            baseline = json.load(f)
+        results["regressions"] = compare_to_baseline(
+            results, baseline, metric, threshold
+        )
+        exit_code = 1 if results["regressions"] else 0
 
-    output_file = "evaluation_results.json"
     with open(output_file, "w") as f:
         json.dump(results, f, indent=2)
 
     print("\n" + "=" * 80)
-    print("✅ BENCHMARK COMPLETE")
+    print("✅ BENCHMARK COMPLETE" if exit_code == 0 else "❌ REGRESSIONS DETECTED")
     print("=" * 80)
     print(f"\n📄 Results saved to: {output_file}")
-    print("\n💡 Next steps:")
-    print("  1. Review evaluation_results.json")
-    print("  2. Check EVALUATION.md for analysis")
-    print("  3. Compare metrics across different configurations")
 
-    return results
+    return exit_code
 
 
 if __name__ == "__main__":
-    run_full_benchmark()
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--only", nargs="+", choices=HOT_PATHS, default=list(HOT_PATHS)
+    )
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline")
+    parser.add_argument(
+        "--metric", choices=["p50_ms", "p95_ms", "p99_ms"], default="p50_ms"
+    )
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    sys.exit(
+        run_benchmark_suite(
+            args.only,
+            args.iterations,
+            args.warmup,
+            output_file=args.output,
+            baseline_file=args.baseline,
+            metric=args.metric,
+            threshold=args.threshold,
+        )
+    )
@@ -0,0 +1,169 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import os
+import time
+import json
+import argparse
+import resource
+import tempfile
+import subprocess
+from typing import Dict, Any
+
+from app.services.chunking import ChunkingService
+
+SOURCE_DOCUMENT = (
+    Path(__file__).parent.parent.parent / "data" / "market_research_report.txt"
+)
+CHUNKING_MODES = ("in_memory", "streaming")
+
+
+def build_input_file(path: str, size_mb: int):
+    source = SOURCE_DOCUMENT.read_text()
+    target_bytes = size_mb * 1024 * 1024
+    written = 0
+    with open(path, "w") as f:
+        while written < target_bytes:
+            f.write(source)
+            f.write("\n\n")
+            written += len(source) + 2
+
+
+def run_mode(mode: str, path: str) -> Dict[str, Any]:
+    chunker = ChunkingService()
+    start_time = time.perf_counter()
+
+    if mode == "in_memory":
+        with open(path, "r") as f:
+            num_chunks = len(chunker.chunk_text(f.read()))
+    else:
+        num_chunks = sum(1 for _ in chunker.chunk_file(path))
+
+    elapsed = time.perf_counter() - start_time
+    size_mb = os.path.getsize(path) / 1024 / 1024
+
+    return {
+        "mode": mode,
+        "input_mb": round(size_mb, 2),
+        "num_chunks": num_chunks,
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_mb_per_second": round(size_mb / elapsed, 2),
+        "peak_rss_mb": round(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1
+        ),
+    }
+
+
+def benchmark_mode(mode: str, path: str) -> Dict[str, Any]:
+    completed = subprocess.run(
+        [sys.executable, __file__, "--worker", mode, path],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def run_chunking_benchmark(
+    sizes_mb=(10, 50, 200), output_file: str = "chunking_results.json"
+):
+    print("=" * 80)
+    print("🚀 STREAMING VS IN-MEMORY CHUNKING")
+    print("=" * 80)
+
+    results = {"timestamp": time.strftime("%Y-%m-%d %H:%M:%S"), "runs": []}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size_mb in sizes_mb:
+            path = os.path.join(tmp_dir, f"corpus_{size_mb}mb.txt")
+            build_input_file(path, size_mb)
+
+            print(f"\n📊 Input size: {size_mb} MB")
+            print("-" * 60)
+            for mode in CHUNKING_MODES:
+                result = benchmark_mode(mode, path)
+                results["runs"].append(result)
+                print(
+                    f"  {mode:<10} {result['throughput_mb_per_second']:>8} MB/s"
+                    f"  peak RSS {result['peak_rss_mb']:>8} MB"
+                    f"  ({result['num_chunks']} chunks)"
+                )
+
+    with open(output_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\n📄 Results saved to: {output_file}")
+    return results
+
+
+def run_parallel_scaling_benchmark(
+    num_documents: int = 2000,
+    max_workers: int = None,
+    output_file: str = "chunking_scaling_results.json",
+):
+    print("=" * 80)
+    print("🚀 PARALLEL CHUNKING SCALING")
+    print("=" * 80)
+
+    source = SOURCE_DOCUMENT.read_text()
+    documents = [f"Filing {i}\n\n{source}" for i in range(num_documents)]
+    total_mb = sum(len(document) for document in documents) / 1024 / 1024
+    max_workers = max_workers or os.cpu_count() or 1
+
+    chunker = ChunkingService()
+    results = {
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "num_documents": num_documents,
+        "input_mb": round(total_mb, 2),
+        "runs": [],
+    }
+
+    print(f"\n📊 {num_documents} documents, {total_mb:.2f} MB")
+    print("-" * 60)
+    baseline_seconds = None
+    for workers in range(1, max_workers + 1):
+        start_time = time.perf_counter()
+        num_chunks = sum(
+            len(chunks)
+            for chunks in chunker.chunk_documents_parallel(documents, workers)
+        )
+        elapsed = time.perf_counter() - start_time
+        baseline_seconds = baseline_seconds or elapsed
+
+        run = {
+            "workers": workers,
+            "num_chunks": num_chunks,
+            "elapsed_seconds": round(elapsed, 3),
+            "documents_per_second": round(num_documents / elapsed, 1),
+            "speedup": round(baseline_seconds / elapsed, 2),
+        }
+        results["runs"].append(run)
+        print(
+            f"  {workers:>3} workers  {run['documents_per_second']:>9} docs/s"
+            f"  speedup {run['speedup']}x"
+        )
+
+    with open(output_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\n📄 Results saved to: {output_file}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Chunking throughput and memory")
+    parser.add_argument("--worker", nargs=2, metavar=("MODE", "PATH"))
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--scaling", action="store_true")
+    parser.add_argument("--documents", type=int, default=2000)
+    parser.add_argument("--max-workers", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_mode(*args.worker)))
+    elif args.scaling:
+        run_parallel_scaling_benchmark(args.documents, args.max_workers)
+    else:
+        run_chunking_benchmark(sizes_mb=args.sizes)
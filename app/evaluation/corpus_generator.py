@@ -0,0 +1,170 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import random
+import argparse
+from typing import Iterator
+
+COMPANY_PREFIXES = [
+    "Innovate",
+    "Synergy",
+    "Future",
+    "Quantum",
+    "Apex",
+    "Nimbus",
+    "Vertex",
+    "Helio",
+    "Stratus",
+    "Cobalt",
+    "Lumen",
+    "Orbit",
+    "Pinnacle",
+    "Summit",
+    "Vector",
+    "Zenith",
+]
+COMPANY_SUFFIXES = ["Inc.", "Systems", "Labs", "Analytics", "Technologies", "Group"]
+PRODUCT_NAMES = ["Pro", "Cloud", "Edge", "Flow", "Insight", "Pulse", "Core", "One"]
+SECTORS = [
+    "AI workflow automation",
+    "supply chain analytics",
+    "cybersecurity",
+    "fintech",
+    "digital health",
+    "industrial IoT",
+    "customer data platforms",
+    "edge computing",
+    "document intelligence",
+    "robotic process automation",
+]
+VERTICALS = [
+    "logistics",
+    "healthcare",
+    "finance",
+    "retail",
+    "manufacturing",
+    "energy",
+    "insurance",
+    "public sector",
+    "telecommunications",
+    "education",
+]
+DRIVERS = [
+    "the need for increased efficiency",
+    "reduced operational costs",
+    "stricter regulatory requirements",
+    "the shift to cloud-native infrastructure",
+    "growing volumes of unstructured data",
+    "labor shortages in operations teams",
+    "demand for real-time decision making",
+]
+STRENGTHS = [
+    "robust and scalable architecture",
+    "strong customer loyalty",
+    "a broad partner ecosystem",
+    "best-in-class support",
+    "deep domain expertise",
+    "a proven enterprise sales motion",
+]
+WEAKNESSES = [
+    "slower feature rollout compared to competitors",
+    "a higher price point",
+    "limited international presence",
+    "dependence on a few large customers",
+    "a complex onboarding process",
+]
+THREATS = [
+    "aggressive pricing from incumbents",
+    "rapid innovation from well-funded startups",
+    "consolidation among large platform vendors",
+    "tightening enterprise IT budgets",
+    "new data residency regulations",
+]
+
+
+def company_name(rng: random.Random) -> str:
+    return f"{rng.choice(COMPANY_PREFIXES)} {rng.choice(COMPANY_SUFFIXES)}"
+
+
+def generate_report(rng: random.Random, report_id: int = 0) -> str:
+    company = company_name(rng)
+    rivals = rng.sample(
+        [prefix for prefix in COMPANY_PREFIXES if not company.startswith(prefix)], 3
+    )
+    competitors = [f"{prefix} {rng.choice(COMPANY_SUFFIXES)}" for prefix in rivals]
+    sector = rng.choice(SECTORS)
+    vertical, expansion = rng.sample(VERTICALS, 2)
+    product = f"{company.split()[0]} {rng.choice(PRODUCT_NAMES)}"
+    quarter = f"Q{rng.randint(1, 4)} {rng.randint(2021, 2026)}"
+    market_size = rng.randint(2, 80)
+    cagr = rng.randint(5, 35)
+    horizon = rng.randint(2028, 2035)
+    shares = sorted(rng.sample(range(2, 30), 4), reverse=True)
+    rng.shuffle(shares)
+
+    sections = [
+        f"{company} Market Research Report {report_id} - {quarter}",
+        "1. Introduction\n"
+        f"{company} is a provider of enterprise {sector} software. Its flagship "
+        f'product, "{product}," has seen significant adoption in the {vertical} '
+        "sector. This report analyzes the company's current market position, "
+        "competitive landscape, and future growth opportunities.",
+        "2. Market Size and Growth\n"
+        f"The global market for {sector} is currently valued at approximately "
+        f"${market_size} billion. Projections estimate a compound annual growth "
+        f"rate (CAGR) of {cagr}% over the next five years, reaching a potential "
+        f"market size of over ${round(market_size * (1 + cagr / 100) ** 5)} billion "
+        f"by {horizon}. Key drivers include {rng.choice(DRIVERS)} and "
+        f"{rng.choice(DRIVERS)}.",
+        "3. Competitive Landscape\n"
+        f"{company} holds a {shares[0]}% market share. Its primary competitors are "
+        f'"{competitors[0]}" ({shares[1]}% market share) and "{competitors[1]}" '
+        f'({shares[2]}% market share). A notable emerging player is "{competitors[2]}," '
+        f"which, despite having only a {shares[3]}% market share, has secured "
+        f"${rng.randint(20, 400)} million in venture funding.",
+        "4. SWOT Analysis\n"
+        f"Strengths: {'; '.join(rng.sample(STRENGTHS, 2))}.\n"
+        f"Weaknesses: {'; '.join(rng.sample(WEAKNESSES, 2))}.\n"
+        f"Opportunities: Expansion into the {expansion} and "
+        f"{rng.choice(VERTICALS)} sectors.\n"
+        f"Threats: {'; '.join(rng.sample(THREATS, 2))}.",
+        "5. Conclusion\n"
+        f"{company} is positioned for growth but must address "
+        f"{rng.choice(WEAKNESSES)} to maintain its competitive edge. Expansion into "
+        f"{expansion} is a key strategic priority for {horizon}.",
+    ]
+    return "\n\n".join(sections)
+
+
+def generate_corpus(target_bytes: int, seed: int = 0) -> Iterator[str]:
+    rng = random.Random(seed)
+    written = 0
+    report_id = 0
+    while written < target_bytes:
+        report = generate_report(rng, report_id)
+        written += len(report.encode())
+        report_id += 1
+        yield report
+
+
+def write_corpus(path: str, size_mb: float, seed: int = 0) -> int:
+    reports = 0
+    with open(path, "w") as f:
+        for report in generate_corpus(int(size_mb * 1024 * 1024), seed):
+            f.write(report)
+            f.write("\n\n")
+            reports += 1
+    return reports
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic market reports")
+    parser.add_argument("output")
+    parser.add_argument("--size-mb", type=float, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    reports = write_corpus(args.output, args.size_mb, args.seed)
+    print(f"✅ Wrote {reports} reports ({args.size_mb} MB) to {args.output}")
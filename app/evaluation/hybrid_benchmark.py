@@ -0,0 +1,91 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import time
+import json
+import itertools
+from typing import List, Dict, Any
+from dotenv import load_dotenv
+
+from app.services.embedding import EmbeddingService
+from app.database.repository import get_document_repository
+from app.evaluation.timing import measure
+
+load_dotenv()
+
+
+class HybridSearchBenchmark:
+    def __init__(self, top_k: int = 3, iterations: int = 50):
+        self.embedder = EmbeddingService()
+        self.repo = get_document_repository()
+        self.top_k = top_k
+        self.iterations = iterations
+        self.test_queries = [
+            "What is Innovate Inc's market share?",
+            "Who are the main competitors?",
+            "FlowMind AI market share",
+            "What is the projected market size by 2030?",
+            "CAGR 2025 2030",
+        ]
+
+    def benchmark_mode(
+        self, search_mode: str, queries: List[str], embeddings: List[List[float]]
+    ) -> Dict[str, Any]:
+        print(f"\n📊 Benchmarking search mode: {search_mode}")
+        print("-" * 60)
+
+        pairs = itertools.cycle(zip(queries, embeddings))
+
+        def search():
+            query, embedding = next(pairs)
+            if search_mode == "hybrid":
+                return self.repo.search_hybrid_chunks(
+                    query,
+                    embedding,
+                    limit=self.top_k,
+                    embedding_column=self.embedder.column,
+                )
+            return self.repo.search_similar_chunks(
+                embedding, limit=self.top_k, embedding_column=self.embedder.column
+            )
+
+        latency = measure(search, iterations=self.iterations)
+
+        print(f"  p50 latency: {latency['p50_ms']}ms")
+        print(f"  p95 latency: {latency['p95_ms']}ms")
+        print(f"  p99 latency: {latency['p99_ms']}ms")
+
+        return {"search_mode": search_mode, "top_k": self.top_k, "latency": latency}
+
+
+def run_hybrid_benchmark(output_file: str = "hybrid_search_results.json"):
+    print("=" * 80)
+    print("🚀 HYBRID VS VECTOR SEARCH LATENCY")
+    print("=" * 80)
+
+    benchmark = HybridSearchBenchmark()
+    queries = benchmark.test_queries
+    embeddings = benchmark.embedder.generate_embeddings_batch(queries)
+
+    results = {"timestamp": time.strftime("%Y-%m-%d %H:%M:%S"), "modes": []}
+    for search_mode in ("vector", "hybrid"):
+        results["modes"].append(
+            benchmark.benchmark_mode(search_mode, queries, embeddings)
+        )
+
+    vector_p50 = results["modes"][0]["latency"]["p50_ms"]
+    hybrid_p50 = results["modes"][1]["latency"]["p50_ms"]
+    results["hybrid_overhead_p50_ms"] = round(hybrid_p50 - vector_p50, 4)
+    print(f"\n  Hybrid p50 overhead: {results['hybrid_overhead_p50_ms']}ms")
+
+    with open(output_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\n📄 Results saved to: {output_file}")
+    return results
+
+
+if __name__ == "__main__":
+    run_hybrid_benchmark()
@@ -0,0 +1,314 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import time
+import json
+import argparse
+from typing import List, Dict, Any
+import numpy as np
+import psycopg2
+from psycopg2.extras import execute_values
+from dotenv import load_dotenv
+
+from app.database.config import DatabaseConfig
+from app.database.connection import get_connection, init_database
+from app.database.repository import DocumentRepository
+from app.evaluation.timing import summarize_samples
+
+load_dotenv()
+
+
+def generate_corpus(
+    size: int, dimensions: int, clusters: int = 100, seed: int = 42
+) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dimensions)).astype(np.float32)
+    assignments = rng.integers(0, clusters, size)
+    vectors = centers[assignments] + 0.5 * rng.standard_normal(
+        (size, dimensions)
+    ).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def exact_neighbors(corpus: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    scores = queries @ corpus.T
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1)
+    return np.take_along_axis(top, order, axis=1)
+
+
+def ensure_benchmark_database(name: str):
+    if name == DatabaseConfig.NAME:
+        raise ValueError(
+            "The index sweep rewrites document_chunks; use a scratch database"
+        )
+
+    original_name = DatabaseConfig.NAME
+    DatabaseConfig.NAME = "postgres"
+    try:
+        conn = psycopg2.connect(DatabaseConfig.get_connection_string())
+        conn.autocommit = True
+        cur = conn.cursor()
+        cur.execute("SELECT 1 FROM pg_database WHERE datname = %s;", (name,))
+        if cur.fetchone() is None:
+            cur.execute(f'CREATE DATABASE "{name}";')
+        cur.close()
+        conn.close()
+    finally:
+        DatabaseConfig.NAME = original_name
+
+
+class IndexBenchmark:
+    def __init__(self, corpus: np.ndarray, queries: np.ndarray, top_k: int = 10):
+        self.repo = DocumentRepository()
+        self.corpus = corpus
+        self.queries = queries
+        self.top_k = top_k
+        self.dimensions = corpus.shape[1]
+        self.column = f"embedding_bench_{self.dimensions}"
+        self.index_name = f"{self.column}_sweep_idx"
+        self.row_ids = []
+
+    def load_corpus(self, batch_size: int = 1000):
+        print(f"📥 Loading {len(self.corpus)} vectors into {self.column}")
+        conn = get_connection()
+        cur = conn.cursor()
+
+        cur.execute("DELETE FROM document_chunks;")
+        cur.execute(
+            f"ALTER TABLE document_chunks ADD COLUMN IF NOT EXISTS {self.column} "
+            f"vector({self.dimensions});"
+        )
+        for start in range(0, len(self.corpus), batch_size):
+            batch = self.corpus[start : start + batch_size]
+            rows = execute_values(
+                cur,
+                f"""
+                INSERT INTO document_chunks (content, chunk_index, {self.column})
+                VALUES %s
+                RETURNING id;
+            """,
+                [
+                    (f"synthetic chunk {start + i}", start + i, vector)
+                    for i, vector in enumerate(batch)
+                ],
+                fetch=True,
+            )
+            self.row_ids.extend(row["id"] for row in rows)
+
+        cur.execute("ANALYZE document_chunks;")
+        conn.commit()
+        cur.close()
+        conn.close()
+
+    def build_index(self, method: str, params: Dict[str, int]) -> Dict[str, Any]:
+        conn = get_connection()
+        cur = conn.cursor()
+        cur.execute(f"DROP INDEX IF EXISTS {self.index_name};")
+
+        if method == "exact":
+            conn.commit()
+            cur.close()
+            conn.close()
+            return {"build_seconds": 0.0, "index_bytes": 0}
+
+        options = ", ".join(f"{key} = {int(value)}" for key, value in params.items())
+        start = time.perf_counter()
+        cur.execute(f"""
+            CREATE INDEX {self.index_name}
+            ON document_chunks
+            USING {method} ({self.column} vector_cosine_ops)
+            WITH ({options});
+        """)
+        conn.commit()
+        build_seconds = time.perf_counter() - start
+
+        cur.execute(
+            "SELECT pg_relation_size(%s::regclass) AS size;", (self.index_name,)
+        )
+        index_bytes = cur.fetchone()["size"]
+        cur.close()
+        conn.close()
+
+        return {"build_seconds": round(build_seconds, 3), "index_bytes": index_bytes}
+
+    def run_queries(self, ground_truth: np.ndarray, **search_params) -> Dict:
+        id_positions = {row_id: i for i, row_id in enumerate(self.row_ids)}
+        samples = []
+        hits = 0
+
+        for query, expected in zip(self.queries, ground_truth):
+            start = time.perf_counter()
+            results = self.repo.search_similar_chunks(
+                query,
+                limit=self.top_k,
+                storage="full",
+                embedding_column=self.column,
+                exact=False,
+                **search_params,
+            )
+            samples.append(time.perf_counter() - start)
+
+            found = {id_positions[row["id"]] for row in results}
+            hits += len(found & set(expected.tolist()))
+
+        latency = summarize_samples(samples)
+        return {
+            f"recall_at_{self.top_k}": round(hits / ground_truth.size, 4),
+            "qps": latency["throughput_per_second"],
+            "p50_ms": latency["p50_ms"],
+            "p99_ms": latency["p99_ms"],
+        }
+
+
+def sweep_settings(
+    lists: List[int], probes: List[int], m: List[int], ef_search: List[int]
+) -> List[Dict[str, Any]]:
+    settings = [{"method": "exact", "build": {}, "search": [{}]}]
+    for list_count in lists:
+        settings.append(
+            {
+                "method": "ivfflat",
+                "build": {"lists": list_count},
+                "search": [
+                    {"probes": probe} for probe in probes if probe <= list_count
+                ],
+            }
+        )
+    for connections in m:
+        settings.append(
+            {
+                "method": "hnsw",
+                "build": {"m": connections, "ef_construction": 64},
+                "search": [{"ef_search": ef} for ef in ef_search],
+            }
+        )
+    return settings
+
+
+def print_table(rows: List[Dict[str, Any]], top_k: int):
+    recall_key = f"recall_at_{top_k}"
+    header = (
+        f"{'method':<8} {'build params':<26} {'search':<16} "
+        f"{'recall@' + str(top_k):>9} {'QPS':>9} {'p99 ms':>9} "
+        f"{'build s':>9} {'index MB':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        build = ", ".join(f"{key}={value}" for key, value in row["build"].items())
+        search = ", ".join(f"{key}={value}" for key, value in row["search"].items())
+        print(
+            f"{row['method']:<8} {build or '-':<26} {search or '-':<16} "
+            f"{row[recall_key]:>9.4f} {row['qps']:>9.1f} {row['p99_ms']:>9.2f} "
+            f"{row['build_seconds']:>9.2f} {row['index_bytes'] / 2**20:>9.1f}"
+        )
+
+
+def run_index_benchmark(
+    corpus_size: int = 20000,
+    dimensions: int = 1536,
+    num_queries: int = 200,
+    top_k: int = 10,
+    embeddings_path: str = None,
+    database: str = "market_analyst_bench",
+    lists: List[int] = (50, 100, 200),
+    probes: List[int] = (1, 5, 10, 20, 50),
+    m: List[int] = (16, 32),
+    ef_search: List[int] = (20, 40, 80, 160, 320),
+    output_file: str = "index_benchmark_results.json",
+):
+    print("=" * 80)
+    print("🚀 VECTOR INDEX LATENCY VS RECALL SWEEP")
+    print("=" * 80)
+
+    if embeddings_path:
+        vectors = np.load(embeddings_path).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    else:
+        vectors = generate_corpus(corpus_size + num_queries, dimensions)
+    corpus, queries = vectors[:-num_queries], vectors[-num_queries:]
+
+    print(f"Corpus: {corpus.shape[0]} x {corpus.shape[1]}, queries: {len(queries)}")
+    ground_truth = exact_neighbors(corpus, queries, top_k)
+
+    ensure_benchmark_database(database)
+    original_name = DatabaseConfig.NAME
+    DatabaseConfig.NAME = database
+    try:
+        init_database()
+
+        benchmark = IndexBenchmark(corpus, queries, top_k=top_k)
+        benchmark.load_corpus()
+
+        rows = []
+        for setting in sweep_settings(lists, probes, m, ef_search):
+            print(f"\n📊 Building {setting['method']} {setting['build'] or ''}")
+            build = benchmark.build_index(setting["method"], setting["build"])
+
+            for search_params in setting["search"]:
+                result = benchmark.run_queries(ground_truth, **search_params)
+                rows.append(
+                    {
+                        "method": setting["method"],
+                        "build": setting["build"],
+                        "search": search_params,
+                        **result,
+                        **build,
+                    }
+                )
+                print(f"  {search_params or 'exact'}: {result}")
+
+        benchmark.build_index("exact", {})
+    finally:
+        DatabaseConfig.NAME = original_name
+
+    print("\n" + "=" * 80)
+    print_table(rows, top_k)
+
+    results = {
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "corpus_size": int(corpus.shape[0]),
+        "dimensions": int(corpus.shape[1]),
+        "num_queries": int(len(queries)),
+        "top_k": top_k,
+        "results": rows,
+    }
+
+    with open(output_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\n📄 Results saved to: {output_file}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus-size", type=int, default=20000)
+    parser.add_argument("--dimensions", type=int, default=1536)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--embeddings", help="Load corpus vectors from a .npy file")
+    parser.add_argument("--database", default="market_analyst_bench")
+    parser.add_argument("--lists", type=int, nargs="+", default=[50, 100, 200])
+    parser.add_argument("--probes", type=int, nargs="+", default=[1, 5, 10, 20, 50])
+    parser.add_argument("--m", type=int, nargs="+", default=[16, 32])
+    parser.add_argument(
+        "--ef-search", type=int, nargs="+", default=[20, 40, 80, 160, 320]
+    )
+    args = parser.parse_args()
+
+    run_index_benchmark(
+        corpus_size=args.corpus_size,
+        dimensions=args.dimensions,
+        num_queries=args.queries,
+        top_k=args.top_k,
+        embeddings_path=args.embeddings,
+        database=args.database,
+        lists=args.lists,
+        probes=args.probes,
+        m=args.m,
+        ef_search=args.ef_search,
+    )
@@ -0,0 +1,236 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import os
+import time
+import json
+import math
+import argparse
+import resource
+import tempfile
+import subprocess
+from typing import Dict, Any, List
+from dotenv import load_dotenv
+
+from app.services.chunking import ChunkingService
+from app.services.embedding import EmbeddingService
+from app.database.config import DatabaseConfig
+from app.database.connection import init_database
+from app.database.repository import get_document_repository
+from app.evaluation.corpus_generator import generate_corpus
+from app.evaluation.index_benchmark import ensure_benchmark_database
+from app.evaluation.openai_standin import start_standin_server
+
+load_dotenv()
+
+STAGES = ("chunk", "embed", "store")
+
+
+def run_pipeline(size_mb: float, batch_size: int, seed: int = 0) -> Dict[str, Any]:
+    chunker = ChunkingService(
+        chunk_size=int(os.getenv("CHUNK_SIZE", 250)),
+        chunk_overlap=int(os.getenv("CHUNK_OVERLAP", 50)),
+    )
+    embedder = EmbeddingService()
+    repo = get_document_repository()
+    repo.clear_all_chunks()
+
+    stage_seconds = dict.fromkeys(STAGES, 0.0)
+    input_bytes = 0
+    documents = 0
+    rows_written = 0
+    pending = []
+
+    def flush():
+        nonlocal rows_written
+        start = time.perf_counter()
+        embeddings = embedder.generate_embeddings_batch(
+            [chunk["content"] for chunk in pending], batch_size=batch_size
+        )
+        stage_seconds["embed"] += time.perf_counter() - start
+
+        for chunk, embedding in zip(pending, embeddings):
+            chunk["embedding"] = embedding
+
+        start = time.perf_counter()
+        rows_written += len(
+            repo.insert_chunks_batch(pending, embedding_column=embedder.column)
+        )
+        stage_seconds["store"] += time.perf_counter() - start
+        pending.clear()
+
+    start_time = time.perf_counter()
+    for document_index, document in enumerate(
+        generate_corpus(int(size_mb * 1024 * 1024), seed)
+    ):
+        start = time.perf_counter()
+        spans = chunker.chunk_text_with_offsets(document)
+        stage_seconds["chunk"] += time.perf_counter() - start
+
+        input_bytes += len(document.encode())
+        documents += 1
+        for i, span in enumerate(spans):
+            pending.append(
+                {
+                    **span,
+                    "chunk_index": i,
+                    "metadata": {"source": f"synthetic_report_{document_index}"},
+                }
+            )
+        if len(pending) >= batch_size:
+            flush()
+
+    if pending:
+        flush()
+    elapsed = time.perf_counter() - start_time
+
+    input_mb = input_bytes / 1024 / 1024
+    return {
+        "input_mb": round(input_mb, 2),
+        "documents": documents,
+        "chunks": rows_written,
+        "batch_size": batch_size,
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_mb_per_second": round(input_mb / elapsed, 3),
+        "chunks_per_second": round(rows_written / elapsed, 1),
+        "stages": {
+            name: {
+                "seconds": round(seconds, 3),
+                "share": round(seconds / elapsed, 3),
+                "chunks_per_second": (
+                    round(rows_written / seconds, 1) if seconds else None
+                ),
+            }
+            for name, seconds in stage_seconds.items()
+        },
+        "db_rows_per_second": (
+            round(rows_written / stage_seconds["store"], 1)
+            if stage_seconds["store"]
+            else None
+        ),
+        "peak_rss_mb": round(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1
+        ),
+    }
+
+
+def benchmark_size(size_mb: float, batch_size: int, env: Dict[str, str]) -> Dict:
+    completed = subprocess.run(
+        [
+            sys.executable,
+            __file__,
+            "--worker",
+            str(size_mb),
+            "--batch-size",
+            str(batch_size),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def scaling_exponent(runs: List[Dict[str, Any]], seconds) -> float:
+    points = [(run["input_mb"], seconds(run)) for run in runs if seconds(run)]
+    if len(points) < 2:
+        return None
+
+    xs = [math.log(size) for size, _ in points]
+    ys = [math.log(value) for _, value in points]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if not variance:
+        return None
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    return round(covariance / variance, 3)
+
+
+def run_ingestion_benchmark(
+    sizes_mb=(1, 10, 100),
+    batch_size: int = 256,
+    database: str = "market_analyst_bench",
+    output_file: str = "ingestion_results.json",
+):
+    print("=" * 80)
+    print("🚀 INGESTION SCALE BENCHMARK (chunk → embed → store)")
+    print("=" * 80)
+
+    env = dict(os.environ)
+    if not os.getenv("OPENAI_BASE_URL"):
+        server = start_standin_server()
+        env["OPENAI_BASE_URL"] = f"http://{server.config.host}:{server.config.port}/v1"
+        env["OPENAI_API_KEY"] = "standin"
+        print(f"🧪 OpenAI stand-in listening on {env['OPENAI_BASE_URL']}")
+
+    if DatabaseConfig.VECTOR_BACKEND == "postgres":
+        ensure_benchmark_database(database)
+        init_database()
+        env["DATABASE_NAME"] = database
+
+    results = {
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "vector_backend": env.get("VECTOR_BACKEND", "postgres"),
+        "runs": [],
+    }
+
+    with tempfile.TemporaryDirectory() as store_dir:
+        env["VECTOR_STORE_PATH"] = store_dir
+
+        for size_mb in sizes_mb:
+            print(f"\n📊 Corpus size: {size_mb} MB")
+            print("-" * 60)
+            run = benchmark_size(size_mb, batch_size, env)
+            results["runs"].append(run)
+
+            print(
+                f"  {run['throughput_mb_per_second']} MB/s  "
+                f"{run['chunks_per_second']} chunks/s  "
+                f"peak RSS {run['peak_rss_mb']} MB  ({run['chunks']} chunks)"
+            )
+            for name, stage in run["stages"].items():
+                print(
+                    f"    {name:<6} {stage['seconds']:>9}s  "
+                    f"{stage['share']:>6.1%}  {stage['chunks_per_second']} chunks/s"
+                )
+            print(f"    DB write rate: {run['db_rows_per_second']} rows/s")
+
+    results["scaling_exponents"] = {
+        "total": scaling_exponent(results["runs"], lambda r: r["elapsed_seconds"]),
+        **{
+            name: scaling_exponent(
+                results["runs"], lambda r, name=name: r["stages"][name]["seconds"]
+            )
+            for name in STAGES
+        },
+    }
+
+    print("\n📈 Time vs corpus size (log-log slope, 1.0 = linear)")
+    for name, exponent in results["scaling_exponents"].items():
+        flag = "  ⚠️ super-linear" if exponent and exponent > 1.1 else ""
+        print(f"  {name:<6} {exponent}{flag}")
+
+    with open(output_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\n📄 Results saved to: {output_file}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ingestion throughput at scale")
+    parser.add_argument("--worker", type=float, metavar="SIZE_MB")
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--database", default="market_analyst_bench")
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_pipeline(args.worker, args.batch_size)))
+    else:
+        run_ingestion_benchmark(
+            sizes_mb=args.sizes, batch_size=args.batch_size, database=args.database
+        )
@@ -0,0 +1,334 @@
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import time
+import json
+import random
+import asyncio
+import argparse
+import subprocess
+from collections import Counter
+from typing import List, Dict, Any
+import httpx
+from dotenv import load_dotenv
+
+from app.evaluation.timing import summarize_samples
+from app.evaluation.openai_standin import start_standin_server
+
+load_dotenv()
+
+QA_QUERIES = [
+    "What is Innovate Inc's market share?",
+    "Who are the main competitors and what are their market shares?",
+    "What are Innovate Inc's strengths?",
+    "What is the projected market size by 2030?",
+    "What is the CAGR for the AI workflow automation market?",
+    "What are the key threats to Innovate Inc?",
+]
+
+ROUTED_QUERIES = QA_QUERIES + [
+    "Summarize the market research report",
+    "Give me an overview of the competitive landscape",
+    "Extract all competitors as JSON",
+]
+
+DEFAULT_MIX = {"qa": 0.6, "query": 0.3, "summarize": 0.05, "extract": 0.05}
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    mix = {}
+    for part in spec.split(","):
+        endpoint, weight = part.split("=")
+        if endpoint not in DEFAULT_MIX:
+            raise ValueError(f"Unknown endpoint in mix: {endpoint}")
+        mix[endpoint] = float(weight)
+    return mix
+
+
+def build_request(endpoint: str, rng: random.Random) -> Dict[str, Any]:
+    if endpoint == "qa":
+        return {"url": "/qa", "json": {"query": rng.choice(QA_QUERIES), "top_k": 3}}
+    if endpoint == "query":
+        return {
+            "url": "/query",
+            "json": {"query": rng.choice(ROUTED_QUERIES), "top_k": 3},
+        }
+    return {"url": f"/{endpoint}", "json": None}
+
+
+class LoadGenerator:
+    def __init__(
+        self,
+        base_url: str,
+        mix: Dict[str, float],
+        timeout: float = 60.0,
+        seed: int = 7,
+    ):
+        self.base_url = base_url
+        self.endpoints = list(mix)
+        self.weights = list(mix.values())
+        self.timeout = timeout
+        self.rng = random.Random(seed)
+
+    def _next_endpoint(self) -> str:
+        return self.rng.choices(self.endpoints, weights=self.weights)[0]
+
+    async def _send(
+        self, client: httpx.AsyncClient, endpoint: str, started: float, records: List
+    ):
+        request = build_request(endpoint, self.rng)
+        try:
+            response = await client.post(request["url"], json=request["json"])
+            status = response.status_code
+        except httpx.HTTPError as e:
+            status = type(e).__name__
+        records.append(
+            {
+                "endpoint": endpoint,
+                "status": status,
+                "latency": time.perf_counter() - started,
+                "finished": time.perf_counter(),
+            }
+        )
+
+    def _client(self, connections: int) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=connections, max_keepalive_connections=connections
+            ),
+        )
+
+    async def run_closed_loop(self, concurrency: int, duration: float) -> Dict:
+        records = []
+        deadline = time.perf_counter() + duration
+
+        async def worker(client):
+            while time.perf_counter() < deadline:
+                await self._send(
+                    client, self._next_endpoint(), time.perf_counter(), records
+                )
+
+        async with self._client(concurrency) as client:
+            start = time.perf_counter()
+            await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+
+        return summarize_records(records, duration, start + duration)
+
+    async def run_open_loop(
+        self, rate: float, duration: float, max_in_flight: int = 1000
+    ) -> Dict:
+        records = []
+        tasks = set()
+        dropped = 0
+
+        async with self._client(max_in_flight) as client:
+            start = time.perf_counter()
+            next_arrival = start
+            while next_arrival < start + duration:
+                await asyncio.sleep(max(0.0, next_arrival - time.perf_counter()))
+                if len(tasks) >= max_in_flight:
+                    dropped += 1
+                else:
+                    task = asyncio.create_task(
+                        self._send(
+                            client, self._next_endpoint(), next_arrival, records
+                        )
+                    )
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                next_arrival += self.rng.expovariate(rate)
+
+            await asyncio.gather(*tasks)
+
+        summary = summarize_records(records, duration, start + duration)
+        summary["offered_rps"] = rate
+        summary["dropped"] = dropped
+        return summary
+
+
+def summarize_records(
+    records: List[Dict], duration: float, window_end: float
+) -> Dict[str, Any]:
+    def summarize(subset):
+        ok = [r for r in subset if isinstance(r["status"], int) and r["status"] < 400]
+        in_window = [r for r in ok if r["finished"] <= window_end]
+        latency = summarize_samples([r["latency"] for r in ok]) if ok else {}
+        latency.pop("throughput_per_second", None)
+        return {
+            "requests": len(subset),
+            "errors": len(subset) - len(ok),
+            "error_rate": round((len(subset) - len(ok)) / len(subset), 4)
+            if subset
+            else 0.0,
+            "achieved_rps": round(len(in_window) / duration, 2),
+            "status_codes": dict(Counter(str(r["status"]) for r in subset)),
+            "latency": latency,
+        }
+
+    summary = summarize(records)
+    summary["endpoints"] = {
+        endpoint: summarize([r for r in records if r["endpoint"] == endpoint])
+        for endpoint in sorted({r["endpoint"] for r in records})
+    }
+    return summary
+
+
+def find_knee(steps: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def power(step):
+        p50 = step["summary"]["latency"].get("p50_ms")
+        return step["summary"]["achieved_rps"] / p50 if p50 else 0.0
+
+    return max(steps, key=power) if steps else None
+
+
+def start_api_server(port: int, env: Dict[str, str]) -> subprocess.Popen:
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.api.main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        cwd=str(Path(__file__).parent.parent.parent),
+        env=env,
+    )
+
+    for _ in range(300):
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/health", timeout=1.0)
+            return process
+        except httpx.HTTPError:
+            time.sleep(0.1)
+
+    process.terminate()
+    raise RuntimeError("API server did not start")
+
+
+def print_step(level_name: str, level: float, summary: Dict[str, Any]):
+    latency = summary["latency"]
+    print(
+        f"  {level_name}={level:<6} rps={summary['achieved_rps']:<8} "
+        f"p50={latency.get('p50_ms', '-')}ms p95={latency.get('p95_ms', '-')}ms "
+        f"p99={latency.get('p99_ms', '-')}ms errors={summary['error_rate']:.1%}"
+    )
+
+
+def run_load_test(
+    base_url: str = None,
+    mode: str = "closed",
+    levels: List[float] = (1, 2, 4, 8, 16, 32),
+    duration: float = 20.0,
+    mix: Dict[str, float] = None,
+    standin_latency_ms: float = 300.0,
+    standin_latency_sigma: float = 0.5,
+    api_port: int = 8001,
+    output_file: str = "load_test_results.json",
+):
+    print("=" * 80)
+    print(f"🚀 LOAD TEST ({mode} loop)")
+    print("=" * 80)
+
+    mix = mix or DEFAULT_MIX
+    if mode == "closed":
+        levels = [int(level) for level in levels]
+    api_process = None
+
+    if base_url is None:
+        os.environ["STANDIN_LATENCY_MS"] = str(standin_latency_ms)
+        os.environ["STANDIN_LATENCY_SIGMA"] = str(standin_latency_sigma)
+        server = start_standin_server()
+        env = {
+            **os.environ,
+            "OPENAI_BASE_URL": f"http://{server.config.host}:{server.config.port}/v1",
+            "OPENAI_API_KEY": "standin",
+        }
+        print(
+            f"🧪 OpenAI stand-in: {standin_latency_ms}ms median, "
+            f"lognormal sigma {standin_latency_sigma}"
+        )
+        api_process = start_api_server(api_port, env)
+        base_url = f"http://127.0.0.1:{api_port}"
+
+    print(f"🎯 Target: {base_url}  Mix: {mix}")
+    generator = LoadGenerator(base_url, mix)
+    level_name = "concurrency" if mode == "closed" else "rate"
+
+    steps = []
+    try:
+        for level in levels:
+            if mode == "closed":
+                summary = asyncio.run(generator.run_closed_loop(level, duration))
+            else:
+                summary = asyncio.run(generator.run_open_loop(level, duration))
+            steps.append({level_name: level, "summary": summary})
+            print_step(level_name, level, summary)
+    finally:
+        if api_process:
+            api_process.terminate()
+            api_process.wait()
+
+    knee = find_knee(steps)
+    if knee:
+        print(f"\n📍 Knee of the latency curve: {level_name}={knee[level_name]}")
+
+    results = {
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "mode": mode,
+        "duration_seconds": duration,
+        "mix": mix,
+        "standin": {
+            "latency_ms": standin_latency_ms,
+            "latency_sigma": standin_latency_sigma,
+        },
+        "steps": steps,
+        "knee": {level_name: knee[level_name]} if knee else None,
+    }
+
+    with open(output_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\n📄 Results saved to: {output_file}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--base-url", help="Target a running API instead of spawning one"
+    )
+    parser.add_argument("--mode", choices=["closed", "open"], default="closed")
+    parser.add_argument(
+        "--levels",
+        type=float,
+        nargs="+",
+        default=[1, 2, 4, 8, 16, 32],
+        help="Concurrency levels (closed loop) or arrival rates in req/s (open loop)",
+    )
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument(
+        "--mix", help="e.g. qa=0.6,query=0.3,summarize=0.05,extract=0.05"
+    )
+    parser.add_argument("--standin-latency-ms", type=float, default=300.0)
+    parser.add_argument("--standin-latency-sigma", type=float, default=0.5)
+    parser.add_argument("--api-port", type=int, default=8001)
+    args = parser.parse_args()
+
+    run_load_test(
+        base_url=args.base_url,
+        mode=args.mode,
+        levels=args.levels,
+        duration=args.duration,
+        mix=parse_mix(args.mix) if args.mix else None,
+        standin_latency_ms=args.standin_latency_ms,
+        standin_latency_sigma=args.standin_latency_sigma,
+        api_port=args.api_port,
+    )
@@ -0,0 +1,352 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import os
+import re
+import time
+import json
+import uuid
+import base64
+import random
+import asyncio
+import hashlib
+import threading
+from functools import lru_cache
+from typing import List, Union
+import numpy as np
+import uvicorn
+from jinja2 import Template
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+MODEL_DIMENSIONS = {
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+    "text-embedding-ada-002": 1536,
+}
+WORD_PATTERN = re.compile(r"\w+")
+
+app = FastAPI(title="OpenAI Stand-in")
+fault_rng = random.Random(int(os.getenv("STANDIN_SEED", "0")))
+
+
+class EmbeddingRequest(BaseModel):
+    model: str
+    input: Union[str, List[str]]
+    dimensions: int | None = None
+    encoding_format: str = "float"
+
+
+class ChatCompletionRequest(BaseModel):
+    model: str
+    messages: List[dict]
+    temperature: float | None = None
+    max_tokens: int | None = None
+    response_format: dict | None = None
+    stream: bool = False
+    stream_options: dict | None = None
+
+
+def count_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def stable_hash(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest())
+
+
+def hash_embedding(text: str, dimensions: int) -> np.ndarray:
+    hashes = np.array(
+        [stable_hash(word) for word in WORD_PATTERN.findall(text.lower())]
+        or [stable_hash(text)],
+        dtype=np.uint64,
+    )
+    vector = np.zeros(dimensions, dtype=np.float32)
+    signs = np.where(hashes >> np.uint64(63), -1.0, 1.0).astype(np.float32)
+    np.add.at(vector, (hashes % np.uint64(dimensions)).astype(np.int64), signs)
+    norm = np.linalg.norm(vector)
+    if norm == 0:
+        vector[stable_hash(text) % dimensions] = 1.0
+        norm = 1.0
+    return vector / norm
+
+
+def encode_embedding(vector: np.ndarray, encoding_format: str):
+    if encoding_format == "base64":
+        return base64.b64encode(vector.tobytes()).decode()
+    return vector.tolist()
+
+
+def sample_latency_seconds() -> float:
+    latency_ms = float(os.getenv("STANDIN_LATENCY_MS", "0"))
+    sigma = float(os.getenv("STANDIN_LATENCY_SIGMA", "0"))
+    jitter_ms = float(os.getenv("STANDIN_JITTER_MS", "0"))
+    if sigma > 0:
+        latency_ms *= float(np.random.lognormal(0.0, sigma))
+    if jitter_ms > 0:
+        latency_ms += fault_rng.uniform(0, jitter_ms)
+    return max(latency_ms, 0.0) / 1000
+
+
+async def simulate_latency():
+    latency = sample_latency_seconds()
+    if latency > 0:
+        await asyncio.sleep(latency)
+
+
+async def inject_fault() -> JSONResponse | None:
+    if fault_rng.random() < float(os.getenv("STANDIN_TIMEOUT_RATE", "0")):
+        await asyncio.sleep(float(os.getenv("STANDIN_TIMEOUT_SECONDS", "60")))
+
+    if fault_rng.random() < float(os.getenv("STANDIN_ERROR_RATE", "0")):
+        return JSONResponse(
+            status_code=429,
+            headers={"retry-after": os.getenv("STANDIN_RETRY_AFTER", "1")},
+            content={
+                "error": {
+                    "message": "Rate limit reached (stand-in fault injection)",
+                    "type": "requests",
+                    "param": None,
+                    "code": "rate_limit_exceeded",
+                }
+            },
+        )
+    return None
+
+
+@lru_cache(maxsize=8)
+def load_completion_templates(path: str | None) -> list:
+    if not path:
+        return []
+    with open(path, "r") as f:
+        return [
+            (re.compile(entry["match"], re.S), Template(entry["response"]))
+            for entry in json.load(f)
+        ]
+
+
+def last_line_after(prompt: str, label: str) -> str:
+    return prompt.rsplit(label, 1)[-1].strip().split("\n", 1)[0].strip()
+
+
+def first_sentences(text: str, count: int) -> str:
+    sentences = re.split(r"(?<=[.!?])\s+", " ".join(text.split()))
+    return " ".join(sentences[:count])
+
+
+def route_query(prompt: str) -> str:
+    query = last_line_after(prompt, "Query:").lower()
+    if any(word in query for word in ("summar", "overview", "key findings")):
+        return "summarization"
+    if any(word in query for word in ("extract", "json", "list all")):
+        return "extraction"
+    return "qa"
+
+
+def extract_schema(prompt: str):
+    end = prompt.rfind("}")
+    depth = 0
+    for start in range(end, -1, -1):
+        if prompt[start] == "}":
+            depth += 1
+        elif prompt[start] == "{":
+            depth -= 1
+            if depth == 0:
+                try:
+                    return json.loads(prompt[start : end + 1])
+                except json.JSONDecodeError:
+                    return None
+    return None
+
+
+def fill_schema(schema, seed: str):
+    if isinstance(schema, dict):
+        return {
+            key: fill_schema(value, f"{seed}.{key}") for key, value in schema.items()
+        }
+    if isinstance(schema, list):
+        return [fill_schema(item, f"{seed}[{i}]") for i, item in enumerate(schema)]
+    if schema == "number":
+        return stable_hash(seed) % 10000 / 100
+    if schema == "boolean":
+        return bool(stable_hash(seed) % 2)
+    return f"stand-in {seed.rsplit('.', 1)[-1].strip('[]0123456789')}"
+
+
+def canned_completion(request: ChatCompletionRequest) -> str:
+    prompt = "\n".join(str(message.get("content", "")) for message in request.messages)
+
+    templates = load_completion_templates(os.getenv("STANDIN_COMPLETIONS_PATH"))
+    for pattern, template in templates:
+        match = pattern.search(prompt)
+        if match:
+            return template.render(
+                prompt=prompt, model=request.model, **match.groupdict()
+            )
+
+    response_format = request.response_format or {}
+    if response_format.get("type") == "json_object":
+        schema = extract_schema(prompt)
+        if schema is None:
+            return json.dumps({"response": first_sentences(prompt, 1)})
+        return json.dumps(fill_schema(schema, "root"))
+
+    if "query router" in prompt:
+        return route_query(prompt)
+
+    if "Question:" in prompt and "Context:" in prompt:
+        context = prompt.rsplit("Context:", 1)[-1].split("Question:", 1)[0]
+        question = last_line_after(prompt, "Question:")
+        return f'Regarding "{question}": {first_sentences(context, 2)}'
+
+    if "Market Research Report:" in prompt:
+        report = prompt.rsplit("Market Research Report:", 1)[-1]
+        return f"Executive summary: {first_sentences(report, 3)}"
+
+    return "Stand-in answer based on the provided context."
+
+
+def stream_completion(request: ChatCompletionRequest, content: str, usage: dict):
+    completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+    created = int(time.time())
+
+    def chunk(delta: dict, finish_reason=None, chunk_usage=None):
+        payload = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": request.model,
+            "choices": (
+                [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+                if delta is not None
+                else []
+            ),
+        }
+        if chunk_usage:
+            payload["usage"] = chunk_usage
+        return f"data: {json.dumps(payload)}\n\n"
+
+    async def events():
+        yield chunk({"role": "assistant", "content": ""})
+        for piece in re.findall(r"\S+\s*", content):
+            yield chunk({"content": piece})
+            await asyncio.sleep(0)
+        yield chunk({}, finish_reason="stop")
+        if (request.stream_options or {}).get("include_usage"):
+            yield chunk(None, chunk_usage=usage)
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+@app.get("/health")
+def health():
+    return {"status": "healthy"}
+
+
+@app.get("/v1/models")
+def models():
+    return {
+        "object": "list",
+        "data": [
+            {"id": model, "object": "model", "owned_by": "standin"}
+            for model in [*MODEL_DIMENSIONS, os.getenv("LLM_MODEL", "gpt-4o-mini")]
+        ],
+    }
+
+
+@app.post("/v1/embeddings")
+async def embeddings(request: EmbeddingRequest):
+    fault = await inject_fault()
+    if fault:
+        return fault
+    await simulate_latency()
+
+    inputs = [request.input] if isinstance(request.input, str) else request.input
+    dimensions = request.dimensions or MODEL_DIMENSIONS.get(request.model, 1536)
+
+    return {
+        "object": "list",
+        "model": request.model,
+        "data": [
+            {
+                "object": "embedding",
+                "index": i,
+                "embedding": encode_embedding(
+                    hash_embedding(text, dimensions), request.encoding_format
+                ),
+            }
+            for i, text in enumerate(inputs)
+        ],
+        "usage": {
+            "prompt_tokens": sum(count_tokens(text) for text in inputs),
+            "total_tokens": sum(count_tokens(text) for text in inputs),
+        },
+    }
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: ChatCompletionRequest):
+    fault = await inject_fault()
+    if fault:
+        return fault
+    await simulate_latency()
+
+    content = canned_completion(request)
+    prompt_tokens = sum(
+        count_tokens(str(message.get("content", ""))) for message in request.messages
+    )
+    completion_tokens = count_tokens(content)
+    usage = {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+    if request.stream:
+        return stream_completion(request, content, usage)
+
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": request.model,
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }
+        ],
+        "usage": usage,
+    }
+
+
+def start_standin_server(
+    host: str = "127.0.0.1", port: int = 8765, timeout: float = 10.0
+) -> uvicorn.Server:
+    server = uvicorn.Server(
+        uvicorn.Config(app, host=host, port=port, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + timeout
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError(f"Stand-in server failed to start on {host}:{port}")
+        if time.monotonic() >= deadline:
+            server.should_exit = True
+            raise TimeoutError(f"Stand-in server did not start within {timeout}s")
+        thread.join(0.01)
+    return server
+
+
+if __name__ == "__main__":
+    uvicorn.run(
+        app,
+        host=os.getenv("STANDIN_HOST", "127.0.0.1"),
+        port=int(os.getenv("STANDIN_PORT", "8765")),
+    )
@@ -0,0 +1,175 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import time
+import json
+import itertools
+from typing import List, Dict, Any
+import numpy as np
+from dotenv import load_dotenv
+
+from app.database.config import EmbeddingConfig
+from app.database.connection import (
+    get_connection,
+    create_vector_indexes,
+    VECTOR_STORAGE_MODES,
+)
+from app.database.repository import DocumentRepository
+from app.evaluation.timing import measure
+
+load_dotenv()
+
+INDEX_SUFFIXES = {
+    "full": "_idx",
+    "halfvec": "_halfvec_idx",
+    "binary": "_binary_idx",
+}
+
+
+class QuantizationBenchmark:
+    def __init__(self, num_queries: int = 20, k: int = 10, seed: int = 42):
+        self.repo = DocumentRepository()
+        self.embedding_config = EmbeddingConfig()
+        self.column = self.embedding_config.column
+        self.num_queries = num_queries
+        self.k = k
+        self.rng = np.random.default_rng(seed)
+
+    def sample_queries(self) -> List[np.ndarray]:
+        conn = get_connection()
+        cur = conn.cursor()
+        cur.execute(
+            f"""
+            SELECT {self.column}::real[] AS embedding FROM document_chunks
+            WHERE {self.column} IS NOT NULL
+            ORDER BY random() LIMIT %s;
+        """,
+            (self.num_queries,),
+        )
+        rows = cur.fetchall()
+        cur.close()
+        conn.close()
+
+        queries = []
+        for row in rows:
+            vec = np.asarray(row["embedding"], dtype=np.float32)
+            vec = vec + self.rng.normal(0, 0.01, vec.shape).astype(np.float32)
+            queries.append(vec / np.linalg.norm(vec))
+        return queries
+
+    def exact_neighbors(self, queries: List[np.ndarray]) -> List[set]:
+        conn = get_connection()
+        cur = conn.cursor()
+        cur.execute("SET enable_indexscan = off;")
+
+        ground_truth = []
+        for query in queries:
+            cur.execute(
+                f"""
+                SELECT id FROM document_chunks
+                ORDER BY {self.column} <=> %s
+                LIMIT %s;
+            """,
+                (query, self.k),
+            )
+            ground_truth.append({row["id"] for row in cur.fetchall()})
+
+        cur.close()
+        conn.close()
+        return ground_truth
+
+    def build_index(self, storage: str) -> Dict[str, Any]:
+        index_name = f"{self.column}{INDEX_SUFFIXES[storage]}"
+        conn = get_connection()
+        cur = conn.cursor()
+        cur.execute(f"DROP INDEX IF EXISTS {index_name};")
+        conn.commit()
+
+        start_time = time.perf_counter()
+        create_vector_indexes(
+            cur, storage, self.column, self.embedding_config.dimensions
+        )
+        conn.commit()
+        build_time = time.perf_counter() - start_time
+
+        cur.execute(
+            "SELECT pg_relation_size(to_regclass(%s)) AS size;",
+            (index_name,),
+        )
+        index_size = cur.fetchone()["size"] or 0
+
+        cur.close()
+        conn.close()
+        return {
+            "build_time_seconds": round(build_time, 3),
+            "index_size_bytes": int(index_size),
+        }
+
+    def benchmark_storage(
+        self, storage: str, queries: List[np.ndarray], ground_truth: List[set]
+    ) -> Dict[str, Any]:
+        print(f"\n📊 Benchmarking vector storage: {storage}")
+        print("-" * 60)
+
+        result = {"storage": storage, "k": self.k}
+        result.update(self.build_index(storage))
+
+        recalls = []
+        for query, expected in zip(queries, ground_truth):
+            found = self.repo.search_similar_chunks(
+                query,
+                limit=self.k,
+                storage=storage,
+                embedding_column=self.column,
+                exact=False,
+            )
+            recalls.append(len(expected & {row["id"] for row in found}) / self.k)
+
+        query_cycle = itertools.cycle(queries)
+        result["latency"] = measure(
+            lambda: self.repo.search_similar_chunks(
+                next(query_cycle),
+                limit=self.k,
+                storage=storage,
+                embedding_column=self.column,
+                exact=False,
+            ),
+            iterations=len(queries),
+        )
+        result["recall_at_k"] = round(float(np.mean(recalls)), 4)
+
+        print(f"  Index size: {result['index_size_bytes'] / 1024 / 1024:.2f} MB")
+        print(f"  Build time: {result['build_time_seconds']}s")
+        print(f"  p50 latency: {result['latency']['p50_ms']}ms")
+        print(f"  p99 latency: {result['latency']['p99_ms']}ms")
+        print(f"  Recall@{self.k}: {result['recall_at_k']}")
+
+        return result
+
+
+def run_quantization_benchmark(output_file: str = "quantization_results.json"):
+    print("=" * 80)
+    print("🚀 VECTOR STORAGE QUANTIZATION BENCHMARK")
+    print("=" * 80)
+
+    benchmark = QuantizationBenchmark()
+    queries = benchmark.sample_queries()
+    ground_truth = benchmark.exact_neighbors(queries)
+
+    results = {"timestamp": time.strftime("%Y-%m-%d %H:%M:%S"), "modes": []}
+    for storage in VECTOR_STORAGE_MODES:
+        results["modes"].append(
+            benchmark.benchmark_storage(storage, queries, ground_truth)
+        )
+
+    with open(output_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\n📄 Results saved to: {output_file}")
+    return results
+
+
+if __name__ == "__main__":
+    run_quantization_benchmark()
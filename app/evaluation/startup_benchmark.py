@@ -0,0 +1,165 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import os
+import time
+import json
+import socket
+import argparse
+import subprocess
+from typing import Dict, Any
+import httpx
+
+from app.evaluation.timing import summarize_samples
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+
+def profile_imports(module: str = "app.api.main", top: int = 15) -> Dict[str, Any]:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=str(PROJECT_ROOT),
+    )
+
+    imports = []
+    for line in completed.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        imports.append(
+            {
+                "module": name.strip(),
+                "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+                "self_ms": int(fields[0]) / 1000,
+                "cumulative_ms": int(fields[1]) / 1000,
+            }
+        )
+
+    total = next(item for item in imports if item["module"] == module)
+    return {
+        "module": module,
+        "total_ms": total["cumulative_ms"],
+        "slowest": sorted(
+            (item for item in imports if item is not total),
+            key=lambda item: -item["cumulative_ms"],
+        )[:top],
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_to_ready(timeout: float = 30.0) -> float:
+    port = free_port()
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.api.main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        cwd=str(PROJECT_ROOT),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                response = httpx.get(f"http://127.0.0.1:{port}/health", timeout=1.0)
+                if response.status_code == 200:
+                    return time.perf_counter() - start
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.005)
+        raise RuntimeError(f"API not ready after {timeout}s")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def time_encoding_load() -> float:
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import time; from app.services.tokenizer import get_encoding; "
+            "start = time.perf_counter(); get_encoding(); "
+            "print(time.perf_counter() - start)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=str(PROJECT_ROOT),
+    )
+    return float(completed.stdout.strip().splitlines()[-1])
+
+
+def run_startup_benchmark(
+    runs: int = 10, output_file: str = "startup_results.json"
+) -> Dict[str, Any]:
+    print("=" * 80)
+    print("🚀 COLD START BENCHMARK")
+    print("=" * 80)
+
+    print("\n📊 Import profile (python -X importtime)")
+    print("-" * 60)
+    imports = profile_imports()
+    print(f"  import app.api.main: {imports['total_ms']:.1f}ms")
+    for item in imports["slowest"]:
+        print(
+            f"  {'  ' * item['depth']}{item['module']:<50} "
+            f"{item['cumulative_ms']:>8.1f}ms"
+        )
+
+    print(f"\n📊 Time to ready (process start → GET /health 200), {runs} runs")
+    print("-" * 60)
+    ready = summarize_samples([time_to_ready() for _ in range(runs)])
+    ready.pop("throughput_per_second")
+    print(f"  p50: {ready['p50_ms']}ms  p95: {ready['p95_ms']}ms")
+
+    print("\n📊 Tokenizer load from TIKTOKEN_CACHE_DIR")
+    print("-" * 60)
+    try:
+        encoding_ms = round(time_encoding_load() * 1000, 1)
+        print(f"  cl100k_base: {encoding_ms}ms")
+    except subprocess.CalledProcessError:
+        encoding_ms = None
+        print("  ❌ Failed to load; run python -m app.prefetch_encodings first")
+
+    results = {
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": sys.version.split()[0],
+        "tiktoken_cache_dir": os.getenv("TIKTOKEN_CACHE_DIR"),
+        "imports": imports,
+        "time_to_ready": ready,
+        "encoding_load_ms": encoding_ms,
+    }
+
+    with open(output_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\n📄 Results saved to: {output_file}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="API cold start timing")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    run_startup_benchmark(runs=args.runs)
@@ -0,0 +1,32 @@
+import time
+from typing import Callable, Dict, List
+import numpy as np
+
+
+def summarize_samples(samples: List[float]) -> Dict[str, float]:
+    latencies_ms = np.asarray(samples, dtype=np.float64) * 1000
+    total_seconds = float(np.sum(samples))
+
+    return {
+        "iterations": len(samples),
+        "mean_ms": round(float(np.mean(latencies_ms)), 4),
+        "p50_ms": round(float(np.percentile(latencies_ms, 50)), 4),
+        "p95_ms": round(float(np.percentile(latencies_ms, 95)), 4),
+        "p99_ms": round(float(np.percentile(latencies_ms, 99)), 4),
+        "throughput_per_second": round(len(samples) / total_seconds, 2)
+        if total_seconds
+        else 0.0,
+    }
+
+
+def measure(fn: Callable[[], object], iterations: int = 20, warmup: int = 3) -> Dict:
+    for _ in range(warmup):
+        fn()
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+
+    return summarize_samples(samples)
@@ -0,0 +1,24 @@
+import os
+import time
+import argparse
+from app.services.tokenizer import DEFAULT_ENCODING, get_encoding
+
+
+def prefetch_encodings(names: list[str]):
+    for name in names:
+        start_time = time.perf_counter()
+        encoding = get_encoding(name)
+        elapsed = time.perf_counter() - start_time
+        print(f"✅ {name}: {encoding.n_vocab} tokens loaded in {elapsed:.2f}s")
+
+    print(f"📁 Encodings cached in {os.environ['TIKTOKEN_CACHE_DIR']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Download tiktoken encodings into TIKTOKEN_CACHE_DIR"
+    )
+    parser.add_argument("encodings", nargs="*", default=[DEFAULT_ENCODING])
+    args = parser.parse_args()
+
+    prefetch_encodings(args.encodings)
@@ -1,14 +1,16 @@
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 from app.services.chunking import ChunkingService
 from app.services.embedding import EmbeddingService
-from app.database.repository import DocumentRepository
+from app.services.deduplication import MinHashDeduplicator
+from app.database.repository import get_document_repository
 
 load_dotenv()
 
 
 def process_market_report():
-    report_path = "../data/market_research_report.txt"
+    report_path = Path(__file__).parent.parent / "data" / "market_research_report.txt"
 
     with open(report_path, "r") as f:
         document_text = f.read()
@@ -19,30 +21,69 @@ def process_market_report():
     chunk_overlap = int(os.getenv("CHUNK_OVERLAP", 50))
 
     chunker = ChunkingService(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
-    chunks = chunker.chunk_text(document_text)
+    chunk_spans = chunker.chunk_text_with_offsets(document_text)
+    chunks = [span["content"] for span in chunk_spans]
 
     print(f"Created {len(chunks)} chunks")
 
+    dedup_mode = os.getenv("DEDUP_MODE", "skip")
+    duplicate_of = {}
+    if dedup_mode != "off":
+        deduplicator = MinHashDeduplicator(
+            threshold=float(os.getenv("DEDUP_THRESHOLD", 0.9))
+        )
+        unique_positions = []
+        for i, chunk in enumerate(chunks):
+            match = deduplicator.add(chunk)
+            if match is None:
+                unique_positions.append(i)
+            else:
+                duplicate_of[i] = unique_positions[match]
+
+    unique_indices = [i for i in range(len(chunks)) if i not in duplicate_of]
+
     embedder = EmbeddingService()
     print(f"Generating embeddings using {embedder.model}...")
 
-    embeddings = embedder.generate_embeddings_batch(chunks)
+    unique_embeddings = embedder.generate_embeddings_batch(
+        [chunks[i] for i in unique_indices]
+    )
+    embeddings = dict(zip(unique_indices, unique_embeddings))
 
-    print(f"Generated {len(embeddings)} embeddings")
+    print(f"Generated {len(unique_embeddings)} embeddings")
 
-    repo = DocumentRepository()
+    repo = get_document_repository()
     repo.clear_all_chunks()
 
     print("Storing chunks in database...")
-    for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-        repo.insert_chunk(
-            content=chunk,
-            embedding=embedding,
-            chunk_index=i,
-            metadata={"source": "market_research_report.txt"},
+    rows = []
+    for i, chunk in enumerate(chunks):
+        metadata = {"source": "market_research_report.txt"}
+        if i in duplicate_of:
+            if dedup_mode == "skip":
+                continue
+            metadata["duplicate_of"] = duplicate_of[i]
+
+        rows.append(
+            {
+                "content": chunk,
+                "embedding": embeddings[duplicate_of.get(i, i)],
+                "chunk_index": i,
+                "metadata": metadata,
+                "start_char": chunk_spans[i]["start_char"],
+                "end_char": chunk_spans[i]["end_char"],
+            }
         )
 
-    print(f"Successfully processed and stored {len(chunks)} chunks!")
+    stored = len(repo.insert_chunks_batch(rows, embedding_column=embedder.column))
+
+    print(f"Successfully processed and stored {stored} chunks!")
+    if duplicate_of:
+        rows_saved = len(chunks) - stored
+        print(
+            f"Near-duplicates ({dedup_mode}): {len(duplicate_of)} chunks, "
+            f"saved {len(duplicate_of)} embeddings and {rows_saved} rows"
+        )
 
     stored_chunks = repo.get_all_chunks()
     print(f"\nVerification: {len(stored_chunks)} chunks in database")
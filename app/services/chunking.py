@@ -1,22 +1,147 @@
-import tiktoken
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator
+import numpy as np
+from .tokenizer import get_encoding
+
+SAFE_BOUNDARY = re.compile(r"\n(?=\S)")
+
+_worker_chunker = None
+
+
+def _init_chunking_worker(chunk_size: int, chunk_overlap: int):
+    global _worker_chunker
+    _worker_chunker = ChunkingService(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
+
+def _chunk_document(text: str) -> list[dict]:
+    return _worker_chunker.chunk_text_with_offsets(text)
 
 
 class ChunkingService:
     def __init__(self, chunk_size: int = 250, chunk_overlap: int = 50):
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
-        self.encoding = tiktoken.get_encoding("cl100k_base")
+        self.encoding = get_encoding()
 
-    def chunk_text(self, text: str) -> list[str]:
+    def _token_byte_ends(self, tokens: list[int]) -> np.ndarray:
+        token_ids, inverse = np.unique(tokens, return_inverse=True)
+        byte_lengths = np.fromiter(
+            (len(self.encoding.decode_single_token_bytes(t)) for t in token_ids),
+            dtype=np.int64,
+            count=len(token_ids),
+        )
+        return np.cumsum(byte_lengths[inverse])
+
+    @staticmethod
+    def _byte_to_char_offsets(data: bytes, byte_offsets) -> dict[int, int]:
+        char_offsets = {}
+        previous_byte = 0
+        previous_char = 0
+        for byte_offset in sorted(set(byte_offsets)):
+            char_start = byte_offset
+            while char_start < len(data) and (data[char_start] & 0xC0) == 0x80:
+                char_start -= 1
+            previous_char += len(data[previous_byte:char_start].decode("utf-8"))
+            previous_byte = char_start
+            char_offsets[byte_offset] = previous_char
+        return char_offsets
+
+    def chunk_text_with_offsets(self, text: str) -> list[dict]:
         tokens = self.encoding.encode(text)
-        chunks = []
+        if not tokens:
+            return []
 
-        start = 0
-        while start < len(tokens):
-            end = start + self.chunk_size
-            chunk_tokens = tokens[start:end]
-            chunk_text = self.encoding.decode(chunk_tokens)
-            chunks.append(chunk_text)
-            start += self.chunk_size - self.chunk_overlap
+        byte_ends = self._token_byte_ends(tokens)
+        step = self.chunk_size - self.chunk_overlap
+        windows = []
+        for start in range(0, len(tokens), step):
+            end = min(start + self.chunk_size, len(tokens))
+            windows.append(
+                (int(byte_ends[start - 1]) if start else 0, int(byte_ends[end - 1]))
+            )
+
+        char_offsets = self._byte_to_char_offsets(
+            text.encode("utf-8"), [offset for window in windows for offset in window]
+        )
+
+        chunks = []
+        for byte_start, byte_end in windows:
+            start_char = char_offsets[byte_start]
+            end_char = char_offsets[byte_end]
+            chunks.append(
+                {
+                    "content": text[start_char:end_char],
+                    "start_char": start_char,
+                    "end_char": end_char,
+                }
+            )
 
         return chunks
+
+    def chunk_text(self, text: str) -> list[str]:
+        return [chunk["content"] for chunk in self.chunk_text_with_offsets(text)]
+
+    @staticmethod
+    def _safe_boundary(text: str, limit: int) -> int:
+        window = text[:limit]
+        newline = None
+        for newline in SAFE_BOUNDARY.finditer(window):
+            pass
+        if newline is not None:
+            return newline.end()
+
+        space = window.rfind(" ")
+        if space > 0:
+            return space
+
+        return limit
+
+    def chunk_stream(
+        self, pieces: Iterable[str], segment_chars: int = 1 << 16
+    ) -> Iterator[str]:
+        step = self.chunk_size - self.chunk_overlap
+        tokens = []
+        pending = ""
+
+        for piece in pieces:
+            pending += piece
+            while len(pending) > segment_chars:
+                cut = self._safe_boundary(pending, segment_chars)
+                tokens.extend(self.encoding.encode(pending[:cut]))
+                pending = pending[cut:]
+
+                while len(tokens) >= self.chunk_size:
+                    yield self.encoding.decode(tokens[: self.chunk_size])
+                    del tokens[:step]
+
+        tokens.extend(self.encoding.encode(pending))
+        while tokens:
+            yield self.encoding.decode(tokens[: self.chunk_size])
+            del tokens[:step]
+
+    def chunk_file(self, path: str, read_size: int = 1 << 16) -> Iterator[str]:
+        with open(path, "r") as f:
+            yield from self.chunk_stream(iter(lambda: f.read(read_size), ""))
+
+    def chunk_documents_parallel(
+        self, texts: Iterable[str], max_workers: int = None
+    ) -> Iterator[list[dict]]:
+        max_workers = max_workers or os.cpu_count() or 1
+        max_in_flight = max_workers * 4
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_chunking_worker,
+            initargs=(self.chunk_size, self.chunk_overlap),
+        ) as executor:
+            in_flight = deque()
+            for text in texts:
+                in_flight.append(executor.submit(_chunk_document, text))
+                if len(in_flight) >= max_in_flight:
+                    yield in_flight.popleft().result()
+
+            while in_flight:
+                yield in_flight.popleft().result()
@@ -0,0 +1,77 @@
+import re
+import hashlib
+from collections import defaultdict
+import numpy as np
+
+MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+
+
+class MinHashDeduplicator:
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle_size: int = 5,
+        seed: int = 1,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._buckets = [defaultdict(list) for _ in range(bands)]
+        self._signatures = []
+
+    def _shingle_hashes(self, text: str) -> np.ndarray:
+        words = re.findall(r"\w+", text.lower())
+        if len(words) < self.shingle_size:
+            shingles = {" ".join(words)}
+        else:
+            shingles = {
+                " ".join(words[i : i + self.shingle_size])
+                for i in range(len(words) - self.shingle_size + 1)
+            }
+
+        return np.fromiter(
+            (
+                int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest())
+                for s in shingles
+            ),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+
+    def signature(self, text: str) -> np.ndarray:
+        hashes = self._shingle_hashes(text)
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % MERSENNE_PRIME
+        return permuted.min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows : (band + 1) * self.rows].tobytes()
+
+    def add(self, text: str) -> int | None:
+        signature = self.signature(text)
+
+        candidates = set()
+        for band, key in self._band_keys(signature):
+            candidates.update(self._buckets[band].get(key, ()))
+
+        for candidate in sorted(candidates):
+            similarity = np.mean(self._signatures[candidate] == signature)
+            if similarity >= self.threshold:
+                return candidate
+
+        key = len(self._signatures)
+        self._signatures.append(signature)
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band][band_key].append(key)
+        return None
@@ -1,16 +1,39 @@
 import os
-from openai import OpenAI
+from app.database.config import EmbeddingConfig
+from .metrics import stage
+from .usage import record_usage
+from .openai_client import get_openai_client
 
 
 class EmbeddingService:
-    def __init__(self, model: str = None):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.model = model or os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+    def __init__(self, model: str = None, dimensions: int = None):
+        self.client = get_openai_client()
+        self.config = EmbeddingConfig(model=model, dimensions=dimensions)
+        self.model = self.config.model
+        self.dimensions = self.config.dimensions
+        self.column = self.config.column
+        self.batch_size = int(os.getenv("EMBEDDING_BATCH_SIZE", "256"))
+
+    def _create(self, input):
+        params = {"model": self.model, "input": input}
+        if self.config.requested_dimensions:
+            params["dimensions"] = self.config.requested_dimensions
+        with stage("embed"):
+            response = self.client.embeddings.create(**params)
+        if response.usage:
+            record_usage("embedding", self.model, response.usage.prompt_tokens)
+        return response
 
     def generate_embedding(self, text: str) -> list[float]:
-        response = self.client.embeddings.create(model=self.model, input=text)
+        response = self._create(text)
         return response.data[0].embedding
 
-    def generate_embeddings_batch(self, texts: list[str]) -> list[list[float]]:
-        response = self.client.embeddings.create(model=self.model, input=texts)
-        return [item.embedding for item in response.data]
+    def generate_embeddings_batch(
+        self, texts: list[str], batch_size: int = None
+    ) -> list[list[float]]:
+        batch_size = batch_size or self.batch_size
+        embeddings = []
+        for start in range(0, len(texts), batch_size):
+            response = self._create(texts[start : start + batch_size])
+            embeddings.extend(item.embedding for item in response.data)
+        return embeddings
@@ -0,0 +1,203 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from .metrics import stage, LLM_CACHE_REQUESTS
+from .usage import record_usage
+
+_bypass = ContextVar("llm_cache_bypass", default=False)
+
+
+class LLMResponseCache:
+    def __init__(
+        self,
+        max_entries: int = None,
+        ttl_seconds: float = None,
+        persistent_path: str = None,
+        max_persistent_entries: int = None,
+    ):
+        if max_entries is None:
+            max_entries = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1024"))
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv("LLM_CACHE_TTL_SECONDS", "86400"))
+        if max_persistent_entries is None:
+            max_persistent_entries = int(
+                os.getenv("LLM_CACHE_PERSISTENT_MAX_ENTRIES", "100000")
+            )
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_persistent_entries = max_persistent_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self._writes = 0
+
+        persistent_path = persistent_path or os.getenv("LLM_CACHE_PATH")
+        if persistent_path:
+            self._db = sqlite3.connect(
+                persistent_path, check_same_thread=False, timeout=30
+            )
+            self._db.execute("PRAGMA journal_mode=WAL;")
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                );
+            """
+            )
+            self._db.commit()
+
+    @staticmethod
+    def make_key(params: dict) -> str:
+        payload = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                created_at, value = entry
+                if now - created_at <= self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    return value
+                del self._entries[key]
+
+            if self._db is None:
+                return None
+
+            row = self._db.execute(
+                "SELECT value, created_at FROM llm_responses WHERE key = ?;", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl_seconds:
+                return None
+
+            value = json.loads(row[0])
+            self._remember(key, value, row[1])
+            return value
+
+    def _remember(self, key: str, value: dict, created_at: float):
+        self._entries[key] = (created_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def set(self, key: str, value: dict):
+        now = time.time()
+        with self._lock:
+            self._remember(key, value, now)
+
+            if self._db is None:
+                return
+
+            self._db.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, value, created_at) "
+                "VALUES (?, ?, ?);",
+                (key, json.dumps(value), now),
+            )
+            self._writes += 1
+            if self._writes % 100 == 0:
+                self._db.execute(
+                    "DELETE FROM llm_responses WHERE created_at < ?;",
+                    (now - self.ttl_seconds,),
+                )
+                self._db.execute(
+                    """
+                    DELETE FROM llm_responses WHERE key NOT IN (
+                        SELECT key FROM llm_responses
+                        ORDER BY created_at DESC LIMIT ?
+                    );
+                """,
+                    (self.max_persistent_entries,),
+                )
+            self._db.commit()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM llm_responses;")
+                self._db.commit()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LLMResponseCache()
+    return _cache
+
+
+@contextmanager
+def cache_bypass(enabled: bool = True):
+    token = _bypass.set(enabled)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def is_deterministic(params: dict) -> bool:
+    return (
+        params.get("temperature") == 0.0
+        and not params.get("stream")
+        and params.get("n", 1) == 1
+    )
+
+
+def _create_completion(client, params: dict):
+    with stage("completion"):
+        response = client.chat.completions.create(**params)
+    if response.usage:
+        record_usage("prompt", params["model"], response.usage.prompt_tokens)
+        record_usage("completion", params["model"], response.usage.completion_tokens)
+    return response
+
+
+def cached_chat_completion(client, **params):
+    if (
+        os.getenv("LLM_CACHE_ENABLED", "true").lower() != "true"
+        or _bypass.get()
+        or not is_deterministic(params)
+    ):
+        return _create_completion(client, params)
+
+    cache = get_llm_cache()
+    key = cache.make_key({"base_url": str(client.base_url), **params})
+    cached = cache.get(key)
+    if cached is not None:
+        LLM_CACHE_REQUESTS.inc(result="hit")
+        from openai.types.chat import ChatCompletion
+
+        return ChatCompletion.model_validate(cached)
+
+    LLM_CACHE_REQUESTS.inc(result="miss")
+    response = _create_completion(client, params)
+    cache.set(key, response.model_dump(mode="json"))
+    return response
+
+
+def stream_chat_completion(client, **params):
+    with stage("completion"):
+        stream = client.chat.completions.create(
+            **params, stream=True, stream_options={"include_usage": True}
+        )
+
+    for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+        if chunk.usage:
+            record_usage("prompt", params["model"], chunk.usage.prompt_tokens)
+            record_usage("completion", params["model"], chunk.usage.completion_tokens)
@@ -0,0 +1,34 @@
+import numpy as np
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.where(norms == 0, 1.0, norms)
+
+
+def maximal_marginal_relevance(
+    query_embedding, candidate_embeddings, k: int, lambda_mult: float = 0.5
+) -> list[int]:
+    candidates = _normalize(np.asarray(candidate_embeddings, dtype=np.float32))
+    if len(candidates) == 0 or k <= 0:
+        return []
+
+    query = _normalize(np.asarray(query_embedding, dtype=np.float32))
+    relevance = candidates @ query
+    similarity = candidates @ candidates.T
+
+    first = int(np.argmax(relevance))
+    selected = [first]
+    max_similarity = similarity[first].copy()
+    available = np.ones(len(candidates), dtype=bool)
+    available[first] = False
+
+    for _ in range(min(k, len(candidates)) - 1):
+        scores = lambda_mult * relevance - (1 - lambda_mult) * max_similarity
+        scores[~available] = -np.inf
+        chosen = int(np.argmax(scores))
+        selected.append(chosen)
+        available[chosen] = False
+        np.maximum(max_similarity, similarity[chosen], out=max_similarity)
+
+    return selected
@@ -0,0 +1,16 @@
+import os
+import threading
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_openai_client():
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from openai import OpenAI
+
+                _client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return _client
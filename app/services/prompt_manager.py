@@ -1,31 +1,131 @@
+import os
+import threading
 from pathlib import Path
 import frontmatter
-from jinja2 import Environment, FileSystemLoader, StrictUndefined, TemplateError
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    StrictUndefined,
+    TemplateError,
+    meta,
+)
+from .metrics import stage
 
 
 class PromptManager:
     _env = None
+    _registry = None
+    _lock = threading.Lock()
+    hot_reload = os.getenv("PROMPT_HOT_RELOAD", "false").lower() == "true"
+    bytecode_cache_dir = os.getenv("PROMPT_BYTECODE_CACHE_DIR")
 
     @classmethod
     def _get_env(cls, templates_dir="prompts") -> Environment:
         templates_dir = Path(__file__).parent.parent / templates_dir
         if cls._env is None:
+            bytecode_cache = None
+            if cls.bytecode_cache_dir:
+                Path(cls.bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(cls.bytecode_cache_dir)
             cls._env = Environment(
                 loader=FileSystemLoader(templates_dir),
                 undefined=StrictUndefined,
+                bytecode_cache=bytecode_cache,
             )
         return cls._env
 
+    @classmethod
+    def _from_source(cls, name: str, path: Path, source: str):
+        env = cls._get_env()
+        cache = env.bytecode_cache
+        if cache is None:
+            return env.from_string(source)
+
+        bucket = cache.get_bucket(env, name, str(path), source)
+        if bucket.code is None:
+            bucket.code = env.compile(source, name, str(path))
+            cache.set_bucket(bucket)
+        return env.template_class.from_code(env, bucket.code, env.make_globals(None))
+
+    @classmethod
+    def _templates_dir(cls) -> Path:
+        return Path(cls._get_env().loader.searchpath[0])
+
+    @classmethod
+    def _compile(cls, path: Path) -> dict:
+        env = cls._get_env()
+        mtime = path.stat().st_mtime_ns
+        post = frontmatter.load(path)
+
+        variables = post.metadata.get("variables") or []
+        if not isinstance(variables, list) or not all(
+            isinstance(variable, str) for variable in variables
+        ):
+            raise ValueError(f"Invalid variables declared in {path.name}")
+
+        try:
+            used = meta.find_undeclared_variables(env.parse(post.content))
+            template = cls._from_source(path.name, path, post.content)
+        except TemplateError as e:
+            raise ValueError(f"Error compiling template {path.name}: {str(e)}")
+
+        undeclared = used - set(variables)
+        if undeclared:
+            raise ValueError(
+                f"Template {path.name} uses undeclared variables: {sorted(undeclared)}"
+            )
+
+        return {
+            "template": template,
+            "variables": frozenset(variables),
+            "metadata": post.metadata,
+            "path": path,
+            "mtime": mtime,
+        }
+
+    @classmethod
+    def load_all(cls) -> dict:
+        registry = {
+            path.stem: cls._compile(path)
+            for path in sorted(cls._templates_dir().glob("*.j2"))
+        }
+        with cls._lock:
+            cls._registry = registry
+        return registry
+
+    @classmethod
+    def _get_entry(cls, name: str) -> dict:
+        registry = cls._registry if cls._registry is not None else cls.load_all()
+        entry = registry.get(name)
+
+        if cls.hot_reload:
+            path = cls._templates_dir() / f"{name}.j2"
+            if path.exists() and (
+                entry is None or path.stat().st_mtime_ns != entry["mtime"]
+            ):
+                entry = cls._compile(path)
+                with cls._lock:
+                    cls._registry = {**cls._registry, name: entry}
+
+        if entry is None:
+            raise ValueError(f"Unknown prompt template: {name}")
+        return entry
+
     @staticmethod
     def get_prompt(template: str, **kwargs) -> str:
-        env = PromptManager._get_env()
-        template_path = f"{template}.j2"
-        with open(env.loader.get_source(env, template_path)[1]) as file:
-            post = frontmatter.load(file)
+        entry = PromptManager._get_entry(template)
+
+        missing = entry["variables"].difference(kwargs)
+        unexpected = set(kwargs).difference(entry["variables"])
+        if missing or unexpected:
+            raise ValueError(
+                f"Invalid variables for template {template}: "
+                f"missing {sorted(missing)}, unexpected {sorted(unexpected)}"
+            )
 
-        template = env.from_string(post.content)
         try:
-            return template.render(**kwargs)
+            with stage("prompt_render"):
+                return entry["template"].render(**kwargs)
         except TemplateError as e:
             raise ValueError(f"Error rendering template: {str(e)}")
-
@@ -1,27 +1,112 @@
+import os
 from typing import List, Dict, Any
 from .embedding import EmbeddingService
-from app.database.repository import DocumentRepository
+from .metrics import stage
+from app.database.repository import get_document_repository
+
+SEARCH_MODES = ("vector", "hybrid")
 
 
 class RetrievalService:
-    def __init__(self):
-        self.embedder = EmbeddingService()
-        self.repo = DocumentRepository()
+    def __init__(self, embedding_model: str = None, embedding_dimensions: int = None):
+        self.embedder = EmbeddingService(
+            model=embedding_model, dimensions=embedding_dimensions
+        )
+        self.repo = get_document_repository()
 
     def retrieve_relevant_chunks(
-        self, query: str, top_k: int = 3
+        self,
+        query: str,
+        top_k: int = 3,
+        search_mode: str = "vector",
+        diversify: bool = False,
+        mmr_lambda: float = None,
+        fetch_k: int = None,
     ) -> List[Dict[str, Any]]:
+        if search_mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode: {search_mode}")
+
+        limit = top_k
+        if diversify:
+            limit = max(top_k, fetch_k or int(os.getenv("MMR_FETCH_K", "50")))
+
         query_embedding = self.embedder.generate_embedding(query)
-        results = self.repo.search_similar_chunks(
-            query_embedding=query_embedding, limit=top_k
-        )
+        with stage("search"):
+            if search_mode == "hybrid":
+                results = self.repo.search_hybrid_chunks(
+                    query_text=query,
+                    query_embedding=query_embedding,
+                    limit=limit,
+                    embedding_column=self.embedder.column,
+                    include_embeddings=diversify,
+                )
+            else:
+                results = self.repo.search_similar_chunks(
+                    query_embedding=query_embedding,
+                    limit=limit,
+                    embedding_column=self.embedder.column,
+                    include_embeddings=diversify,
+                )
+
+        if diversify:
+            with stage("mmr"):
+                results = self._diversify(query_embedding, results, top_k, mmr_lambda)
         return results
 
-    def get_context_for_query(self, query: str, top_k: int = 3) -> str:
-        chunks = self.retrieve_relevant_chunks(query, top_k)
+    @staticmethod
+    def _diversify(
+        query_embedding: List[float],
+        candidates: List[Dict[str, Any]],
+        top_k: int,
+        mmr_lambda: float = None,
+    ) -> List[Dict[str, Any]]:
+        if not candidates:
+            return []
+
+        from .mmr import maximal_marginal_relevance
 
+        if mmr_lambda is None:
+            mmr_lambda = float(os.getenv("MMR_LAMBDA", "0.5"))
+
+        selected = maximal_marginal_relevance(
+            query_embedding,
+            [chunk.pop("embedding") for chunk in candidates],
+            k=top_k,
+            lambda_mult=mmr_lambda,
+        )
+        return [candidates[i] for i in selected]
+
+    def retrieve_relevant_chunks_batch(
+        self, queries: List[str], top_k: int = 3
+    ) -> List[List[Dict[str, Any]]]:
+        if not queries:
+            return []
+
+        query_embeddings = self.embedder.generate_embeddings_batch(queries)
+        with stage("search"):
+            return self.repo.search_similar_chunks_batch(
+                query_embeddings=query_embeddings,
+                limit=top_k,
+                embedding_column=self.embedder.column,
+            )
+
+    @staticmethod
+    def format_context(chunks: List[Dict[str, Any]]) -> str:
         context_parts = []
         for i, chunk in enumerate(chunks, 1):
             context_parts.append(f"[Chunk {i}]\n{chunk['content']}")
 
         return "\n\n".join(context_parts)
+
+    def get_context_for_query(
+        self,
+        query: str,
+        top_k: int = 3,
+        search_mode: str = "vector",
+        diversify: bool = False,
+        mmr_lambda: float = None,
+    ) -> str:
+        chunks = self.retrieve_relevant_chunks(
+            query, top_k, search_mode, diversify=diversify, mmr_lambda=mmr_lambda
+        )
+        return self.format_context(chunks)
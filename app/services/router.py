@@ -1,17 +1,24 @@
 import os
-from openai import OpenAI
 from .prompt_manager import PromptManager
+from .llm_cache import cached_chat_completion
+from .metrics import stage
+from .openai_client import get_openai_client
 
 
 class QueryRouter:
     def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = get_openai_client()
         self.model = os.getenv("LLM_MODEL", "gpt-4o-mini")
 
     def route(self, query: str) -> str:
+        with stage("route"):
+            return self._route(query)
+
+    def _route(self, query: str) -> str:
         prompt = PromptManager.get_prompt("router", query=query)
 
-        response = self.client.chat.completions.create(
+        response = cached_chat_completion(
+            self.client,
             model=self.model,
             messages=[
                 {"role": "user", "content": prompt},
@@ -0,0 +1,14 @@
+import os
+from functools import lru_cache
+from pathlib import Path
+
+DEFAULT_ENCODING = "cl100k_base"
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent / ".cache" / "tiktoken"
+
+
+@lru_cache(maxsize=None)
+def get_encoding(name: str = DEFAULT_ENCODING):
+    os.environ.setdefault("TIKTOKEN_CACHE_DIR", str(DEFAULT_CACHE_DIR))
+    import tiktoken
+
+    return tiktoken.get_encoding(name)
@@ -0,0 +1,172 @@
+import os
+import time
+import uuid
+import queue
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from app.database.config import DatabaseConfig
+from .metrics import TOKENS
+
+_current_ledger = ContextVar("usage_ledger", default=None)
+
+
+class UsageLedger:
+    def __init__(
+        self, workflow: str = None, endpoint: str = None, parent: "UsageLedger" = None
+    ):
+        self.parent = parent
+        self.request_id = parent.request_id if parent else uuid.uuid4().hex
+        self.endpoint = endpoint or (parent.endpoint if parent else None)
+        self.workflow = workflow or (parent.workflow if parent else None)
+        self.entries = []
+        self._lock = threading.Lock()
+
+    def record(self, kind: str, model: str, tokens: int, workflow: str = None):
+        entry = {
+            "request_id": self.request_id,
+            "endpoint": self.endpoint,
+            "workflow": workflow or self.workflow,
+            "model": model,
+            "kind": kind,
+            "tokens": tokens,
+        }
+        with self._lock:
+            self.entries.append(entry)
+        if self.parent is not None:
+            self.parent.record(kind, model, tokens, entry["workflow"])
+
+    def totals(self) -> dict:
+        totals = {
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "embedding_tokens": 0,
+            "llm_calls": 0,
+            "embedding_calls": 0,
+        }
+        with self._lock:
+            for entry in self.entries:
+                totals[f"{entry['kind']}_tokens"] += entry["tokens"]
+                if entry["kind"] == "embedding":
+                    totals["embedding_calls"] += 1
+                elif entry["kind"] == "prompt":
+                    totals["llm_calls"] += 1
+        totals["total_tokens"] = (
+            totals["prompt_tokens"]
+            + totals["completion_tokens"]
+            + totals["embedding_tokens"]
+        )
+        return totals
+
+
+class UsageRecorder:
+    def __init__(self, batch_size: int = None, flush_seconds: float = None):
+        self.batch_size = batch_size or int(os.getenv("USAGE_BATCH_SIZE", "200"))
+        self.flush_seconds = flush_seconds or float(
+            os.getenv("USAGE_FLUSH_SECONDS", "5")
+        )
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def enabled(self) -> bool:
+        return (
+            os.getenv("USAGE_PERSIST_ENABLED", "true").lower() == "true"
+            and DatabaseConfig.VECTOR_BACKEND == "postgres"
+        )
+
+    def submit(self, entries: list[dict]):
+        if not entries or not self.enabled():
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        for entry in entries:
+            self._queue.put(entry)
+
+    def _drain(self, timeout: float) -> list[dict]:
+        batch = []
+        deadline = time.monotonic() + timeout
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                entry = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if entry is None:
+                self._write(batch)
+                return None
+            batch.append(entry)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._drain(self.flush_seconds)
+            if batch is None:
+                return
+            self._write(batch)
+
+    def _write(self, batch: list[dict]):
+        if not batch:
+            return
+        from app.database.usage_repository import UsageRepository
+
+        try:
+            UsageRepository().insert_usage_batch(batch)
+        except Exception as e:
+            print(f"Failed to persist {len(batch)} token usage rows: {str(e)}")
+
+    def close(self, timeout: float = 10.0):
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+
+
+usage_recorder = UsageRecorder()
+
+
+@contextmanager
+def usage_scope(workflow: str = None, endpoint: str = None):
+    parent = _current_ledger.get()
+    ledger = UsageLedger(workflow=workflow, endpoint=endpoint, parent=parent)
+    token = _current_ledger.set(ledger)
+    try:
+        yield ledger
+    finally:
+        _current_ledger.reset(token)
+        if parent is None:
+            usage_recorder.submit(list(ledger.entries))
+
+
+def usage_stream(generator, workflow: str = None, endpoint: str = None):
+    context = copy_context()
+
+    def scoped():
+        with usage_scope(workflow=workflow, endpoint=endpoint):
+            yield from generator
+
+    scoped_generator = scoped()
+    try:
+        while True:
+            try:
+                item = context.run(next, scoped_generator)
+            except StopIteration:
+                return
+            yield item
+    finally:
+        context.run(scoped_generator.close)
+
+
+def record_usage(kind: str, model: str, tokens: int):
+    if not tokens:
+        return
+    ledger = _current_ledger.get()
+    workflow = ledger.workflow if ledger else None
+    TOKENS.inc(tokens, kind=kind, model=model, workflow=workflow or "none")
+    if ledger is not None:
+        ledger.record(kind, model, tokens)
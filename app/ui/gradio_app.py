@@ -5,6 +5,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 import os
 import json
+from functools import lru_cache
 import gradio as gr
 from dotenv import load_dotenv
 
@@ -15,49 +16,71 @@ from app.services.router import QueryRouter
 
 load_dotenv()
 
+QA_CONCURRENCY = int(os.getenv("GRADIO_QA_CONCURRENCY", "16"))
+SUMMARIZATION_CONCURRENCY = int(os.getenv("GRADIO_SUMMARIZATION_CONCURRENCY", "4"))
+EXTRACTION_CONCURRENCY = int(os.getenv("GRADIO_EXTRACTION_CONCURRENCY", "4"))
+ROUTE_CONCURRENCY = int(os.getenv("GRADIO_ROUTE_CONCURRENCY", "8"))
+QUEUE_MAX_SIZE = int(os.getenv("GRADIO_QUEUE_MAX_SIZE", "64"))
 
-def qa_interface(query: str, top_k: int):
-    if not query.strip():
-        return "Please enter a question.", ""
 
-    try:
-        workflow = QAWorkflow()
-        result = workflow.run(query, top_k=top_k)
+@lru_cache(maxsize=1)
+def qa_workflow() -> QAWorkflow:
+    return QAWorkflow()
 
-        answer = result.get("answer", "No answer generated")
 
-        context_info = f"**Retrieved Chunks:** {result.get('chunks_used', 0)}\n\n"
-        if "context_chunks" in result:
-            context_info += "**Context:**\n\n"
-            for i, chunk in enumerate(result["context_chunks"], 1):
-                similarity = chunk.get("similarity", 0)
-                content = chunk.get("content", "")
-                context_info += f"**Chunk {i}** (Similarity: {similarity:.4f}):\n{content}\n\n---\n\n"
+@lru_cache(maxsize=1)
+def summarization_workflow() -> SummarizationWorkflow:
+    return SummarizationWorkflow()
 
-        return answer, context_info
 
-    except Exception as e:
-        return f"Error: {str(e)}", ""
+@lru_cache(maxsize=1)
+def extraction_workflow() -> ExtractionWorkflow:
+    return ExtractionWorkflow()
 
 
-def summarization_interface():
+@lru_cache(maxsize=1)
+def query_router() -> QueryRouter:
+    return QueryRouter()
+
+
+def format_context(result: dict) -> str:
+    context_info = f"**Retrieved Chunks:** {result.get('chunks_used', 0)}\n\n"
+    if result.get("context_chunks"):
+        context_info += "**Context:**\n\n"
+        for i, chunk in enumerate(result["context_chunks"], 1):
+            similarity = chunk.get("similarity", 0)
+            content = chunk.get("content", "")
+            context_info += f"**Chunk {i}** (Similarity: {similarity:.4f}):\n{content}\n\n---\n\n"
+    return context_info
+
+
+def qa_interface(query: str, top_k: int):
+    if not query.strip():
+        yield "Please enter a question.", ""
+        return
+
     try:
-        workflow = SummarizationWorkflow()
-        result = workflow.run()
+        for result in qa_workflow().stream(query, top_k=int(top_k)):
+            yield result["answer"], format_context(result)
 
-        summary = result.get("summary", "No summary generated")
-        metadata = f"**Chunks Used:** {result.get('chunks_used', 0)}\n**Model:** {result.get('model', 'N/A')}"
+    except Exception as e:
+        yield f"Error: {str(e)}", ""
 
-        return summary, metadata
+
+def summarization_interface():
+    try:
+        for result in summarization_workflow().stream():
+            summary = result.get("summary", "No summary generated")
+            metadata = f"**Chunks Used:** {result.get('chunks_used', 0)}\n**Model:** {result.get('model', 'N/A')}"
+            yield summary, metadata
 
     except Exception as e:
-        return f"Error: {str(e)}", ""
+        yield f"Error: {str(e)}", ""
 
 
 def extraction_interface():
     try:
-        workflow = ExtractionWorkflow()
-        result = workflow.run()
+        result = extraction_workflow().run()
 
         if "error" in result:
             return f"Error: {result['error']}", ""
@@ -75,39 +98,36 @@ def extraction_interface():
 
 def auto_route_interface(query: str, top_k: int):
     if not query.strip():
-        return "Please enter a query.", "", ""
+        yield "Please enter a query.", "", ""
+        return
 
     try:
-        router = QueryRouter()
-        workflow_type = router.route(query)
+        workflow_type = query_router().route(query)
 
         if workflow_type == "qa":
-            workflow = QAWorkflow()
-            result = workflow.run(query, top_k=top_k)
-            answer = result.get("answer", "No answer generated")
-            metadata = f"**Workflow:** Q&A\n**Chunks Used:** {result.get('chunks_used', 0)}"
-            return answer, metadata, workflow_type
+            for result in qa_workflow().stream(query, top_k=int(top_k)):
+                answer = result["answer"]
+                metadata = f"**Workflow:** Q&A\n**Chunks Used:** {result.get('chunks_used', 0)}"
+                yield answer, metadata, workflow_type
 
         elif workflow_type == "summarization":
-            workflow = SummarizationWorkflow()
-            result = workflow.run()
-            summary = result.get("summary", "No summary generated")
-            metadata = f"**Workflow:** Summarization\n**Chunks Used:** {result.get('chunks_used', 0)}"
-            return summary, metadata, workflow_type
+            for result in summarization_workflow().stream():
+                summary = result.get("summary", "No summary generated")
+                metadata = f"**Workflow:** Summarization\n**Chunks Used:** {result.get('chunks_used', 0)}"
+                yield summary, metadata, workflow_type
 
         elif workflow_type == "extraction":
-            workflow = ExtractionWorkflow()
-            result = workflow.run()
+            result = extraction_workflow().run()
             extracted_data = result.get("extracted_data", {})
             formatted_json = json.dumps(extracted_data, indent=2)
             metadata = f"**Workflow:** Extraction\n**Chunks Used:** {result.get('chunks_used', 0)}"
-            return formatted_json, metadata, workflow_type
+            yield formatted_json, metadata, workflow_type
 
         else:
-            return f"Unknown workflow type: {workflow_type}", "", workflow_type
+            yield f"Unknown workflow type: {workflow_type}", "", workflow_type
 
     except Exception as e:
-        return f"Error: {str(e)}", "", "error"
+        yield f"Error: {str(e)}", "", "error"
 
 
 with gr.Blocks(title="AI Market Analyst", theme=gr.themes.Soft()) as demo:
@@ -165,6 +185,7 @@ with gr.Blocks(title="AI Market Analyst", theme=gr.themes.Soft()) as demo:
                 fn=auto_route_interface,
                 inputs=[auto_query, auto_topk],
                 outputs=[auto_result, auto_metadata, auto_workflow],
+                concurrency_limit=ROUTE_CONCURRENCY,
             )
 
         with gr.Tab("💬 Q&A"):
@@ -198,6 +219,7 @@ with gr.Blocks(title="AI Market Analyst", theme=gr.themes.Soft()) as demo:
                 fn=qa_interface,
                 inputs=[qa_query, qa_topk],
                 outputs=[qa_answer, qa_context],
+                concurrency_limit=QA_CONCURRENCY,
             )
 
         with gr.Tab("📊 Summarization"):
@@ -218,7 +240,10 @@ with gr.Blocks(title="AI Market Analyst", theme=gr.themes.Soft()) as demo:
                     sum_metadata = gr.Markdown(label="Metadata")
 
             sum_btn.click(
-                fn=summarization_interface, inputs=[], outputs=[sum_result, sum_metadata]
+                fn=summarization_interface,
+                inputs=[],
+                outputs=[sum_result, sum_metadata],
+                concurrency_limit=SUMMARIZATION_CONCURRENCY,
             )
 
         with gr.Tab("📋 Data Extraction"):
@@ -240,7 +265,10 @@ with gr.Blocks(title="AI Market Analyst", theme=gr.themes.Soft()) as demo:
                     ext_metadata = gr.Markdown(label="Metadata")
 
             ext_btn.click(
-                fn=extraction_interface, inputs=[], outputs=[ext_result, ext_metadata]
+                fn=extraction_interface,
+                inputs=[],
+                outputs=[ext_result, ext_metadata],
+                concurrency_limit=EXTRACTION_CONCURRENCY,
             )
 
         with gr.Tab("ℹ️ About"):
@@ -296,5 +324,7 @@ with gr.Blocks(title="AI Market Analyst", theme=gr.themes.Soft()) as demo:
 
 
 if __name__ == "__main__":
-    demo.launch(server_name="0.0.0.0", server_port=7860, share=False)
+    demo.queue(max_size=QUEUE_MAX_SIZE).launch(
+        server_name="0.0.0.0", server_port=7860, share=False
+    )
 
@@ -1,17 +1,25 @@
 import os
 import json
-from openai import OpenAI
-from app.database.repository import DocumentRepository
+from app.database.repository import get_document_repository
 from app.services.prompt_manager import PromptManager
+from app.services.llm_cache import cached_chat_completion
+from app.services.usage import usage_scope
+from app.services.openai_client import get_openai_client
 
 
 class ExtractionWorkflow:
     def __init__(self):
-        self.repo = DocumentRepository()
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.repo = get_document_repository()
+        self.client = get_openai_client()
         self.model = os.getenv("LLM_MODEL", "gpt-4o-mini")
 
     def run(self) -> dict:
+        with usage_scope(workflow="extraction") as ledger:
+            result = self._run()
+        result["usage"] = ledger.totals()
+        return result
+
+    def _run(self) -> dict:
         chunks = self.repo.get_all_chunks()
 
         if not chunks:
@@ -25,7 +33,8 @@ class ExtractionWorkflow:
         system_prompt = PromptManager.get_prompt("extraction_system")
         user_prompt = PromptManager.get_prompt("extraction_user", context=context)
 
-        response = self.client.chat.completions.create(
+        response = cached_chat_completion(
+            self.client,
             model=self.model,
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -1,36 +1,45 @@
 import os
-from openai import OpenAI
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from app.services.retrieval import RetrievalService
 from app.services.prompt_manager import PromptManager
+from app.services.llm_cache import cached_chat_completion, stream_chat_completion
+from app.services.usage import usage_scope, usage_stream
+from app.services.openai_client import get_openai_client
+
+NO_CONTEXT_ANSWER = "I don't have enough information to answer this question."
 
 
 class QAWorkflow:
     def __init__(self):
         self.retrieval = RetrievalService()
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = get_openai_client()
         self.model = os.getenv("LLM_MODEL", "gpt-4o-mini")
+        self.batch_concurrency = int(os.getenv("QA_BATCH_CONCURRENCY", "8"))
 
-    def run(self, question: str, top_k: int = 3) -> dict:
-        context = self.retrieval.get_context_for_query(question, top_k=top_k)
+    @staticmethod
+    def _messages(question: str, context: str) -> list[dict]:
+        system_prompt = PromptManager.get_prompt("qa_system")
+        user_prompt = PromptManager.get_prompt(
+            "qa_user", context=context, question=question
+        )
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
 
+    def _answer(self, question: str, context: str) -> dict:
         if not context or context == "No relevant context found.":
             return {
                 "question": question,
-                "answer": "I don't have enough information to answer this question.",
+                "answer": NO_CONTEXT_ANSWER,
                 "context_used": False,
             }
 
-        system_prompt = PromptManager.get_prompt("qa_system")
-        user_prompt = PromptManager.get_prompt(
-            "qa_user", context=context, question=question
-        )
-
-        response = self.client.chat.completions.create(
+        response = cached_chat_completion(
+            self.client,
             model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
+            messages=self._messages(question, context),
             temperature=0.3,
             max_tokens=500,
         )
@@ -44,3 +53,107 @@ class QAWorkflow:
             "context_used": True,
             "model": self.model,
         }
+
+    def run(
+        self,
+        question: str,
+        top_k: int = 3,
+        search_mode: str = "vector",
+        diversify: bool = False,
+        mmr_lambda: float = None,
+    ) -> dict:
+        with usage_scope(workflow="qa") as ledger:
+            chunks = self.retrieval.retrieve_relevant_chunks(
+                question,
+                top_k,
+                search_mode,
+                diversify=diversify,
+                mmr_lambda=mmr_lambda,
+            )
+            result = self._answer(question, self.retrieval.format_context(chunks))
+        result["chunks_used"] = len(chunks)
+        result["context_chunks"] = chunks
+        result["usage"] = ledger.totals()
+        return result
+
+    def stream(
+        self,
+        question: str,
+        top_k: int = 3,
+        search_mode: str = "vector",
+        diversify: bool = False,
+        mmr_lambda: float = None,
+    ):
+        return usage_stream(
+            self._stream(question, top_k, search_mode, diversify, mmr_lambda),
+            workflow="qa",
+        )
+
+    def _stream(
+        self,
+        question: str,
+        top_k: int,
+        search_mode: str,
+        diversify: bool,
+        mmr_lambda: float,
+    ):
+        chunks = self.retrieval.retrieve_relevant_chunks(
+            question,
+            top_k,
+            search_mode,
+            diversify=diversify,
+            mmr_lambda=mmr_lambda,
+        )
+        result = {
+            "question": question,
+            "answer": "",
+            "context_used": bool(chunks),
+            "chunks_used": len(chunks),
+            "context_chunks": chunks,
+            "model": self.model,
+        }
+        if not chunks:
+            yield {**result, "answer": NO_CONTEXT_ANSWER}
+            return
+
+        yield result
+        for piece in stream_chat_completion(
+            self.client,
+            model=self.model,
+            messages=self._messages(question, self.retrieval.format_context(chunks)),
+            temperature=0.3,
+            max_tokens=500,
+        ):
+            result = {**result, "answer": result["answer"] + piece}
+            yield result
+
+    def _answer_with_usage(self, question: str, context: str) -> dict:
+        with usage_scope(workflow="qa") as ledger:
+            result = self._answer(question, context)
+        result["usage"] = ledger.totals()
+        return result
+
+    def run_batch(
+        self, questions: list[str], top_k: int = 3, max_concurrency: int = None
+    ) -> list[dict]:
+        chunks_per_question = self.retrieval.retrieve_relevant_chunks_batch(
+            questions, top_k=top_k
+        )
+        contexts = [
+            self.retrieval.format_context(chunks) for chunks in chunks_per_question
+        ]
+
+        max_workers = max(
+            1, min(max_concurrency or self.batch_concurrency, len(questions))
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._answer_with_usage,
+                    question,
+                    context,
+                )
+                for question, context in zip(questions, contexts)
+            ]
+            return [future.result() for future in futures]
@@ -1,35 +1,72 @@
 import os
-from openai import OpenAI
-from app.database.repository import DocumentRepository
+from app.database.repository import get_document_repository
 from app.services.prompt_manager import PromptManager
+from app.services.llm_cache import cached_chat_completion, stream_chat_completion
+from app.services.usage import usage_scope, usage_stream
+from app.services.openai_client import get_openai_client
 
 
 class SummarizationWorkflow:
     def __init__(self):
-        self.repo = DocumentRepository()
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.repo = get_document_repository()
+        self.client = get_openai_client()
         self.model = os.getenv("LLM_MODEL", "gpt-4o-mini")
 
     def run(self) -> dict:
+        with usage_scope(workflow="summarization") as ledger:
+            result = self._run()
+        result["usage"] = ledger.totals()
+        return result
+
+    @staticmethod
+    def _messages(chunks: list[dict]) -> list[dict]:
+        context = "\n\n".join([chunk["content"] for chunk in chunks])
+
+        system_prompt = PromptManager.get_prompt("summarization_system")
+        user_prompt = PromptManager.get_prompt("summarization_user", context=context)
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+
+    def stream(self):
+        return usage_stream(self._stream(), workflow="summarization")
+
+    def _stream(self):
         chunks = self.repo.get_all_chunks()
 
         if not chunks:
-            return {
+            yield {
                 "summary": "No document content available to summarize.",
                 "chunks_used": 0,
             }
+            return
 
-        context = "\n\n".join([chunk["content"] for chunk in chunks])
+        result = {"summary": "", "chunks_used": len(chunks), "model": self.model}
+        yield result
+        for piece in stream_chat_completion(
+            self.client,
+            model=self.model,
+            messages=self._messages(chunks),
+            temperature=0.5,
+            max_tokens=800,
+        ):
+            result = {**result, "summary": result["summary"] + piece}
+            yield result
 
-        system_prompt = PromptManager.get_prompt("summarization_system")
-        user_prompt = PromptManager.get_prompt("summarization_user", context=context)
+    def _run(self) -> dict:
+        chunks = self.repo.get_all_chunks()
+
+        if not chunks:
+            return {
+                "summary": "No document content available to summarize.",
+                "chunks_used": 0,
+            }
 
-        response = self.client.chat.completions.create(
+        response = cached_chat_completion(
+            self.client,
             model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
+            messages=self._messages(chunks),
             temperature=0.5,
             max_tokens=800,
         )
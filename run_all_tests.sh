@@ -4,6 +4,27 @@ echo "🧪 Running All Tests"
 echo "===================="
 echo ""
 
+if [ "$1" == "--standin" ]; then
+    echo "🧪 Using the local OpenAI stand-in (no API key or network needed)"
+    export STANDIN_PORT=${STANDIN_PORT:-8765}
+    export OPENAI_BASE_URL="http://127.0.0.1:${STANDIN_PORT}/v1"
+    export OPENAI_API_KEY=standin
+    export VECTOR_BACKEND=${VECTOR_BACKEND:-numpy}
+    export VECTOR_STORE_PATH=${VECTOR_STORE_PATH:-$(mktemp -d)}
+
+    uv run python app/evaluation/openai_standin.py &
+    STANDIN_PID=$!
+    trap "kill $STANDIN_PID" EXIT
+    until curl -sf "http://127.0.0.1:${STANDIN_PORT}/health" > /dev/null; do sleep 0.2; done
+
+    uv run python -m app.process_document
+    echo ""
+
+    echo "0️⃣  Testing OpenAI Stand-in..."
+    uv run python tests/test_openai_standin.py
+    echo ""
+fi
+
 echo "1️⃣  Testing Prompt Management..."
 uv run python tests/test_prompts.py
 echo ""
@@ -32,5 +53,33 @@ echo "7️⃣  Testing API Endpoints..."
 uv run python tests/test_api.py
 echo ""
 
+echo "🧮 Testing NumPy Vector Backend..."
+uv run python tests/test_numpy_repository.py
+echo ""
+
+echo "🎯 Testing MMR Diversification..."
+uv run python tests/test_mmr.py
+echo ""
+
+echo "🧬 Testing Near-Duplicate Detection..."
+uv run python tests/test_deduplication.py
+echo ""
+
+echo "🗄️  Testing LLM Response Cache..."
+uv run python tests/test_llm_cache.py
+echo ""
+
+echo "📊 Testing Token Usage Accounting..."
+uv run python tests/test_usage.py
+echo ""
+
+echo "🚦 Testing Admission Control..."
+uv run python tests/test_admission.py
+echo ""
+
+echo "🧵 Testing Background Jobs..."
+uv run python tests/test_jobs.py
+echo ""
+
 echo "✅ All tests complete!"
 
@@ -1,8 +1,71 @@
+import os
+import argparse
+from pathlib import Path
 from dotenv import load_dotenv
 
 load_dotenv()
 
+CACHE_DIR = Path(__file__).parent / ".cache"
+
+
+def prepare_shared_state():
+    from app.database.config import DatabaseConfig
+
+    if DatabaseConfig.VECTOR_BACKEND == "numpy":
+        from app.database.numpy_repository import NumpyDocumentRepository
+
+        mapped = NumpyDocumentRepository().preload()
+        print(f"Mapped {mapped / 1e6:.1f} MB of embeddings for all workers")
+
+
+def warm_disk_caches():
+    os.environ.setdefault("TIKTOKEN_CACHE_DIR", str(CACHE_DIR / "tiktoken"))
+    os.environ.setdefault("PROMPT_BYTECODE_CACHE_DIR", str(CACHE_DIR / "jinja"))
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    from app.services.prompt_manager import PromptManager
+    from app.services.llm_cache import get_llm_cache
+    from app.services.tokenizer import get_encoding
+
+    PromptManager.load_all()
+    if os.getenv("LLM_CACHE_PATH"):
+        get_llm_cache()
+    try:
+        get_encoding()
+    except Exception as e:
+        print(f"⚠️  Tokenizer not prefetched: {str(e)}")
+
+
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("app.api.main:app", host="0.0.0.0", port=8000, reload=True)
+    parser = argparse.ArgumentParser(description="Run the API server")
+    parser.add_argument(
+        "--prod",
+        action="store_true",
+        default=os.getenv("API_MODE", "development") == "production",
+    )
+    parser.add_argument("--host", default=os.getenv("API_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("API_PORT", "8000")))
+    parser.add_argument(
+        "--workers", type=int, default=int(os.getenv("API_WORKERS", "2"))
+    )
+    args = parser.parse_args()
+
+    if not args.prod:
+        uvicorn.run("app.api.main:app", host=args.host, port=args.port, reload=True)
+    else:
+        warm_disk_caches()
+        prepare_shared_state()
+        uvicorn.run(
+            "app.api.main:app",
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            timeout_graceful_shutdown=int(
+                os.getenv("API_GRACEFUL_SHUTDOWN_SECONDS", "30")
+            ),
+            timeout_keep_alive=int(os.getenv("API_KEEP_ALIVE_SECONDS", "5")),
+            proxy_headers=True,
+            access_log=False,
+        )
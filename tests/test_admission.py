@@ -0,0 +1,125 @@
+import sys
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.api import admission
+from app.api.admission import AdmissionController, Lane, Rejected
+
+
+def make_controller(max_concurrency: int = 2) -> AdmissionController:
+    lanes = {
+        "interactive": Lane("interactive", 0, 2, 4, 5.0),
+        "bulk": Lane("bulk", 1, 1, 2, 5.0),
+    }
+    routes = {"/qa": "interactive", "/query": "interactive", "/extract": "bulk"}
+    return AdmissionController(lanes, routes, max_concurrency)
+
+
+async def admission_scenarios():
+    print("\n📋 Test 1: Interactive requests jump ahead of queued bulk work")
+    print("-" * 80)
+    controller = make_controller()
+    interactive, bulk = controller.lanes["interactive"], controller.lanes["bulk"]
+    await controller.acquire("/extract", bulk, 5.0)
+    await controller.acquire("/qa", interactive, 5.0)
+
+    order = []
+
+    async def request(endpoint: str, lane: Lane):
+        await controller.acquire(endpoint, lane, 5.0)
+        order.append(endpoint)
+
+    queued = [
+        asyncio.create_task(request("/extract", bulk)),
+        asyncio.create_task(request("/qa", interactive)),
+    ]
+    await asyncio.sleep(0.01)
+    assert controller.queue_depth == {"/extract": 1, "/qa": 1}
+
+    controller.release(interactive, 0.1)
+    await asyncio.sleep(0.01)
+    assert order == ["/qa"]
+    controller.release(bulk, 0.1)
+    await asyncio.gather(*queued)
+    assert order == ["/qa", "/extract"]
+    print(f"  Admission order: {order}")
+
+    print("\n📋 Test 2: Full queues shed with 429")
+    print("-" * 80)
+    blocked = [asyncio.create_task(request("/extract", bulk)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    try:
+        await controller.acquire("/extract", bulk, 5.0)
+        raise AssertionError("Expected the bulk queue to be full")
+    except Rejected as e:
+        assert e.status_code == 429 and e.reason == "queue_full"
+        print(f"  {e.status_code} {e.reason}, retry after {e.retry_after:.2f}s")
+
+    print("\n📋 Test 3: Requests that cannot meet their deadline shed with 503")
+    print("-" * 80)
+    interactive.service_seconds = 10.0
+    try:
+        await controller.acquire("/qa", interactive, 1.0)
+        raise AssertionError("Expected a deadline rejection")
+    except Rejected as e:
+        assert e.status_code == 503 and e.reason == "deadline"
+        print(f"  {e.status_code} {e.reason}, retry after {e.retry_after:.2f}s")
+
+    for task in blocked:
+        task.cancel()
+    await asyncio.gather(*blocked, return_exceptions=True)
+    assert controller.queue_depth["/extract"] == 0
+
+    status = controller.status()
+    print(f"  Shed counts: {status['shed']}")
+    assert {entry["reason"] for entry in status["shed"]} == {"queue_full", "deadline"}
+
+    print("\n📋 Test 4: A blocked interactive lane does not hold back bulk work")
+    print("-" * 80)
+    controller = make_controller(max_concurrency=4)
+    interactive, bulk = controller.lanes["interactive"], controller.lanes["bulk"]
+    for _ in range(2):
+        await controller.acquire("/qa", interactive, 5.0)
+    waiting = asyncio.create_task(controller.acquire("/qa", interactive, 5.0))
+    await asyncio.sleep(0.01)
+    await asyncio.wait_for(controller.acquire("/extract", bulk, 5.0), 0.1)
+    assert bulk.active == 1 and controller.queue_depth["/qa"] == 1
+    controller.release(interactive, 0.1)
+    await waiting
+    print(f"  Bulk admitted with {controller.queue_depth['/qa']} interactive queued")
+
+    print("\n📋 Test 5: /query routed to a bulk workflow moves to the bulk lane")
+    print("-" * 80)
+    previous = admission.controller
+    admission.controller = controller = make_controller(max_concurrency=4)
+    interactive, bulk = controller.lanes["interactive"], controller.lanes["bulk"]
+    await controller.acquire("/query", interactive, 5.0)
+    request = SimpleNamespace(
+        url=SimpleNamespace(path="/query"),
+        headers={},
+        state=SimpleNamespace(admission_lane=interactive),
+    )
+    try:
+        await admission.transfer(request, "bulk")
+    finally:
+        admission.controller = previous
+    assert request.state.admission_lane is bulk
+    assert interactive.active == 0 and bulk.active == 1
+    print(f"  In flight: interactive={interactive.active}, bulk={bulk.active}")
+
+
+def test_admission_control():
+    print("🚦 Testing Admission Control\n")
+    print("=" * 80)
+
+    asyncio.run(admission_scenarios())
+
+    print("\n" + "=" * 80)
+    print("\n✅ Admission control test complete!")
+
+
+if __name__ == "__main__":
+    test_admission_control()
@@ -0,0 +1,50 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.deduplication import MinHashDeduplicator
+
+DISCLAIMER = (
+    "This report is provided for informational purposes only and does not "
+    "constitute investment advice. Market estimates are based on primary interviews, "
+    "secondary research and proprietary models, and actual results may differ "
+    "materially from the projections presented. Reproduction of this document "
+    "without the written consent of the publisher is prohibited."
+)
+
+
+def test_deduplication():
+    print("🧬 Testing Near-Duplicate Chunk Detection\n")
+    print("=" * 80)
+
+    report_path = Path(__file__).parent.parent / "data" / "market_research_report.txt"
+    report = report_path.read_text()
+    deduplicator = MinHashDeduplicator(threshold=0.8)
+
+    print("\n📋 Test 1: Distinct chunks are kept")
+    print("-" * 80)
+    assert deduplicator.add(DISCLAIMER) is None
+    assert deduplicator.add(report) is None
+    print("  Disclaimer and report registered as unique")
+
+    print("\n📋 Test 2: Repeated boilerplate is detected")
+    print("-" * 80)
+    repeated = DISCLAIMER.replace("prohibited", "strictly prohibited")
+    match = deduplicator.add(repeated)
+    print(f"  Near-duplicate of chunk: {match}")
+    assert match == 0
+
+    print("\n📋 Test 3: Lightly edited report matches the original")
+    print("-" * 80)
+    edited = report.replace("Innovate Inc.", "Innovate Incorporated", 1)
+    match = deduplicator.add(edited)
+    print(f"  Near-duplicate of chunk: {match}")
+    assert match == 1
+
+    print("\n" + "=" * 80)
+    print("\n✅ Deduplication test complete!")
+
+
+if __name__ == "__main__":
+    test_deduplication()
@@ -0,0 +1,120 @@
+import sys
+import time
+import threading
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.api.jobs import JobRunner
+from app.database.sqlite_job_repository import SQLiteJobRepository
+
+
+def wait_for_status(repo, job_id: str, timeout: float = 5.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = repo.get_job(job_id)
+        if job["status"] in ("succeeded", "failed"):
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+def test_jobs():
+    print("🧪 Testing Background Jobs\n")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = SQLiteJobRepository(str(Path(tmp) / "jobs.db"))
+
+        print("\n📋 Test 1: Idempotency keys return the existing job")
+        print("-" * 80)
+        first, created = repo.create_job("summarize", {}, "report-1")
+        again, created_again = repo.create_job("summarize", {}, "report-1")
+        assert created and not created_again
+        assert first["id"] == again["id"] and first["status"] == "queued"
+        print(f"  Job {first['id']} reused for key report-1")
+
+        print("\n📋 Test 2: Expired leases are requeued after a restart")
+        print("-" * 80)
+        claimed = repo.claim_next_job(lease_seconds=-1)
+        assert claimed["id"] == first["id"] and claimed["attempts"] == 1
+        assert repo.claim_next_job(lease_seconds=60) is None
+        assert repo.recover_expired_jobs(max_attempts=3) == 1
+        assert repo.get_job(first["id"])["status"] == "queued"
+        print("  Running job with expired lease returned to the queue")
+
+        print("\n📋 Test 3: Worker pool runs, retries and fails jobs")
+        print("-" * 80)
+        calls = {"flaky": 0}
+
+        def flaky(params):
+            calls["flaky"] += 1
+            if calls["flaky"] < 2:
+                raise RuntimeError("transient LLM error")
+            return {"summary": "done"}
+
+        def broken(params):
+            raise RuntimeError("always fails")
+
+        runner = JobRunner(
+            {"summarize": flaky, "extract": broken},
+            workers=2,
+            poll_seconds=0.05,
+            max_attempts=3,
+            repo=repo,
+        )
+        runner.start()
+        try:
+            failing, _ = repo.create_job("extract", {}, None)
+            runner.notify()
+            succeeded = wait_for_status(repo, first["id"])
+            failed = wait_for_status(repo, failing["id"])
+        finally:
+            runner.stop()
+
+        assert succeeded["status"] == "succeeded"
+        assert succeeded["result"] == {"summary": "done"}
+        assert failed["status"] == "failed" and failed["attempts"] == 3
+        print(
+            f"  summarize: {succeeded['status']} after {succeeded['attempts']} attempts"
+        )
+        print(f"  extract:   {failed['status']} ({failed['error']})")
+
+        print("\n📋 Test 4: Stopping requeues claimed jobs and ignores stale workers")
+        print("-" * 80)
+        release = threading.Event()
+
+        def slow(params):
+            release.wait(5)
+            return {"summary": "stale"}
+
+        runner = JobRunner({"summarize": slow}, workers=1, poll_seconds=0.05, repo=repo)
+        slow_job, _ = repo.create_job("summarize", {}, None)
+        runner.start()
+        deadline = time.monotonic() + 5
+        while repo.get_job(slow_job["id"])["status"] != "running":
+            assert time.monotonic() < deadline, "Job was never claimed"
+            time.sleep(0.02)
+        worker = runner._threads[0]
+        runner.stop(timeout=0.1)
+
+        requeued = repo.get_job(slow_job["id"])
+        assert requeued["status"] == "queued" and requeued["attempts"] == 1
+        reclaimed = repo.claim_next_job(lease_seconds=60)
+        assert reclaimed["id"] == slow_job["id"] and reclaimed["attempts"] == 2
+
+        release.set()
+        worker.join(5)
+        current = repo.get_job(slow_job["id"])
+        assert current["status"] == "running" and current["result"] is None
+        assert repo.renew_lease(slow_job["id"], 2, 60)
+        assert not repo.renew_lease(slow_job["id"], 1, 60)
+        print(f"  Job {slow_job['id']} requeued on stop; stale result discarded")
+
+    print("\n" + "=" * 80)
+    print("\n✅ Background jobs test complete!")
+
+
+if __name__ == "__main__":
+    test_jobs()
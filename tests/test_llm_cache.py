@@ -0,0 +1,95 @@
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from openai.types.chat import ChatCompletion
+from app.services import llm_cache
+from app.services.llm_cache import (
+    LLMResponseCache,
+    cache_bypass,
+    cached_chat_completion,
+)
+
+
+class CountingCompletions:
+    def __init__(self):
+        self.calls = 0
+
+    def create(self, **params):
+        self.calls += 1
+        return ChatCompletion.model_validate(
+            {
+                "id": f"chatcmpl-{self.calls}",
+                "object": "chat.completion",
+                "created": 0,
+                "model": params["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": "qa"},
+                    }
+                ],
+            }
+        )
+
+
+def test_llm_cache():
+    print("🗄️  Testing LLM Response Cache\n")
+    print("=" * 80)
+
+    completions = CountingCompletions()
+    client = SimpleNamespace(
+        base_url="http://stand-in/v1", chat=SimpleNamespace(completions=completions)
+    )
+    params = {
+        "model": "gpt-4o-mini",
+        "messages": [{"role": "user", "content": "route me"}],
+        "max_tokens": 10,
+    }
+    previous = llm_cache._cache
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        llm_cache._cache = LLMResponseCache(
+            persistent_path=str(Path(tmp_dir) / "llm_cache.db")
+        )
+        try:
+            print("\n📋 Test 1: Deterministic calls are served from cache")
+            print("-" * 80)
+            first = cached_chat_completion(client, temperature=0.0, **params)
+            second = cached_chat_completion(client, temperature=0.0, **params)
+            print(f"  Upstream calls: {completions.calls}")
+            assert completions.calls == 1
+            assert first.choices[0].message.content == second.choices[0].message.content
+
+            print("\n📋 Test 2: Sampled calls and bypass go upstream")
+            print("-" * 80)
+            cached_chat_completion(client, temperature=0.3, **params)
+            with cache_bypass():
+                cached_chat_completion(client, temperature=0.0, **params)
+            print(f"  Upstream calls: {completions.calls}")
+            assert completions.calls == 3
+        finally:
+            llm_cache._cache = previous
+
+    print("\n📋 Test 3: LRU eviction and persistent tier")
+    print("-" * 80)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = str(Path(tmp_dir) / "llm_cache.db")
+        cache = LLMResponseCache(max_entries=2, persistent_path=db_path)
+        for i in range(3):
+            cache.set(f"key-{i}", {"value": i})
+        assert list(cache._entries) == ["key-1", "key-2"]
+
+        reopened = LLMResponseCache(max_entries=2, persistent_path=db_path)
+        assert reopened.get("key-0") == {"value": 0}
+    print("  Evicted from memory, recovered from disk")
+
+    print("\n" + "=" * 80)
+    print("\n✅ LLM cache test complete!")
+
+
+if __name__ == "__main__":
+    test_llm_cache()
@@ -0,0 +1,51 @@
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+from app.services.mmr import maximal_marginal_relevance
+
+
+def test_mmr():
+    print("🎯 Testing MMR Diversification\n")
+    print("=" * 80)
+
+    rng = np.random.default_rng(0)
+    query = rng.normal(size=64)
+    base = query + rng.normal(scale=0.5, size=64)
+    near_duplicates = [base + rng.normal(scale=0.01, size=64) for _ in range(5)]
+    distinct = [query + rng.normal(scale=0.9, size=64) for _ in range(5)]
+    candidates = np.array(near_duplicates + distinct)
+
+    print("\n📋 Test 1: Pure relevance keeps near-duplicates")
+    print("-" * 80)
+    relevance_only = maximal_marginal_relevance(
+        query, candidates, k=3, lambda_mult=1.0
+    )
+    print(f"  Selected: {relevance_only}")
+    assert all(i < 5 for i in relevance_only)
+
+    print("\n📋 Test 2: Diversified selection keeps one near-duplicate")
+    print("-" * 80)
+    diversified = maximal_marginal_relevance(query, candidates, k=3, lambda_mult=0.5)
+    print(f"  Selected: {diversified}")
+    assert diversified[0] in relevance_only
+    assert sum(i < 5 for i in diversified) == 1
+
+    print("\n📋 Test 3: Cheap at hundreds of candidates")
+    print("-" * 80)
+    many = rng.normal(size=(500, 1536))
+    start = time.perf_counter()
+    selected = maximal_marginal_relevance(rng.normal(size=1536), many, k=10)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"  Selected {len(selected)} of {len(many)} in {elapsed_ms:.2f}ms")
+    assert len(set(selected)) == 10
+
+    print("\n" + "=" * 80)
+    print("\n✅ MMR test complete!")
+
+
+if __name__ == "__main__":
+    test_mmr()
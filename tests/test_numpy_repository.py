@@ -0,0 +1,110 @@
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+from app.database.numpy_repository import NumpyDocumentRepository
+
+
+def test_numpy_repository():
+    print("🧮 Testing In-Process NumPy Vector Backend\n")
+    print("=" * 80)
+
+    rng = np.random.default_rng(0)
+    embeddings = rng.normal(size=(20, 32)).astype(np.float32)
+
+    with tempfile.TemporaryDirectory() as store_dir:
+        repo = NumpyDocumentRepository(path=store_dir)
+        for i, embedding in enumerate(embeddings):
+            repo.insert_chunk(
+                content=f"chunk {i} ticker{i}",
+                embedding=embedding.tolist(),
+                chunk_index=i,
+                metadata={"source": "synthetic"},
+            )
+
+        print("\n📋 Test 1: Single query returns the matching chunk first")
+        print("-" * 80)
+        results = repo.search_similar_chunks(embeddings[7], limit=3)
+        for chunk in results:
+            print(f"  {chunk['content']} (Similarity: {chunk['similarity']:.4f})")
+        assert results[0]["chunk_index"] == 7
+        assert results[0]["similarity"] > results[1]["similarity"]
+
+        print("\n📋 Test 2: Batched queries match single queries")
+        print("-" * 80)
+        batch = repo.search_similar_chunks_batch(embeddings[:5], limit=4)
+        for i, results in enumerate(batch):
+            single = repo.search_similar_chunks(embeddings[i], limit=4)
+            assert [c["id"] for c in results] == [c["id"] for c in single]
+        print(f"  {len(batch)} queries answered with one matrix product")
+
+        print("\n📋 Test 3: Hybrid search boosts exact term matches")
+        print("-" * 80)
+        results = repo.search_hybrid_chunks("ticker11", embeddings[7], limit=3)
+        for chunk in results:
+            print(f"  {chunk['content']} (RRF: {chunk['rrf_score']:.4f})")
+        assert {c["chunk_index"] for c in results[:2]} == {7, 11}
+
+        print("\n📋 Test 4: Store reloads from disk")
+        print("-" * 80)
+        reopened = NumpyDocumentRepository(path=store_dir)
+        assert len(reopened.get_all_chunks()) == len(embeddings)
+        reopened.clear_all_chunks()
+        assert reopened.get_all_chunks() == []
+        print("  Reload and clear OK")
+
+        print("\n📋 Test 5: Batched inserts write the matrix once per batch")
+        print("-" * 80)
+        chunk_ids = reopened.insert_chunks_batch(
+            [
+                {"content": f"batch {i}", "embedding": embedding, "chunk_index": i}
+                for i, embedding in enumerate(embeddings[:5])
+            ]
+        )
+        assert chunk_ids == [1, 2, 3, 4, 5]
+        results = reopened.search_similar_chunks(embeddings[3], limit=1)
+        assert results[0]["content"] == "batch 3"
+        print(f"  Inserted {len(chunk_ids)} chunks in one write")
+
+        print("\n📋 Test 6: Chunks without an embedding never match")
+        print("-" * 80)
+        (pending,) = reopened.insert_chunks_batch(
+            [{"content": "pending", "embedding": None, "chunk_index": 5}]
+        )
+        results = reopened.search_similar_chunks(-embeddings[3], limit=10)
+        assert pending not in {c["id"] for c in results} and len(results) == 5
+        reopened.update_embeddings([pending], [embeddings[9]])
+        results = NumpyDocumentRepository(path=store_dir).search_similar_chunks(
+            embeddings[9], limit=1
+        )
+        assert results[0]["id"] == pending
+        print(f"  Chunk {pending} searchable only after update_embeddings")
+
+        print("\n📋 Test 7: Appends write in place into one memory-mapped matrix")
+        print("-" * 80)
+        for i, embedding in enumerate(embeddings[10:]):
+            reopened.insert_chunk(f"late {i}", embedding.tolist(), chunk_index=10 + i)
+        (matrix_path,) = Path(store_dir).glob("*/embedding.npy")
+        matrix = np.load(matrix_path, mmap_mode="r")
+        assert matrix.dtype == np.float32 and len(matrix) >= 16
+        results = reopened.search_similar_chunks(embeddings[15], limit=1)
+        assert results[0]["content"] == "late 5"
+        results = reopened.search_hybrid_chunks("late", embeddings[15], limit=10)
+        assert {c["content"] for c in results} == {f"late {i}" for i in range(10)}
+        print(f"  {len(reopened.get_all_chunks())} chunks in a {matrix.shape} matrix")
+
+        try:
+            reopened.search_similar_chunks(embeddings[0], storage="binary")
+            raise AssertionError("Expected compact storage to be rejected")
+        except ValueError as e:
+            print(f"  {e}")
+
+    print("\n" + "=" * 80)
+    print("\n✅ NumPy backend test complete!")
+
+
+if __name__ == "__main__":
+    test_numpy_repository()
@@ -0,0 +1,120 @@
+import os
+import sys
+import json
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import openai
+from openai import OpenAI
+from app.evaluation.openai_standin import start_standin_server
+from app.services.prompt_manager import PromptManager
+
+
+def test_openai_standin():
+    print("🧪 Testing OpenAI Stand-in Server\n")
+    print("=" * 80)
+
+    server = start_standin_server(port=8766)
+    client = OpenAI(api_key="standin", base_url="http://127.0.0.1:8766/v1")
+
+    try:
+        print("\n📋 Test 1: Embeddings are deterministic and word-sensitive")
+        print("-" * 80)
+        texts = [
+            "Innovate Inc holds a 12% market share",
+            "What is Innovate Inc's market share?",
+            "The projected market size by 2030",
+        ]
+        first = client.embeddings.create(model="text-embedding-3-small", input=texts)
+        second = client.embeddings.create(
+            model="text-embedding-3-small", input=texts, encoding_format="float"
+        )
+        vectors = np.array([item.embedding for item in first.data])
+        assert vectors.shape == (3, 1536)
+        assert np.allclose(vectors, [item.embedding for item in second.data])
+        assert vectors[0] @ vectors[1] > vectors[0] @ vectors[2]
+        shortened = client.embeddings.create(
+            model="text-embedding-3-small", input="x", dimensions=256
+        )
+        assert len(shortened.data[0].embedding) == 256
+        print(f"  Overlapping texts: {vectors[0] @ vectors[1]:.3f}")
+        print(f"  Unrelated texts:   {vectors[0] @ vectors[2]:.3f}")
+
+        print("\n📋 Test 2: JSON mode fills the schema in the prompt")
+        print("-" * 80)
+        response = client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {
+                    "role": "user",
+                    "content": PromptManager.get_prompt(
+                        "extraction_user", context="Innovate Inc. report"
+                    ),
+                }
+            ],
+            response_format={"type": "json_object"},
+        )
+        data = json.loads(response.choices[0].message.content)
+        assert isinstance(data["market_share_percent"], float)
+        assert isinstance(data["competitors"][0]["name"], str)
+        print(f"  Keys: {', '.join(data)}")
+
+        print("\n📋 Test 3: Streaming returns the same content as a full completion")
+        print("-" * 80)
+        messages = [
+            {
+                "role": "user",
+                "content": PromptManager.get_prompt(
+                    "qa_user",
+                    context="Innovate Inc. holds a 12% market share. It is growing.",
+                    question="What is the market share?",
+                ),
+            }
+        ]
+        full = client.chat.completions.create(model="gpt-4o-mini", messages=messages)
+        stream = client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=messages,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        pieces, usage = [], None
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                pieces.append(chunk.choices[0].delta.content)
+            usage = chunk.usage or usage
+        assert "".join(pieces) == full.choices[0].message.content
+        assert usage.completion_tokens == full.usage.completion_tokens
+        print(f"  {len(pieces)} chunks: {''.join(pieces)}")
+
+        print("\n📋 Test 4: Injected 429s surface as rate limit errors")
+        print("-" * 80)
+        os.environ["STANDIN_ERROR_RATE"] = "1"
+        try:
+            client.with_options(max_retries=0).embeddings.create(
+                model="text-embedding-3-small", input="x"
+            )
+            raise AssertionError("Expected a rate limit error")
+        except openai.RateLimitError as e:
+            print(f"  RateLimitError: {e.status_code}")
+        finally:
+            os.environ.pop("STANDIN_ERROR_RATE")
+
+        print("\n📋 Test 5: A port that is already taken fails fast")
+        print("-" * 80)
+        try:
+            start_standin_server(port=8766, timeout=5)
+            raise AssertionError("Expected the second server to fail")
+        except RuntimeError as e:
+            print(f"  {e}")
+    finally:
+        server.should_exit = True
+
+    print("\n" + "=" * 80)
+    print("\n✅ OpenAI stand-in test complete!")
+
+
+if __name__ == "__main__":
+    test_openai_standin()
@@ -35,5 +35,27 @@ def test_prompt_templates():
     print("  • Version control friendly")
 
 
+def test_prompt_registry():
+    print("🗂️  Testing Prompt Registry\n")
+    print("=" * 80)
+
+    registry = PromptManager.load_all()
+    print(f"\n📋 Compiled templates: {sorted(registry)}")
+    assert {"qa_system", "qa_user", "router"} <= set(registry)
+
+    print("\n📋 Rejects missing and unexpected variables")
+    print("-" * 80)
+    for kwargs in ({"context": "x"}, {"context": "x", "question": "y", "extra": 1}):
+        try:
+            PromptManager.get_prompt("qa_user", **kwargs)
+        except ValueError as e:
+            print(f"  {e}")
+        else:
+            raise AssertionError(f"Expected ValueError for {kwargs}")
+
+    print("\n✅ Prompt registry test complete!")
+
+
 if __name__ == "__main__":
     test_prompt_templates()
+    test_prompt_registry()
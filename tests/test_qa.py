@@ -37,11 +37,57 @@ def test_qa_workflow():
         print(f"\n📊 Metadata:")
         print(f"  Model: {result['model']}")
         print(f"  Context used: {result['context_used']}")
+        print(f"  Chunks used: {result['chunks_used']}")
+        for chunk in result["context_chunks"]:
+            print(f"    similarity {chunk['similarity']:.4f}")
 
         print("\n" + "=" * 80)
 
     print("\n✅ Q&A workflow test complete!")
 
 
+def test_qa_batch_workflow():
+    qa = QAWorkflow()
+
+    test_questions = [
+        "What is Innovate Inc's market share?",
+        "What is the projected market size by 2030?",
+        "What are the key threats to Innovate Inc?",
+    ]
+
+    print("🤖 Testing Batched Q&A Workflow\n")
+    print("=" * 80)
+
+    results = qa.run_batch(test_questions, top_k=2, max_concurrency=2)
+
+    for question, result in zip(test_questions, results):
+        print(f"\n📝 Question: {question}")
+        print(f"💡 Answer: {result['answer']}")
+        assert result["question"] == question
+
+    print("\n✅ Batched Q&A workflow test complete!")
+
+
+def test_qa_streaming():
+    qa = QAWorkflow()
+    question = "What is Innovate Inc's market share?"
+
+    print("🤖 Testing Streaming Q&A Workflow\n")
+    print("=" * 80)
+
+    updates = list(qa.stream(question, top_k=2))
+    final = updates[-1]
+
+    print(f"\n📝 Question: {question}")
+    print(f"💡 Answer: {final['answer']}")
+    print(f"📊 Updates streamed: {len(updates)}")
+    assert len(final["context_chunks"]) == final["chunks_used"]
+    assert all(update["context_chunks"] for update in updates)
+
+    print("\n✅ Streaming Q&A workflow test complete!")
+
+
 if __name__ == "__main__":
     test_qa_workflow()
+    test_qa_batch_workflow()
+    test_qa_streaming()
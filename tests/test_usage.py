@@ -0,0 +1,62 @@
+import os
+import sys
+import contextvars
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ["USAGE_PERSIST_ENABLED"] = "false"
+
+from app.services.usage import usage_scope, usage_stream, record_usage
+
+
+def test_usage_ledger():
+    print("🧾 Testing Token Usage Ledger\n")
+    print("=" * 80)
+
+    with usage_scope(endpoint="POST /query") as request_ledger:
+        record_usage("prompt", "gpt-4o-mini", 40)
+        record_usage("completion", "gpt-4o-mini", 1)
+
+        with usage_scope(workflow="qa") as workflow_ledger:
+            record_usage("embedding", "text-embedding-3-small", 12)
+            record_usage("prompt", "gpt-4o-mini", 300)
+            record_usage("completion", "gpt-4o-mini", 80)
+
+    workflow_totals = workflow_ledger.totals()
+    request_totals = request_ledger.totals()
+    print(f"\n📋 Workflow totals: {workflow_totals}")
+    print(f"📋 Request totals: {request_totals}")
+
+    assert workflow_totals["total_tokens"] == 392
+    assert workflow_totals["llm_calls"] == 1
+    assert request_totals["prompt_tokens"] == 340
+    assert request_totals["llm_calls"] == 2
+    assert {entry["request_id"] for entry in request_ledger.entries} == {
+        request_ledger.request_id
+    }
+    assert request_ledger.entries[-1]["workflow"] == "qa"
+
+    def pieces():
+        for tokens in (5, 7):
+            record_usage("completion", "gpt-4o-mini", tokens)
+            yield tokens
+
+    with usage_scope(endpoint="gradio") as stream_ledger:
+        stream = usage_stream(pieces(), workflow="summarization")
+        streamed = [
+            contextvars.copy_context().run(next, stream),
+            contextvars.copy_context().run(next, stream),
+        ]
+        assert next(stream, None) is None
+
+    stream_totals = stream_ledger.totals()
+    print(f"📋 Streamed totals: {stream_totals}")
+    assert streamed == [5, 7] and stream_totals["completion_tokens"] == 12
+    assert {entry["workflow"] for entry in stream_ledger.entries} == {"summarization"}
+
+    print("\n✅ Token usage ledger test complete!")
+
+
+if __name__ == "__main__":
+    test_usage_ledger()